@@ -15,23 +15,285 @@ import argostranslate.package
 import argostranslate.translate
 import pyttsx3
 import threading
+import time
 import tkinter as tk
 from tkinter import ttk, scrolledtext
 import queue
+from collections import deque
+import importlib.util
+import json
 import os
 from pathlib import Path
 
+class OfflineRecognizer:
+    """Vosk models kept in memory for the whole session, with explicit fallbacks
+    
+    The zh and en models are loaded once at startup and every phrase is decoded
+    on them with a fresh KaldiRecognizer. For a language without a Vosk model
+    the fallback is decided up front: PocketSphinx if it is installed, then
+    Google only when ONLINE_FALLBACK=1 (it needs internet). Load and
+    recognition times are kept for display.
+    """
+    SAMPLE_RATE = 16000
+    
+    # Looked up in VOSK_MODELS_DIR
+    VOSK_MODELS_DIR = os.getenv('VOSK_MODELS_DIR', str(Path.home() / '.vosk' / 'models'))
+    VOSK_MODELS = {
+        "en": "vosk-model-small-en-us-0.15",
+        "zh": "vosk-model-small-cn-0.22"
+    }
+    
+    def __init__(self, languages=("zh", "en")):
+        self.online_fallback = os.getenv('ONLINE_FALLBACK', '').lower() in ('1', 'true', 'yes')
+        self.sphinx_available = importlib.util.find_spec("pocketsphinx") is not None
+        self.vosk_available = importlib.util.find_spec("vosk") is not None
+        
+        self.models = {}
+        self.load_seconds = {}
+        # engine -> [phrases, total seconds, last seconds]
+        self.timings = {}
+        # (engine, seconds) of the latest phrase
+        self.last = None
+        self.lock = threading.Lock()
+        
+        for language in languages:
+            self.load(language)
+    
+    def load(self, language):
+        """Load the Vosk model for a language into memory; False if it is not installed"""
+        if not self.vosk_available:
+            print("⚠ vosk is not installed - pip install vosk")
+            return False
+        path = os.path.join(self.VOSK_MODELS_DIR, self.VOSK_MODELS[language])
+        if not os.path.isdir(path):
+            print(f"⚠ Vosk model not found: {path}")
+            return False
+        
+        from vosk import Model
+        started = time.perf_counter()
+        self.models[language] = Model(path)
+        self.load_seconds[language] = time.perf_counter() - started
+        print(f"✓ Loaded Vosk model {self.VOSK_MODELS[language]} in {self.load_seconds[language]:.1f}s")
+        return True
+    
+    def model(self, language):
+        """The resident Vosk model for a language, or None"""
+        return self.models.get(language)
+    
+    def engine(self, language):
+        """Which engine recognizes this language: vosk, sphinx, google or None"""
+        if language in self.models:
+            return "vosk"
+        if self.sphinx_available:
+            return "sphinx"
+        if self.online_fallback:
+            return "google"
+        return None
+    
+    def recognize(self, recognizer, audio, language):
+        """(text, engine) for one captured phrase (speech_recognition AudioData)"""
+        engine = self.engine(language)
+        if engine is None:
+            raise sr.RequestError(
+                f"no Vosk model for {language} in {self.VOSK_MODELS_DIR} "
+                "(install one, or PocketSphinx; ONLINE_FALLBACK=1 allows Google)"
+            )
+        
+        lang_code = "zh-CN" if language == "zh" else "en-US"
+        started = time.perf_counter()
+        if engine == "vosk":
+            from vosk import KaldiRecognizer
+            kaldi = KaldiRecognizer(self.models[language], self.SAMPLE_RATE)
+            kaldi.AcceptWaveform(audio.get_raw_data(convert_rate=self.SAMPLE_RATE, convert_width=2))
+            text = json.loads(kaldi.FinalResult()).get("text", "")
+        elif engine == "sphinx":
+            text = recognizer.recognize_sphinx(audio, language=lang_code)
+        else:
+            text = recognizer.recognize_google(audio, language=lang_code)
+        self.record(engine, time.perf_counter() - started)
+        return text, engine
+    
+    def record(self, engine, seconds):
+        with self.lock:
+            timing = self.timings.setdefault(engine, [0, 0.0, 0.0])
+            timing[0] += 1
+            timing[1] += seconds
+            timing[2] = seconds
+            self.last = (engine, seconds)
+    
+    def stats(self):
+        """Load times and per-engine recognition times in ms"""
+        with self.lock:
+            return {
+                'load_ms': {language: round(seconds * 1000) for language, seconds in self.load_seconds.items()},
+                'recognition': {
+                    engine: {
+                        'phrases': count,
+                        'mean_ms': round(total / count * 1000),
+                        'last_ms': round(last * 1000)
+                    }
+                    for engine, (count, total, last) in self.timings.items()
+                }
+            }
+
+class SpeechOutput:
+    """Text-to-speech on its own thread, so speaking never blocks recognition
+    
+    pyttsx3 is created and driven on the worker thread. Policy is latest wins:
+    a new text replaces any text still waiting, and interrupts the one being
+    spoken (at the next word boundary). With interrupt=False, texts queue up
+    to QUEUE_SIZE and the oldest waiting one is dropped when it is full.
+    Queue delay (said -> speaking) and speech duration are measured.
+    """
+    QUEUE_SIZE = 3
+    
+    def __init__(self, interrupt=True):
+        self.interrupt = interrupt
+        self.queue = queue.Queue(maxsize=1 if interrupt else self.QUEUE_SIZE)
+        self.speaking = False
+        self._interrupted = threading.Event()
+        self.lock = threading.Lock()
+        
+        self.spoken = 0
+        self.interrupted = 0
+        self.dropped = 0
+        self.queue_delay = 0.0     # seconds, total
+        self.speech_seconds = 0.0  # seconds, total
+        self.last = None           # (queue delay, speech seconds) of the latest text
+        
+        self.thread = threading.Thread(target=self._run, name="tts", daemon=True)
+        self.thread.start()
+    
+    def say(self, text):
+        """Queue text to be spoken; returns immediately"""
+        item = (text, time.perf_counter())
+        with self.lock:
+            if self.interrupt:
+                self._drop_waiting()
+                if self.speaking:
+                    self._interrupted.set()
+            try:
+                self.queue.put_nowait(item)
+            except queue.Full:
+                # Keep the newest texts
+                self._drop_waiting(1)
+                self.queue.put_nowait(item)
+    
+    def _drop_waiting(self, count=None):
+        while count is None or count > 0:
+            try:
+                self.queue.get_nowait()
+            except queue.Empty:
+                return
+            self.dropped += 1
+            if count is not None:
+                count -= 1
+    
+    def close(self):
+        """Stop speaking and end the worker thread"""
+        with self.lock:
+            self._drop_waiting()
+            self._interrupted.set()
+        self.queue.put(None)
+    
+    def _run(self):
+        try:
+            engine = pyttsx3.init()
+        except Exception as e:
+            print(f"TTS error: {str(e)}")
+            return
+        
+        def on_word(name, location, length):
+            # Runs inside runAndWait on this thread, where stop() is safe
+            if self._interrupted.is_set():
+                engine.stop()
+        engine.connect('started-word', on_word)
+        
+        while True:
+            item = self.queue.get()
+            if item is None:
+                return
+            
+            text, queued_at = item
+            with self.lock:
+                if self.interrupt and not self.queue.empty():
+                    # A newer text arrived while this one was being taken
+                    self.dropped += 1
+                    continue
+                self.speaking = True
+                self._interrupted.clear()
+            started = time.perf_counter()
+            try:
+                engine.say(text)
+                engine.runAndWait()
+            except Exception as e:
+                print(f"TTS error: {str(e)}")
+            finished = time.perf_counter()
+            
+            with self.lock:
+                self.speaking = False
+                if self._interrupted.is_set():
+                    self.interrupted += 1
+                self.spoken += 1
+                self.queue_delay += started - queued_at
+                self.speech_seconds += finished - started
+                self.last = (started - queued_at, finished - started)
+    
+    def stats(self):
+        """Counts and mean queue delay / speech duration in ms"""
+        with self.lock:
+            spoken = self.spoken or 1
+            return {
+                'spoken': self.spoken,
+                'interrupted': self.interrupted,
+                'dropped': self.dropped,
+                'mean_queue_delay_ms': round(self.queue_delay / spoken * 1000),
+                'mean_speech_ms': round(self.speech_seconds / spoken * 1000)
+            }
+
 class VoiceTranslator:
+    # Captured phrases waiting for recognition (several minutes of speech)
+    AUDIO_QUEUE_SIZE = 32
+    # Recognized phrases waiting for translation
+    TRANSLATION_QUEUE_SIZE = 32
+    
+    # Streaming mode: 100 ms microphone frames, up to a minute of them queued
+    STREAM_SAMPLE_RATE = OfflineRecognizer.SAMPLE_RATE
+    STREAM_FRAME_SAMPLES = 1600
+    FRAME_QUEUE_SIZE = 600
+    
     def __init__(self):
         self.recognizer = sr.Recognizer()
-        self.tts_engine = pyttsx3.init()
+        # Spoken translations (off until enabled in the GUI)
+        self.tts = SpeechOutput()
+        self.speak_translations = False
         self.is_running = False
+        # Set by stop(); each run gets its own, so a capture thread still inside
+        # listen() from the previous run can't see a later start() and keep going
+        self.stop_event = threading.Event()
         self.source_lang = "zh"  # Default: Chinese to English
         self.target_lang = "en"
-        self.translation_queue = queue.Queue()
+        
+        # Microphone -> audio_queue -> recognition -> translation_queue -> translation -> callback;
+        # each stage has its own thread, so capture never waits on recognition or translation
+        self.audio_queue = queue.Queue(maxsize=self.AUDIO_QUEUE_SIZE)
+        self.translation_queue = queue.Queue(maxsize=self.TRANSLATION_QUEUE_SIZE)
+        self.threads = []
+        
+        # Stream raw microphone frames into one long-lived Vosk recognizer
+        # (live partials) instead of recognizing whole phrases
+        self.streaming = True
+        self.streaming_active = False
+        
+        # Both Vosk models are loaded now, not on the first phrase
+        self.speech = OfflineRecognizer()
+        
+        # (source, target) -> Argos Translation, resolved once instead of per phrase
+        self.translations = {}
         
         # Initialize Argos Translate models
         self._setup_translation_models()
+        self._build_translations()
     
     def _setup_translation_models(self):
         """Download and setup Argos Translate models (one-time setup)"""
@@ -73,6 +335,24 @@ class VoiceTranslator:
             print(f"Warning: Could not setup translation models: {e}")
             print("Translation may not work without models installed")
         
+    def _build_translations(self):
+        """Resolve and warm the zh↔en Translation objects once"""
+        self.translations = {}
+        try:
+            languages = {lang.code: lang for lang in argostranslate.translate.get_installed_languages()}
+            for source, target in (("zh", "en"), ("en", "zh")):
+                from_lang = languages.get(source)
+                to_lang = languages.get(target)
+                if from_lang is None or to_lang is None:
+                    continue
+                translation = from_lang.get_translation(to_lang)
+                if translation is not None:
+                    # First call loads the model; do it now rather than on the first phrase
+                    translation.translate("Hello")
+                    self.translations[(source, target)] = translation
+        except Exception as e:
+            print(f"Warning: Could not load translation models: {e}")
+    
     def set_language_direction(self, direction):
         """Set translation direction"""
         if direction == "zh-en":
@@ -82,29 +362,14 @@ class VoiceTranslator:
             self.source_lang = "en"
             self.target_lang = "zh"
     
-    def translate_text(self, text):
+    def translate_text(self, text, source_lang=None, target_lang=None):
         """Translate text using Argos Translate (open source, offline)"""
+        source_lang = source_lang or self.source_lang
+        target_lang = target_lang or self.target_lang
         try:
-            # Get installed translation
-            installed_languages = argostranslate.translate.get_installed_languages()
-            
-            # Find source and target languages
-            from_lang = None
-            to_lang = None
-            
-            for lang in installed_languages:
-                if lang.code == self.source_lang:
-                    from_lang = lang
-                if lang.code == self.target_lang:
-                    to_lang = lang
-            
-            if from_lang is None or to_lang is None:
-                return f"[Translation model not available for {self.source_lang}→{self.target_lang}]"
-            
-            # Get translation
-            translation = from_lang.get_translation(to_lang)
+            translation = self.translations.get((source_lang, target_lang))
             if translation is None:
-                return f"[No translation path from {self.source_lang} to {self.target_lang}]"
+                return f"[Translation model not available for {source_lang}→{target_lang}]"
             
             translated_text = translation.translate(text)
             return translated_text
@@ -113,70 +378,264 @@ class VoiceTranslator:
             return f"Translation error: {str(e)}"
     
     def speak(self, text):
-        """Convert text to speech"""
+        """Convert text to speech on the TTS thread (does not block)"""
+        self.tts.say(text)
+    
+    def can_stream(self):
+        """Streaming needs the vosk package and a model for the current source language"""
+        return self.speech.model(self.source_lang) is not None
+    
+    def start(self, callback, partial_callback=None):
+        """Start the capture, recognition and translation threads
+        
+        Each run gets fresh queues, so phrases still being processed from a
+        previous run finish on their own threads without mixing into this one.
+        partial_callback(text) receives live partial hypotheses in streaming mode.
+        """
+        self.is_running = True
+        self.stop_event = threading.Event()
+        self.streaming_active = self.streaming and self.can_stream()
+        self.translation_queue = queue.Queue(maxsize=self.TRANSLATION_QUEUE_SIZE)
+        if self.streaming_active:
+            self.audio_queue = queue.Queue(maxsize=self.FRAME_QUEUE_SIZE)
+            capture, recognition = self._stream_capture_loop, self._stream_recognition_loop
+            recognition_args = (self.audio_queue, self.translation_queue, callback, partial_callback)
+        else:
+            self.audio_queue = queue.Queue(maxsize=self.AUDIO_QUEUE_SIZE)
+            capture, recognition = self._capture_loop, self._recognition_loop
+            recognition_args = (self.audio_queue, self.translation_queue, callback)
+        
+        self.threads = [
+            threading.Thread(target=capture, args=(self.audio_queue, callback, self.stop_event),
+                             name="capture", daemon=True),
+            threading.Thread(target=recognition, args=recognition_args,
+                             name="recognition", daemon=True),
+            threading.Thread(target=self._translation_loop, args=(self.translation_queue, callback),
+                             name="translation", daemon=True)
+        ]
+        for thread in self.threads:
+            thread.start()
+    
+    def stop(self):
+        """Stop capturing; phrases already captured are still recognized and translated"""
+        self.is_running = False
+        self.stop_event.set()
+    
+    def backlog(self):
+        """Phrases captured or recognized but not yet translated"""
+        if self.streaming_active:
+            # The audio queue holds frames, not phrases
+            return self.translation_queue.qsize()
+        return self.audio_queue.qsize() + self.translation_queue.qsize()
+    
+    def _capture_loop(self, audio_queue, callback, stop_event):
+        """Keep reading phrases from the microphone into the audio queue"""
         try:
-            self.tts_engine.say(text)
-            self.tts_engine.runAndWait()
+            with sr.Microphone() as source:
+                print("Adjusting for ambient noise... Please wait")
+                self.recognizer.adjust_for_ambient_noise(source, duration=1)
+                print("Listening...")
+                
+                while not stop_event.is_set():
+                    try:
+                        # Listen with timeout
+                        audio = self.recognizer.listen(source, timeout=5, phrase_time_limit=15)
+                    except sr.WaitTimeoutError:
+                        continue
+                    if stop_event.is_set():
+                        break  # spoken after Stop
+                    # Direction is fixed when the phrase is spoken, not when it is processed
+                    phrase = (audio, self.source_lang, self.target_lang)
+                    try:
+                        audio_queue.put_nowait(phrase)
+                    except queue.Full:
+                        # Recognition is far behind: wait for room rather than drop the phrase
+                        print(f"Recognition backlog full ({audio_queue.maxsize} phrases), waiting")
+                        audio_queue.put(phrase)
         except Exception as e:
-            print(f"TTS error: {str(e)}")
+            callback("", f"[Microphone error: {str(e)}]")
+        finally:
+            # Lets the recognition thread finish the backlog and exit
+            audio_queue.put(None)
     
-    def listen_and_translate(self, callback):
-        """Listen to microphone and translate in real-time"""
-        with sr.Microphone() as source:
-            print("Adjusting for ambient noise... Please wait")
-            self.recognizer.adjust_for_ambient_noise(source, duration=1)
-            print("Listening...")
-            
-            while self.is_running:
-                try:
-                    # Listen with timeout
-                    audio = self.recognizer.listen(source, timeout=5, phrase_time_limit=15)
-                    
-                    # Recognize speech using Vosk (offline) or Sphinx (fallback)
-                    lang_code = "zh-CN" if self.source_lang == "zh" else "en-US"
-                    
-                    # Try Vosk first (better accuracy, offline)
+    def _stream_capture_loop(self, audio_queue, callback, stop_event):
+        """Keep reading raw 16 kHz mono frames from the microphone into the audio queue"""
+        try:
+            with sr.Microphone(sample_rate=self.STREAM_SAMPLE_RATE,
+                               chunk_size=self.STREAM_FRAME_SAMPLES) as source:
+                print("Listening (streaming)...")
+                while not stop_event.is_set():
+                    frame = source.stream.read(source.CHUNK)
+                    # Direction is fixed when the audio is captured, not when it is processed
+                    item = (frame, self.source_lang, self.target_lang)
                     try:
-                        recognized_text = self.recognizer.recognize_vosk(audio, language=lang_code)
-                        import json
-                        result = json.loads(recognized_text)
-                        recognized_text = result.get("text", "")
-                    except:
-                        # Fallback to Sphinx (fully offline but lower accuracy)
-                        try:
-                            recognized_text = self.recognizer.recognize_sphinx(audio, language=lang_code)
-                        except:
-                            # Last resort: use Google (requires internet)
-                            recognized_text = self.recognizer.recognize_google(audio, language=lang_code)
-                    
-                    # Translate
-                    translated_text = self.translate_text(recognized_text)
-                    
-                    # Send results to GUI
-                    callback(recognized_text, translated_text)
-                    
-                    # Speak translation (optional - can be toggled)
-                    # self.speak(translated_text)
-                    
-                except sr.WaitTimeoutError:
+                        audio_queue.put_nowait(item)
+                    except queue.Full:
+                        print(f"Recognition backlog full ({audio_queue.maxsize} frames), waiting")
+                        audio_queue.put(item)
+        except Exception as e:
+            callback("", f"[Microphone error: {str(e)}]")
+        finally:
+            audio_queue.put(None)
+    
+    def _stream_recognition_loop(self, audio_queue, translation_queue, callback, partial_callback):
+        """Feed frames to one KaldiRecognizer; queue each final segment for translation at once"""
+        from vosk import KaldiRecognizer
+        
+        recognizer = None
+        direction = None
+        last_partial = ""
+        # Decode time of the segment in progress
+        decode_seconds = 0.0
+        
+        def finish_segment(result_json):
+            nonlocal last_partial, decode_seconds
+            text = json.loads(result_json).get("text", "")
+            if text:
+                self.speech.record("vosk (live)", decode_seconds)
+            decode_seconds = 0.0
+            if last_partial and partial_callback:
+                partial_callback("")
+            last_partial = ""
+            if text:
+                translation_queue.put((text,) + direction)
+        
+        while True:
+            item = audio_queue.get()
+            if item is None:
+                break
+            
+            frame, source_lang, target_lang = item
+            if (source_lang, target_lang) != direction:
+                # Direction changed: close the utterance in progress, then switch models
+                if recognizer is not None:
+                    finish_segment(recognizer.FinalResult())
+                direction = (source_lang, target_lang)
+                model = self.speech.model(source_lang)
+                if model is None:
+                    callback("", f"[Vosk model for {source_lang} not installed]")
+                    recognizer = None
                     continue
-                except sr.UnknownValueError:
-                    callback("", "[Could not understand audio]")
-                except sr.RequestError as e:
-                    callback("", f"[Recognition service error: {e}]")
-                except Exception as e:
-                    callback("", f"[Error: {str(e)}]")
+                recognizer = KaldiRecognizer(model, self.STREAM_SAMPLE_RATE)
+            if recognizer is None:
+                continue
+            
+            try:
+                started = time.perf_counter()
+                final = recognizer.AcceptWaveform(frame)
+                decode_seconds += time.perf_counter() - started
+                if final:
+                    finish_segment(recognizer.Result())
+                elif partial_callback:
+                    partial = json.loads(recognizer.PartialResult()).get("partial", "")
+                    if partial != last_partial:
+                        last_partial = partial
+                        partial_callback(partial)
+            except Exception as e:
+                callback("", f"[Error: {str(e)}]")
+        
+        # Stopped: whatever was said last is still translated
+        if recognizer is not None:
+            finish_segment(recognizer.FinalResult())
+        translation_queue.put(None)
+    
+    def _recognition_loop(self, audio_queue, translation_queue, callback):
+        """Recognize captured phrases in order and queue the text for translation"""
+        while True:
+            phrase = audio_queue.get()
+            if phrase is None:
+                translation_queue.put(None)
+                return
+            
+            audio, source_lang, target_lang = phrase
+            try:
+                recognized_text, engine = self.speech.recognize(self.recognizer, audio, source_lang)
+            except sr.UnknownValueError:
+                callback("", "[Could not understand audio]")
+                continue
+            except sr.RequestError as e:
+                callback("", f"[Recognition service error: {e}]")
+                continue
+            except Exception as e:
+                callback("", f"[Error: {str(e)}]")
+                continue
+            
+            if recognized_text:
+                translation_queue.put((recognized_text, source_lang, target_lang))
+    
+    def _translation_loop(self, translation_queue, callback):
+        """Translate recognized phrases in order and hand them to the GUI"""
+        while True:
+            item = translation_queue.get()
+            if item is None:
+                return
+            
+            recognized_text, source_lang, target_lang = item
+            # Translate
+            translated_text = self.translate_text(recognized_text, source_lang, target_lang)
+            
+            # Send results to GUI
+            try:
+                callback(recognized_text, translated_text)
+            except Exception as e:
+                print(f"Display error: {str(e)}")
+            
+            # Speak translation (optional - can be toggled)
+            if self.speak_translations:
+                self.speak(translated_text)
+
+class TranscriptLog:
+    """Appends every result to a text file as it arrives (the widgets keep only the tail)"""
+    
+    def __init__(self, path):
+        self.path = path
+        # Line buffered: each result is on disk as soon as it is written
+        self.file = open(path, "a", encoding="utf-8", buffering=1)
+        self.lock = threading.Lock()
+        self.write_line(f"--- {time.strftime('%Y-%m-%d %H:%M:%S')} ---")
+    
+    def write(self, original, translated):
+        stamp = time.strftime("%H:%M:%S")
+        if original:
+            self.write_line(f"[{stamp}] {original}")
+        if translated:
+            self.write_line(f"[{stamp}] → {translated}")
+    
+    def write_line(self, line):
+        with self.lock:
+            if not self.file.closed:
+                self.file.write(line + "\n")
+    
+    def close(self):
+        with self.lock:
+            self.file.close()
 
 class TranslatorGUI:
+    # Lines kept in each transcript widget; older lines are dropped from the top
+    TRANSCRIPT_MAX_LINES = int(os.getenv('TRANSCRIPT_MAX_LINES', 1000))
+    # Results are applied to the widgets at most once per interval
+    REFRESH_MS = int(os.getenv('TRANSCRIPT_REFRESH_MS', 100))
+    
     def __init__(self, root):
         self.root = root
         self.root.title("Real-Time Voice Translator - achildrenmile")
         self.root.geometry("800x600")
         
         self.translator = VoiceTranslator()
-        self.listener_thread = None
+        self.backlog_job = None
+        
+        # Results and the latest partial from the worker threads, applied by _refresh
+        self.pending = deque()
+        self.partial = ""
+        self.shown_partial = ""
+        
+        # TRANSCRIPT_LOG=path streams the full transcript to disk
+        log_path = os.getenv('TRANSCRIPT_LOG')
+        self.transcript_log = TranscriptLog(log_path) if log_path else None
         
         self.setup_ui()
+        self.root.after(self.REFRESH_MS, self._refresh)
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
         
     def setup_ui(self):
         # Control Frame
@@ -198,8 +657,21 @@ class TranslatorGUI:
                                      command=self.toggle_listening)
         self.toggle_btn.pack(side=tk.LEFT, padx=20)
         
+        # Streaming: live partial results (needs Vosk models), otherwise whole phrases
+        self.streaming_var = tk.BooleanVar(value=self.translator.streaming)
+        ttk.Checkbutton(control_frame, text="Live", variable=self.streaming_var,
+                        command=self.change_streaming).pack(side=tk.LEFT, padx=5)
+        
+        # Read translations aloud (on the TTS thread; a new one interrupts the last)
+        self.speak_var = tk.BooleanVar(value=self.translator.speak_translations)
+        ttk.Checkbutton(control_frame, text="Speak", variable=self.speak_var,
+                        command=self.change_speak).pack(side=tk.LEFT, padx=5)
+        
         # Status label
-        self.status_label = ttk.Label(control_frame, text="Status: Ready", foreground="blue")
+        loaded = ", ".join(f"{language} {ms / 1000:.1f}s"
+                           for language, ms in self.translator.speech.stats()['load_ms'].items())
+        self.status_label = ttk.Label(control_frame, text=f"Status: Ready (Vosk {loaded})" if loaded else
+                                      "Status: Ready (no Vosk models)", foreground="blue")
         self.status_label.pack(side=tk.LEFT, padx=5)
         
         # Text display frame
@@ -210,7 +682,12 @@ class TranslatorGUI:
         ttk.Label(text_frame, text="Original Speech:", font=("Arial", 10, "bold")).pack(anchor=tk.W)
         self.original_text = scrolledtext.ScrolledText(text_frame, height=10, wrap=tk.WORD, 
                                                        font=("Arial", 11))
-        self.original_text.pack(fill=tk.BOTH, expand=True, pady=(0, 10))
+        self.original_text.pack(fill=tk.BOTH, expand=True)
+        
+        # What is being said right now (streaming partial hypothesis)
+        self.partial_var = tk.StringVar()
+        ttk.Label(text_frame, textvariable=self.partial_var, font=("Arial", 11, "italic"),
+                  foreground="gray", wraplength=760).pack(anchor=tk.W, pady=(2, 10))
         
         # Translated speech
         ttk.Label(text_frame, text="Translation:", font=("Arial", 10, "bold")).pack(anchor=tk.W)
@@ -241,6 +718,13 @@ class TranslatorGUI:
         else:
             self.update_status("Direction: English → Chinese", "blue")
     
+    def change_streaming(self):
+        # Takes effect the next time listening starts
+        self.translator.streaming = self.streaming_var.get()
+    
+    def change_speak(self):
+        self.translator.speak_translations = self.speak_var.get()
+    
     def toggle_listening(self):
         if not self.translator.is_running:
             self.start_listening()
@@ -248,32 +732,87 @@ class TranslatorGUI:
             self.stop_listening()
     
     def start_listening(self):
-        self.translator.is_running = True
         self.toggle_btn.config(text="Stop Listening")
         self.update_status("Status: Listening...", "green")
         
-        # Start listener thread
-        self.listener_thread = threading.Thread(target=self.translator.listen_and_translate, 
-                                               args=(self.update_display,), daemon=True)
-        self.listener_thread.start()
+        # Capture, recognition and translation run on their own threads
+        self.translator.start(self.update_display, self.update_partial)
+        if self.translator.streaming and not self.translator.streaming_active:
+            self.update_status("Status: Listening (Vosk model not found - phrase mode)", "orange")
+        self.backlog_job = self.root.after(500, self._show_backlog)
     
     def stop_listening(self):
-        self.translator.is_running = False
+        self.translator.stop()
+        if self.backlog_job is not None:
+            self.root.after_cancel(self.backlog_job)
+            self.backlog_job = None
         self.toggle_btn.config(text="Start Listening")
         self.update_status("Status: Stopped", "red")
     
+    def _show_backlog(self):
+        """Show how many phrases are waiting while listening"""
+        if not self.translator.is_running:
+            return
+        mode = "live" if self.translator.streaming_active else "phrases"
+        status = f"Status: Listening ({mode})..."
+        backlog = self.translator.backlog()
+        if backlog:
+            status += f" ({backlog} phrase(s) processing)"
+        last = self.translator.speech.last
+        if last:
+            status += f" | {last[0]} {last[1] * 1000:.0f} ms"
+        spoken = self.translator.tts.last
+        if self.translator.speak_translations and spoken:
+            status += f" | TTS wait {spoken[0] * 1000:.0f} ms, spoke {spoken[1]:.1f}s"
+        self.update_status(status, "green")
+        self.backlog_job = self.root.after(500, self._show_backlog)
+    
     def update_display(self, original, translated):
-        """Update text displays with new translation"""
-        self.root.after(0, self._update_text_widgets, original, translated)
+        """Queue a result for the next refresh (called from the translation thread)"""
+        if self.transcript_log:
+            self.transcript_log.write(original, translated)
+        self.pending.append((original, translated))
     
-    def _update_text_widgets(self, original, translated):
-        if original:
-            self.original_text.insert(tk.END, f"\n{original}\n")
-            self.original_text.see(tk.END)
+    def update_partial(self, text):
+        """Show the live partial hypothesis (called from the recognition thread)"""
+        # Only the latest partial matters; _refresh picks it up
+        self.partial = text
+    
+    def _refresh(self):
+        """Apply everything that arrived since the last refresh in one go"""
+        originals, translations = [], []
+        while self.pending:
+            original, translated = self.pending.popleft()
+            if original:
+                originals.append(f"\n{original}\n")
+            if translated:
+                translations.append(f"\n{translated}\n")
+        self._append(self.original_text, originals)
+        self._append(self.translated_text, translations)
         
-        if translated:
-            self.translated_text.insert(tk.END, f"\n{translated}\n")
-            self.translated_text.see(tk.END)
+        partial = self.partial
+        if partial != self.shown_partial:
+            self.shown_partial = partial
+            self.partial_var.set(f"… {partial}" if partial else "")
+        
+        self.root.after(self.REFRESH_MS, self._refresh)
+    
+    def _append(self, widget, chunks):
+        """Append text and drop the oldest lines beyond TRANSCRIPT_MAX_LINES"""
+        if not chunks:
+            return
+        widget.insert(tk.END, "".join(chunks))
+        lines = int(widget.index("end-1c").split(".")[0])
+        if lines > self.TRANSCRIPT_MAX_LINES:
+            widget.delete("1.0", f"{lines - self.TRANSCRIPT_MAX_LINES + 1}.0")
+        widget.see(tk.END)
+    
+    def on_close(self):
+        self.translator.stop()
+        self.translator.tts.close()
+        if self.transcript_log:
+            self.transcript_log.close()
+        self.root.destroy()
     
     def update_status(self, message, color):
         self.status_label.config(text=message, foreground=color)
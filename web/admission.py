@@ -0,0 +1,146 @@
+"""
+Admission control - per-session and global limits on concurrent requests
+
+Every translate_text / translate_audio request must be admitted before it
+does any work:
+
+- a session (browser tab) may have at most ADMISSION_MAX_PER_SESSION requests
+  running or waiting; more are rejected at once, so one client spamming
+  requests cannot fill the queue for everyone else
+- at most ADMISSION_MAX_ACTIVE requests run at the same time
+- up to ADMISSION_QUEUE_SIZE more wait (first come, first served) for up to
+  ADMISSION_QUEUE_TIMEOUT seconds; beyond that they are rejected
+
+Rejections raise Overloaded, a PoolBusy, so handlers answer with the same
+`busy` result and retry-after hint as a full inference pool.
+"""
+
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+from worker_pool import PoolBusy
+
+
+class Overloaded(PoolBusy):
+    """Raised when a request is not admitted; `reason` is session, queue or timeout"""
+
+    def __init__(self, reason, retry_after):
+        super().__init__(f"Request not admitted ({reason} limit)", retry_after=retry_after)
+        self.reason = reason
+
+
+class AdmissionController:
+    """Concurrency limits with a bounded FIFO wait queue"""
+
+    def __init__(self, max_active=None, max_per_session=None, max_queue=None, queue_timeout=None):
+        if max_active is None:
+            max_active = int(os.getenv('ADMISSION_MAX_ACTIVE', 0)) or (os.cpu_count() or 1) * 2
+        if max_per_session is None:
+            max_per_session = int(os.getenv('ADMISSION_MAX_PER_SESSION', 2))
+        if max_queue is None:
+            max_queue = int(os.getenv('ADMISSION_QUEUE_SIZE', 0)) or max_active * 2
+        if queue_timeout is None:
+            queue_timeout = float(os.getenv('ADMISSION_QUEUE_TIMEOUT', 10))
+        self.max_active = max(1, max_active)
+        self.max_per_session = max_per_session  # 0 = no per-session limit
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+
+        self._cond = threading.Condition()
+        self._waiting = deque()
+        self._sessions = {}
+
+        self.active = 0
+        self.admitted = 0
+        self.rejected = {'session': 0, 'queue': 0, 'timeout': 0}
+        # Moving average of how long an admitted request runs (for retry-after)
+        self.mean_service_seconds = 1.0
+
+    @property
+    def queued(self):
+        return len(self._waiting)
+
+    def retry_after(self):
+        """Seconds until a slot is likely free: the queue ahead, drained max_active at a time"""
+        backlog = (len(self._waiting) + 1) / self.max_active
+        return round(max(0.5, backlog * self.mean_service_seconds), 1)
+
+    def _reject(self, reason):
+        self.rejected[reason] += 1
+        return Overloaded(reason, self.retry_after())
+
+    def _leave_session(self, session_id):
+        count = self._sessions[session_id] - 1
+        if count:
+            self._sessions[session_id] = count
+        else:
+            del self._sessions[session_id]
+
+    def acquire(self, session_id):
+        """Wait for a slot; raises Overloaded if the request is not admitted"""
+        with self._cond:
+            in_flight = self._sessions.get(session_id, 0)
+            if self.max_per_session and in_flight >= self.max_per_session:
+                raise self._reject('session')
+
+            if self.active >= self.max_active or self._waiting:
+                if len(self._waiting) >= self.max_queue:
+                    raise self._reject('queue')
+
+                ticket = object()
+                self._waiting.append(ticket)
+                self._sessions[session_id] = in_flight + 1
+                deadline = time.monotonic() + self.queue_timeout
+                try:
+                    while self._waiting[0] is not ticket or self.active >= self.max_active:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            raise self._reject('timeout')
+                        self._cond.wait(remaining)
+                except BaseException:
+                    self._leave_session(session_id)
+                    raise
+                finally:
+                    self._waiting.remove(ticket)
+                    # The next waiter may be able to go now
+                    self._cond.notify_all()
+            else:
+                self._sessions[session_id] = in_flight + 1
+
+            self.active += 1
+            self.admitted += 1
+
+    def release(self, session_id, service_seconds=None):
+        with self._cond:
+            self.active -= 1
+            self._leave_session(session_id)
+            if service_seconds is not None:
+                self.mean_service_seconds += 0.1 * (service_seconds - self.mean_service_seconds)
+            self._cond.notify_all()
+
+    @contextmanager
+    def admit(self, session_id):
+        """Run the block as an admitted request of `session_id`"""
+        self.acquire(session_id)
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.release(session_id, time.perf_counter() - started)
+
+    def stats(self):
+        with self._cond:
+            return {
+                'active': self.active,
+                'queued': len(self._waiting),
+                'sessions': len(self._sessions),
+                'max_active': self.max_active,
+                'max_queue': self.max_queue,
+                'max_per_session': self.max_per_session,
+                'admitted': self.admitted,
+                'rejected': dict(self.rejected),
+                'retry_after': self.retry_after()
+            }
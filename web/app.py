@@ -13,14 +13,24 @@ Features:
 
 from flask import Flask, render_template, request, jsonify
 from flask_socketio import SocketIO, emit
-import argostranslate.package
-import argostranslate.translate
 import base64
-import json
 import io
 import wave
 import os
-from vosk import Model, KaldiRecognizer
+
+# STUB_MODELS=1: simulated Argos/Vosk backends for load testing without the
+# models (benchmarks/stubs.py)
+if os.getenv('STUB_MODELS', '').lower() in ('1', 'true', 'yes'):
+    from benchmarks import stubs
+    stubs.install()
+
+import argostranslate.package
+import argostranslate.translate
+from vosk import Model
+
+from audio_ingest import feed_recognizer, load_pcm
+from recognizer_pool import RecognizerPool
+from translator_registry import TranslatorRegistry
 
 app = Flask(__name__)
 app.config['SECRET_KEY'] = 'achildrenmile-translator-secret'
@@ -30,6 +40,8 @@ socketio = SocketIO(app, cors_allowed_origins="*")
 vosk_model_en = None
 vosk_model_zh = None
 translation_ready = False
+translator_registry = TranslatorRegistry(pairs=[('zh', 'en'), ('en', 'zh')])
+recognizer_pool = RecognizerPool(configure=lambda rec: rec.SetWords(True))
 
 def initialize_models():
     """Initialize all offline models on startup"""
@@ -58,6 +70,7 @@ def initialize_models():
         # Check if translation packages are installed
         installed = argostranslate.package.get_installed_packages()
         if installed:
+            translator_registry.build()
             translation_ready = True
             print(f"✓ Translation models loaded: {len(installed)} language pairs")
         else:
@@ -72,23 +85,9 @@ class OfflineTranslator:
     def translate(text, source_lang, target_lang):
         """Translate text offline"""
         try:
-            installed_languages = argostranslate.translate.get_installed_languages()
-            
-            from_lang = None
-            to_lang = None
-            
-            for lang in installed_languages:
-                if lang.code == source_lang:
-                    from_lang = lang
-                if lang.code == target_lang:
-                    to_lang = lang
-            
-            if from_lang is None or to_lang is None:
-                return f"[Language pair {source_lang}->{target_lang} not available]"
-            
-            translation = from_lang.get_translation(to_lang)
+            translation = translator_registry.get(source_lang, target_lang)
             if translation is None:
-                return f"[No translation path available]"
+                return f"[Language pair {source_lang}->{target_lang} not available]"
             
             return translation.translate(text)
         except Exception as e:
@@ -110,17 +109,13 @@ class OfflineSpeechRecognizer:
             if model is None:
                 return "[Speech model not loaded]"
             
-            # Create recognizer with 16kHz sample rate
-            recognizer = KaldiRecognizer(model, 16000)
-            recognizer.SetWords(True)
+            # Parse the WAV header and convert to 16 kHz mono PCM
+            pcm_data, _ = load_pcm(audio_data)
             
-            # Process audio
-            if recognizer.AcceptWaveform(audio_data):
-                result = json.loads(recognizer.Result())
-                return result.get('text', '')
-            else:
-                partial = json.loads(recognizer.PartialResult())
-                return partial.get('partial', '')
+            # Borrow a pooled recognizer (16kHz, word timings enabled)
+            with recognizer_pool.recognizer(language, model) as recognizer:
+                # Process audio in fixed-size chunks
+                return ' '.join(feed_recognizer(recognizer, pcm_data))
                 
         except Exception as e:
             return f"[Recognition error: {str(e)}]"
@@ -137,7 +132,8 @@ def health():
         'status': 'healthy',
         'vosk_en': vosk_model_en is not None,
         'vosk_zh': vosk_model_zh is not None,
-        'translation': translation_ready
+        'translation': translation_ready,
+        'recognizer_pool': recognizer_pool.stats()
     }
     return jsonify(status)
 
@@ -9,194 +9,255 @@ Features:
 - Voice and text translation
 """
 
-from flask import Flask, render_template, request, jsonify
-from flask_socketio import SocketIO, emit
-import json
 import os
+
+# Run as a script, Flask-SocketIO serves with eventlet (or gevent) when it is
+# installed. Patch the standard library before anything else is imported, as
+# gunicorn.conf.py does for gevent: the batcher, admission queue, pipelines
+# and inference pool wait on threading primitives, and unpatched those waits
+# block the whole hub - heartbeats included - instead of one greenlet.
+requested_mode = os.getenv('SOCKETIO_ASYNC_MODE', '')
+if __name__ == '__main__' and requested_mode in ('', 'eventlet', 'gevent'):
+    for _mode in [requested_mode] if requested_mode else ['eventlet', 'gevent']:
+        try:
+            if _mode == 'eventlet':
+                import eventlet
+                eventlet.monkey_patch()
+            else:
+                from gevent import monkey
+                monkey.patch_all()
+        except ImportError:
+            continue
+        os.environ['SOCKETIO_ASYNC_MODE'] = _mode
+        break
+
+from flask import Flask, g, has_request_context, render_template, request, jsonify
+from flask_socketio import SocketIO, emit
+import functools
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+
+# STUB_MODELS=1: simulated Argos/Vosk backends for load testing without the
+# models (benchmarks/stubs.py); must run before the engine imports them
+if os.getenv('STUB_MODELS', '').lower() in ('1', 'true', 'yes'):
+    from benchmarks import stubs
+    stubs.install()
+
+import metrics
+import offload
+import tracing
+from admission import AdmissionController, Overloaded
+from audio_ingest import AudioFormatError, load_pcm
+from model_manifest import install_missing
+from offline_engine import MANIFEST, OfflineSpeechRecognizer, OfflineTranslator, model_manager, preload_models
+from pipeline import UtterancePipeline
+from segmentation import join_segments, split_sentences
+from streaming import StreamingSession
+from vad import VoiceActivityDetector
+from worker_pool import InferencePool, PoolBusy
+
+tracing.configure()
+logger = tracing.logger
 
 app = Flask(__name__)
 app.config['SECRET_KEY'] = 'achildrenmile-translator-offline'
-socketio = SocketIO(app, cors_allowed_origins="*")
 
-# Offline translator using Argos Translate
-class OfflineTranslator:
-    """Offline translator using Argos Translate"""
-    
-    def __init__(self):
-        self.translators = {}
-        self.setup_complete = False
-        self._initialize_translators()
-    
-    def _initialize_translators(self):
-        """Initialize Argos Translate with language packages"""
-        try:
-            import argostranslate.package
-            import argostranslate.translate
-            
-            # Update package index
-            print("Initializing offline translation models...")
-            argostranslate.package.update_package_index()
-            available_packages = argostranslate.package.get_available_packages()
-            
-            # Install required language pairs if not already installed
-            required_pairs = [
-                ('zh', 'en'),  # Chinese to English
-                ('en', 'zh')   # English to Chinese
-            ]
-            
-            installed_languages = argostranslate.package.get_installed_packages()
-            
-            for from_code, to_code in required_pairs:
-                # Check if package is already installed
-                found = False
-                for installed_pkg in installed_languages:
-                    if installed_pkg.from_code == from_code and installed_pkg.to_code == to_code:
-                        found = True
-                        print(f"✓ Translation model {from_code}→{to_code} already installed")
-                        break
-                
-                if not found:
-                    # Find and install the package
-                    package_to_install = next(
-                        filter(
-                            lambda x: x.from_code == from_code and x.to_code == to_code,
-                            available_packages
-                        ),
-                        None
-                    )
-                    
-                    if package_to_install:
-                        print(f"Installing translation model {from_code}→{to_code}...")
-                        argostranslate.package.install_from_path(package_to_install.download())
-                        print(f"✓ Installed {from_code}→{to_code}")
-                    else:
-                        print(f"✗ Warning: Could not find {from_code}→{to_code} package")
-            
-            self.setup_complete = True
-            print("✓ Offline translation ready!")
-            
-        except ImportError:
-            print("✗ Error: argostranslate not installed")
-            print("   Run: pip install argostranslate")
-            self.setup_complete = False
-        except Exception as e:
-            print(f"✗ Error initializing translator: {e}")
-            import traceback
-            traceback.print_exc()
-            self.setup_complete = False
-    
-    def translate(self, text, source_lang, target_lang):
-        """Translate text offline"""
-        if not text or not text.strip():
-            return ""
-        
-        if not self.setup_complete:
-            return "[Offline translation not available - models not installed]"
-        
-        try:
-            import argostranslate.translate
-            
-            # Translate
-            translated = argostranslate.translate.translate(text, source_lang, target_lang)
-            return translated
-            
-        except Exception as e:
-            return f"[Translation error: {str(e)}]"
+# Under gunicorn (gunicorn.conf.py) every worker is its own Socket.IO server,
+# so clients must skip long-polling and connect straight over websocket
+WEBSOCKET_ONLY = os.getenv('SOCKETIO_WEBSOCKET_ONLY', '').lower() in ('1', 'true', 'yes')
+socketio_options = {'transports': ['websocket']} if WEBSOCKET_ONLY else {}
+socketio = SocketIO(
+    app,
+    cors_allowed_origins="*",
+    async_mode=os.getenv('SOCKETIO_ASYNC_MODE') or None,
+    **socketio_options
+)
 
-# Offline speech recognizer using Vosk
-class OfflineSpeechRecognizer:
-    """Offline speech recognition using Vosk"""
-    
-    def __init__(self):
-        self.models = {}
-        self.setup_complete = False
-        self._initialize_models()
-    
-    def _initialize_models(self):
-        """Initialize Vosk models for Chinese and English"""
-        try:
-            from vosk import Model
-            
-            # Model paths
-            models_dir = os.path.expanduser("~/.vosk/models")
-            
-            model_configs = {
-                'en': {
-                    'path': os.path.join(models_dir, "vosk-model-small-en-us-0.15"),
-                    'url': 'https://alphacephei.com/vosk/models/vosk-model-small-en-us-0.15.zip'
-                },
-                'zh': {
-                    'path': os.path.join(models_dir, "vosk-model-small-cn-0.22"),
-                    'url': 'https://alphacephei.com/vosk/models/vosk-model-small-cn-0.22.zip'
-                }
-            }
-            
-            # Load models
-            print("Initializing offline speech recognition models...")
-            for lang, config in model_configs.items():
-                if os.path.exists(config['path']):
-                    try:
-                        self.models[lang] = Model(config['path'])
-                        print(f"✓ Loaded {lang} speech model from {config['path']}")
-                    except Exception as e:
-                        print(f"✗ Error loading {lang} model: {e}")
-                else:
-                    print(f"✗ Warning: {lang} model not found at {config['path']}")
-                    print(f"   Download from: {config['url']}")
-                    print(f"   Extract to: {config['path']}")
-            
-            if self.models:
-                self.setup_complete = True
-                print("✓ Offline speech recognition ready!")
-            else:
-                print("✗ No speech models loaded. Voice recognition will not work.")
-                
-        except ImportError:
-            print("✗ Error: vosk not installed")
-            print("   Run: pip install vosk")
-            self.setup_complete = False
-        except Exception as e:
-            print(f"✗ Error initializing speech recognizer: {e}")
-            import traceback
-            traceback.print_exc()
-            self.setup_complete = False
-    
-    def recognize(self, audio_data, language='en'):
-        """Recognize speech from audio data"""
-        if not self.setup_complete or language not in self.models:
-            raise Exception(f"Speech model for {language} not available")
-        
-        try:
-            from vosk import KaldiRecognizer
-            import wave
-            import io
-            
-            # Create recognizer for this language
-            rec = KaldiRecognizer(self.models[language], 16000)
-            
-            # Process audio
-            rec.AcceptWaveform(audio_data)
-            result = rec.FinalResult()
-            result_json = json.loads(result)
-            
-            return result_json.get('text', '')
-            
-        except Exception as e:
-            raise Exception(f"Recognition error: {str(e)}")
+# Under eventlet/gevent, run_blocking() moves decoding off the event loop
+offload.configure(socketio.async_mode)
 
 # Initialize offline services
 print("\n" + "="*60)
 print("  Offline Voice Translator - Initializing")
 print("="*60 + "\n")
 
-translator = OfflineTranslator()
-recognizer = OfflineSpeechRecognizer()
+startup_started = time.perf_counter()
+
+# Startup only checks the disk; the network is used only when asked to install
+if '--install' in sys.argv:
+    try:
+        install_missing(MANIFEST)
+    except Exception as e:
+        print(f"✗ Model installation failed: {e}")
+
+inference_pool = None
+if os.getenv('INFERENCE_POOL', '').lower() in ('1', 'true', 'yes'):
+    if InferencePool.supported():
+        # Worker-pool mode: models are loaded in N worker processes, not here
+        inference_pool = InferencePool()
+        worker_status = inference_pool.start()
+    else:
+        print("✗ INFERENCE_POOL needs fork() - running inference in-process")
+
+if inference_pool is not None:
+    translator = OfflineTranslator(load_models=False)
+    recognizer = OfflineSpeechRecognizer(load_models=False)
+    translator.attach_pool(inference_pool, all(s['translation'] for s in worker_status))
+    recognizer.attach_pool(
+        inference_pool,
+        set.intersection(*(set(s['speech_languages']) for s in worker_status))
+    )
+else:
+    translator = OfflineTranslator()
+    recognizer = OfflineSpeechRecognizer()
+    preload_models()
+
+# Seconds from import to ready to serve, logged and reported on /status
+startup_seconds = time.perf_counter() - startup_started
+print(f"\n✓ Startup complete in {startup_seconds:.2f}s")
+
+# Trims silence and splits utterances before clips reach Vosk
+vad = VoiceActivityDetector() if VoiceActivityDetector.enabled() else None
+
+# Live recordings (audio_start ... audio_end), keyed by Socket.IO session id
+streaming_sessions = {}
+
+# Translates recognized utterances while the next ones are being recognized
+pipeline_executor = ThreadPoolExecutor(
+    max_workers=int(os.getenv('PIPELINE_WORKERS', 4)),
+    thread_name_prefix='pipeline'
+)
+
+# Per-session and global limits on translate_text / translate_audio requests
+admission = AdmissionController()
+
+metrics.REGISTRY.register(metrics.Gauge(
+    'translator_queued_jobs',
+    'Jobs waiting to run, by queue', ['queue'],
+    function=lambda: {
+        'inference_pool': inference_pool.stats()['pending'] if inference_pool else 0,
+        'translation_batcher': translator.batcher.pending(),
+        'pipeline': pipeline_executor._work_queue.qsize(),
+        'segments': translator.segment_executor._work_queue.qsize(),
+        'admission': admission.queued
+    }
+))
+metrics.REGISTRY.register(metrics.Gauge(
+    'translator_active_requests',
+    'Admitted translate_text / translate_audio requests running now',
+    function=lambda: admission.active
+))
+metrics.REGISTRY.register(metrics.Gauge(
+    'translator_streaming_sessions',
+    'Live recordings in progress',
+    function=lambda: len(streaming_sessions)
+))
+
+def busy_result(error):
+    """Result payload telling the client the server is overloaded"""
+    return {
+        'error': f'Server busy, please retry in {error.retry_after:g}s',
+        'busy': True,
+        'reason': getattr(error, 'reason', 'queue'),
+        'retry_after': error.retry_after
+    }
+
+# Result events → the request type they answer (label of the metrics)
+REQUEST_EVENTS = {
+    'translation_result': 'translate_text',
+    'translation_partial': 'translate_text',
+    'full_translation_result': 'translate_audio',
+    'utterance_result': 'translate_audio',
+    'stream_started': 'audio_stream',
+    'partial_result': 'audio_stream',
+    'final_result': 'audio_stream',
+    'stream_ended': 'audio_stream'
+}
+
+# Result events that complete a request (and its trace)
+FINAL_EVENTS = ('translation_result', 'full_translation_result', 'stream_ended')
+
+def track_request(event, source_lang, target_lang):
+    """Count a request and start its trace; both are picked up by send()"""
+    pair = f"{source_lang}-{target_lang}"
+    g.metrics_pair = pair
+    g.trace = tracing.Trace(event, pair=pair)
+    metrics.REQUESTS.labels(event, pair).inc()
+    return pair
+
+def admitted(result_event):
+    """Decorator: run a request handler only once admission control lets it in
+    
+    Rejected requests are answered with a busy result on `result_event`.
+    """
+    def decorator(handler):
+        @functools.wraps(handler)
+        def wrapper(data):
+            with ExitStack() as stack:
+                # Only admission itself is guarded: Overloaded from the handler is not a rejection
+                try:
+                    stack.enter_context(admission.admit(request.sid))
+                except Overloaded as e:
+                    metrics.ADMISSION_REJECTED.labels(e.reason).inc()
+                    track_request(
+                        REQUEST_EVENTS[result_event], data.get('source_lang', 'zh'), data.get('target_lang', 'en')
+                    )
+                    send(result_event, busy_result(e))
+                    return
+                
+                return handler(data)
+        return wrapper
+    return decorator
+
+def send(event, payload, pair=None, to=None):
+    """emit() a result, recording the emit time and counting error payloads
+    
+    Outside a Socket.IO handler (pipeline threads) pass the session id as `to`.
+    """
+    trace = None
+    if has_request_context():
+        pair = pair or g.get('metrics_pair')
+        trace = g.get('trace') if event in FINAL_EVENTS else None
+    pair = pair or 'unknown'
+    error = payload.get('error') if isinstance(payload, dict) else None
+    if trace is not None:
+        payload['trace_id'] = trace.trace_id
+    
+    started = time.perf_counter()
+    if to is None:
+        emit(event, payload)
+    else:
+        socketio.emit(event, payload, to=to)
+    elapsed = time.perf_counter() - started
+    
+    metrics.EMIT_SECONDS.labels(event).observe(elapsed)
+    if error is not None:
+        metrics.ERRORS.labels(REQUEST_EVENTS.get(event, event), pair).inc()
+    if trace is not None:
+        trace.spans['emit'] = round(elapsed * 1000, 2)
+        trace.finish(error)
+
+def utterance_payload(result, source_lang, target_lang):
+    """Client payload for one pipelined utterance"""
+    if result.error is not None:
+        payload = busy_result(result.error) if isinstance(result.error, PoolBusy) \
+            else {'error': f'Translation failed: {result.error}'}
+    else:
+        payload = {'original': result.original, 'translated': result.translated}
+    payload.update({
+        'utterance': result.index + 1,
+        'source_lang': source_lang,
+        'target_lang': target_lang,
+        'timings': result.timings()
+    })
+    return payload
 
 @app.route('/')
 def index():
     """Serve the main web interface"""
-    return render_template('index_offline.html')
+    return render_template('index_offline.html', socketio_options=socketio_options)
 
 @app.route('/health')
 def health():
@@ -207,9 +268,10 @@ def health():
         'speech_recognition': 'ready' if recognizer.setup_complete else 'unavailable',
         'models_loaded': {
             'translation': translator.setup_complete,
-            'speech_en': 'en' in recognizer.models,
-            'speech_zh': 'zh' in recognizer.models
-        }
+            'speech_en': recognizer.has_language('en'),
+            'speech_zh': recognizer.has_language('zh')
+        },
+        'translation_cache': translator.cache.stats()
     })
 
 @app.route('/status')
@@ -218,141 +280,406 @@ def status():
     return jsonify({
         'translation_ready': translator.setup_complete,
         'speech_ready': recognizer.setup_complete,
+        'startup_seconds': round(startup_seconds, 3),
         'models': {
-            'speech_en': 'en' in recognizer.models,
-            'speech_zh': 'zh' in recognizer.models
-        }
+            'speech_en': recognizer.has_language('en'),
+            'speech_zh': recognizer.has_language('zh')
+        },
+        'translators': translator.registry.stats(),
+        'translation_cache': translator.cache.stats(),
+        'translation_batching': translator.batcher.stats(),
+        'inference_pool': inference_pool.stats() if inference_pool else None,
+        'recognizer_pool': recognizer.recognizer_pool.stats(),
+        # Per process: in worker-pool mode each worker has its own budget
+        'model_memory': model_manager.stats(),
+        'offload': offload.stats(),
+        'admission': admission.stats()
     })
 
+@app.route('/metrics')
+def metrics_endpoint():
+    """Prometheus metrics (per process)"""
+    return app.response_class(metrics.REGISTRY.render(), content_type=metrics.Registry.CONTENT_TYPE)
+
 @socketio.on('connect')
 def handle_connect():
     """Handle client connection"""
-    print('Client connected')
+    logger.debug('client connected sid=%s', request.sid)
+    metrics.CONNECTED_CLIENTS.inc()
     emit('status', {
         'message': 'Connected to offline translator service',
         'translation_ready': translator.setup_complete,
-        'speech_ready': recognizer.setup_complete
+        'speech_ready': recognizer.setup_complete,
+        # The page falls back to recorded clips when live streaming is unavailable
+        'streaming_ready': recognizer.can_stream()
     })
 
 @socketio.on('disconnect')
 def handle_disconnect():
     """Handle client disconnection"""
-    print('Client disconnected')
+    logger.debug('client disconnected sid=%s', request.sid)
+    metrics.CONNECTED_CLIENTS.dec()
+    discard_streaming_session(request.sid, 'client disconnected')
+
+def discard_streaming_session(sid, reason):
+    """Close a session's live recording without flushing it, releasing its recognizer"""
+    session = streaming_sessions.pop(sid, None)
+    if session is None:
+        return
+    with session.lock:
+        session.close()
+    session.trace.finish(reason)
+
+def decode_audio_payload(audio):
+    """Return the audio as a memoryview
+    
+    Clients send raw binary frames, which are used without copying. Base64
+    or data-URL text is still accepted as a compatibility fallback.
+    """
+    import base64
+    
+    if isinstance(audio, (bytes, bytearray, memoryview)):
+        return memoryview(audio)
+    return memoryview(base64.b64decode(audio.split(',')[1] if ',' in audio else audio))
+
+@socketio.on('audio_start')
+def handle_audio_start(data):
+    """Begin a live recording: one recognizer for this session until audio_end"""
+    source_lang = data.get('source_lang', 'zh')
+    target_lang = data.get('target_lang', 'en')
+    pair = track_request('audio_stream', source_lang, target_lang)
+    # A second audio_start without audio_end: the old recording is abandoned
+    discard_streaming_session(request.sid, 'replaced by a new audio_start')
+    
+    try:
+        sample_rate = int(data.get('sample_rate', 16000))
+        if not 8000 <= sample_rate <= 192000:
+            raise ValueError(sample_rate)
+    except (TypeError, ValueError):
+        error = f"Invalid sample_rate: {data.get('sample_rate')!r}"
+        send('final_result', {'error': error})
+        g.trace.finish(error)
+        return
+    
+    if not translator.setup_complete:
+        send('final_result', {
+            'error': 'Translation models not installed. Install Argos Translate packages first.'
+        })
+        g.trace.finish('translation models not installed')
+        return
+    
+    try:
+        stream = recognizer.open_stream(source_lang, sample_rate)
+    except Exception as e:
+        send('final_result', {'error': str(e)})
+        g.trace.finish(e)
+        return
+    
+    session = StreamingSession(stream, source_lang, target_lang, sample_rate)
+    # Finished utterances are translated without holding up recognition of the next one
+    sid = request.sid
+    session.pipeline = UtterancePipeline(
+        lambda text: translator.translate(text, source_lang, target_lang),
+        lambda result: send(
+            'final_result', utterance_payload(result, source_lang, target_lang), pair=pair, to=sid
+        ),
+        pipeline_executor
+    )
+    session.trace = g.trace
+    session.trace.add(sample_rate=sample_rate)
+    streaming_sessions[sid] = session
+    logger.debug('[%s] streaming started %s @ %s Hz', session.trace.trace_id, pair, sample_rate)
+    send('stream_started', {'source_lang': source_lang, 'target_lang': target_lang})
+
+def emit_final_result(session, text):
+    """Queue one finished utterance for translation; the pipeline sends it to the client"""
+    recognize_seconds = session.take_decode_seconds()
+    if not text or not text.strip():
+        return
+    
+    session.utterances += 1
+    session.pipeline.submit(text, recognize_seconds)
+
+def feed_stream(session, chunks):
+    """Feed ordered PCM chunks, emitting partial hypotheses and queueing final utterances"""
+    for pcm in chunks:
+        session.bytes_received += len(pcm)
+        decode_started = time.perf_counter()
+        with session.trace.span('recognize'):
+            final_text, partial_text = session.stream.accept(pcm)
+        session.decode_seconds += time.perf_counter() - decode_started
+        if final_text is not None:
+            emit_final_result(session, final_text)
+        elif partial_text is not None:
+            send('partial_result', {'text': partial_text})
+
+@socketio.on('audio_chunk')
+def handle_audio_chunk(data):
+    """PCM from a live recording: {'seq': n, 'audio': <bytes>} or bare bytes"""
+    session = streaming_sessions.get(request.sid)
+    if session is None:
+        return  # chunk after audio_end, or no audio_start
+    g.metrics_pair = f"{session.source_lang}-{session.target_lang}"
+    g.trace = session.trace
+    
+    if isinstance(data, dict):
+        seq = data.get('seq')
+        audio = data.get('audio', b'')
+    else:
+        seq = None
+        audio = data
+    
+    try:
+        chunk = decode_audio_payload(audio)
+        # Kaldi recognizers are not thread-safe and chunks must stay in order
+        with session.lock:
+            if session.closed:
+                return  # audio_end or a disconnect got the lock first
+            feed_stream(session, session.reorder(seq, chunk))
+    except PoolBusy as e:
+        send('final_result', busy_result(e))
+    except Exception as e:
+        logger.exception('[%s] streaming error', session.trace.trace_id)
+        send('final_result', {'error': f'Streaming recognition failed: {e}'})
+
+@socketio.on('audio_end')
+def handle_audio_end(data=None):
+    """End of a live recording: flush the recognizer and send the last utterance"""
+    session = streaming_sessions.pop(request.sid, None)
+    if session is None:
+        return
+    g.metrics_pair = f"{session.source_lang}-{session.target_lang}"
+    g.trace = session.trace
+    
+    try:
+        with session.lock:
+            try:
+                feed_stream(session, session.drain())
+                emit_final_result(session, session.stream.finish())
+            finally:
+                session.close()
+    except PoolBusy as e:
+        send('final_result', busy_result(e))
+    except Exception as e:
+        logger.exception('[%s] streaming error', session.trace.trace_id)
+        send('final_result', {'error': f'Streaming recognition failed: {e}'})
+    
+    # stream_ended must follow the last final_result
+    with session.trace.span('translate_drain'):
+        session.pipeline.finish()
+    pipeline_stats = session.pipeline.stats()
+    session.trace.add(
+        utterances=session.utterances,
+        audio_seconds=round(session.audio_seconds, 2),
+        mean_latency_ms=pipeline_stats['mean_latency_ms']
+    )
+    send('stream_ended', {'utterances': session.utterances, 'pipeline': pipeline_stats})
 
 @socketio.on('translate_text')
+@admitted('translation_result')
 def handle_text_translation(data):
     """Handle text translation (offline)"""
     try:
         text = data.get('text', '')
         source_lang = data.get('source_lang', 'zh')
         target_lang = data.get('target_lang', 'en')
+        track_request('translate_text', source_lang, target_lang)
         
         if not text:
-            emit('translation_result', {'error': 'No text provided'})
+            send('translation_result', {'error': 'No text provided'})
             return
         
         if not translator.setup_complete:
-            emit('translation_result', {
+            send('translation_result', {
                 'error': 'Translation models not installed. Run setup first.'
             })
             return
         
-        print(f"Translating offline: '{text}' ({source_lang}→{target_lang})")
-        translated = translator.translate(text, source_lang, target_lang)
-        print(f"Result: '{translated}'")
+        trace = g.trace
+        trace.text('original', text)
+        with trace.span('segment'):
+            segments = split_sentences(text)
+        trace.add(segments=len(segments))
         
-        emit('translation_result', {
+        if len(segments) > 1:
+            # Long input: stream each sentence as soon as it (and those before it) are done
+            translated_segments = []
+            with trace.span('translate'):
+                for index, translated_segment in enumerate(
+                        translator.translate_segments(segments, source_lang, target_lang)):
+                    translated_segments.append(translated_segment)
+                    send('translation_partial', {
+                        'index': index,
+                        'total': len(segments),
+                        'original': segments[index][0],
+                        'translated': translated_segment,
+                        'source_lang': source_lang,
+                        'target_lang': target_lang
+                    })
+            translated = join_segments(
+                translated_segments, [separator for _, separator in segments], target_lang
+            )
+        else:
+            with trace.span('translate'):
+                translated = translator.translate(text, source_lang, target_lang)
+        trace.text('translated', translated)
+        logger.debug('[%s] translated %s: %s', trace.trace_id, tracing.body(text), tracing.body(translated))
+        
+        send('translation_result', {
             'original': text,
             'translated': translated,
             'source_lang': source_lang,
-            'target_lang': target_lang
+            'target_lang': target_lang,
+            'segments': len(segments)
         })
+    except PoolBusy as e:
+        send('translation_result', busy_result(e))
     except Exception as e:
-        print(f"Translation error: {e}")
-        emit('translation_result', {'error': str(e)})
+        logger.exception('[%s] translation error', g.trace.trace_id)
+        send('translation_result', {'error': str(e)})
 
 @socketio.on('translate_audio')
+@admitted('full_translation_result')
 def handle_audio_translation(data):
     """Handle audio translation (completely offline)"""
     try:
-        import base64
-        import io
-        
-        audio_base64 = data.get('audio', '')
+        audio = data.get('audio', '')
         source_lang = data.get('source_lang', 'zh')
         target_lang = data.get('target_lang', 'en')
+        pair = track_request('translate_audio', source_lang, target_lang)
         
-        if not audio_base64:
-            emit('full_translation_result', {'error': 'No audio provided'})
+        if not audio:
+            send('full_translation_result', {'error': 'No audio provided'})
             return
         
         if not recognizer.setup_complete:
-            emit('full_translation_result', {
+            send('full_translation_result', {
                 'error': 'Speech recognition models not installed. Download Vosk models first.'
             })
             return
         
         if not translator.setup_complete:
-            emit('full_translation_result', {
+            send('full_translation_result', {
                 'error': 'Translation models not installed. Install Argos Translate packages first.'
             })
             return
         
-        print(f"\n[Offline] Processing audio: {source_lang}→{target_lang}")
+        trace = g.trace
         
-        # Decode audio
+        # Decode audio (binary frames are used as-is)
+        decode_started = time.perf_counter()
         try:
-            audio_bytes = base64.b64decode(audio_base64.split(',')[1] if ',' in audio_base64 else audio_base64)
-            print(f"Decoded {len(audio_bytes)} bytes of WAV audio")
+            with trace.span('decode'):
+                audio_view = decode_audio_payload(audio)
+            trace.add(audio_bytes=len(audio_view))
         except Exception as e:
-            emit('full_translation_result', {'error': f'Audio decode error: {e}'})
+            send('full_translation_result', {'error': f'Audio decode error: {e}'})
             return
         
-        # Extract raw PCM data from WAV (skip 44-byte header)
-        pcm_data = audio_bytes[44:]
-        
-        # Recognize speech offline
+        # Parse the WAV and convert to 16 kHz mono PCM (a view when already in that format)
         try:
-            print(f"Recognizing speech offline ({source_lang})...")
-            recognized_text = recognizer.recognize(pcm_data, source_lang)
-            
-            if not recognized_text or recognized_text.strip() == '':
-                emit('full_translation_result', {
-                    'error': 'Could not recognize speech. Please speak clearly and ensure Vosk models are installed.'
-                })
-                return
-            
-            print(f"✓ Recognized: '{recognized_text}'")
-            
-        except Exception as e:
-            print(f"✗ Recognition error: {e}")
-            emit('full_translation_result', {'error': f'Speech recognition failed: {e}'})
+            with trace.span('resample'):
+                pcm_data, wav_info = offload.run_blocking(load_pcm, audio_view)
+            if wav_info is not None:
+                trace.add(audio_format=repr(wav_info))
+        except AudioFormatError as e:
+            send('full_translation_result', {'error': f'Unsupported audio: {e}'})
+            return
+        
+        # Drop leading/trailing silence and split on long pauses
+        with trace.span('vad'):
+            speech = offload.run_blocking(vad.detect, pcm_data) if vad is not None else None
+        metrics.AUDIO_DECODE_SECONDS.observe(time.perf_counter() - decode_started)
+        if speech is not None and not speech.segments:
+            send('full_translation_result', {
+                'error': 'No speech detected in the recording. Please speak clearly and try again.'
+            })
             return
         
-        # Translate offline
+        # Recognize utterance by utterance; each one is translated while the next is recognized
+        sid = request.sid
+        pipeline = UtterancePipeline(
+            lambda text: translator.translate(text, source_lang, target_lang),
+            lambda result: send(
+                'utterance_result', utterance_payload(result, source_lang, target_lang), pair=pair, to=sid
+            ),
+            pipeline_executor
+        )
         try:
-            print(f"Translating offline: {source_lang}→{target_lang}...")
-            translated_text = translator.translate(recognized_text, source_lang, target_lang)
-            print(f"✓ Translated: '{translated_text}'")
-            
+            # Kaldi decodes on this thread unless it is offloaded; then only wall time is observable here
+            inline = recognizer.pool is None and not offload.offloading()
+            clock = time.thread_time if inline else time.perf_counter
+            segments = speech.segments if speech is not None else [(0, len(pcm_data))]
+            decode_seconds = 0.0
+            decode_started = clock()
+            with trace.span('recognize'):
+                for text in recognizer.recognize_segments(pcm_data, segments, source_lang):
+                    elapsed = clock() - decode_started
+                    decode_seconds += elapsed
+                    if text and text.strip():
+                        pipeline.submit(text, elapsed)
+                    decode_started = clock()
+            vad_stats = speech.stats(decode_seconds) if speech is not None else None
+            if vad_stats:
+                trace.add(
+                    vad_segments=vad_stats['segments'],
+                    vad_trimmed_pct=vad_stats['trimmed_pct'],
+                    vad_saved_ms=vad_stats['cpu_saved_ms']
+                )
+        except PoolBusy as e:
+            send('full_translation_result', busy_result(e))
+            return
         except Exception as e:
-            print(f"✗ Translation error: {e}")
-            emit('full_translation_result', {'error': f'Translation failed: {e}'})
+            logger.exception('[%s] recognition error', trace.trace_id)
+            send('full_translation_result', {'error': f'Speech recognition failed: {e}'})
+            return
+        
+        # Wait for the translations still in flight; they come back in utterance order
+        with trace.span('translate_drain'):
+            results = pipeline.finish()
+        if not results:
+            send('full_translation_result', {
+                'error': 'Could not recognize speech. Please speak clearly and ensure Vosk models are installed.'
+            })
+            return
+        
+        failed = next((result.error for result in results if result.error is not None), None)
+        if isinstance(failed, PoolBusy):
+            send('full_translation_result', busy_result(failed))
+            return
+        if failed is not None:
+            send('full_translation_result', {'error': f'Translation failed: {failed}'})
             return
         
+        recognized_text = ' '.join(result.original for result in results)
+        translated_text = join_segments(
+            [result.translated for result in results], [' '] * len(results), target_lang
+        )
+        pipeline_stats = pipeline.stats()
+        trace.text('original', recognized_text)
+        trace.text('translated', translated_text)
+        trace.add(
+            utterances=pipeline_stats['utterances'],
+            translate_ms=pipeline_stats['translate_ms'],
+            pipeline_saved_ms=pipeline_stats['saved_ms']
+        )
+        logger.debug('[%s] recognized %s, translated %s', trace.trace_id,
+                     tracing.body(recognized_text), tracing.body(translated_text))
+        
         # Send result
-        emit('full_translation_result', {
+        send('full_translation_result', {
             'original': recognized_text,
             'translated': translated_text,
             'source_lang': source_lang,
-            'target_lang': target_lang
+            'target_lang': target_lang,
+            'vad': vad_stats,
+            'pipeline': pipeline_stats
         })
         
     except Exception as e:
-        print(f"\n✗ Error in offline audio translation:")
-        import traceback
-        traceback.print_exc()
-        emit('full_translation_result', {'error': f'Server error: {str(e)}'})
+        trace = g.get('trace')
+        logger.exception('[%s] error in offline audio translation', trace.trace_id if trace else '-')
+        send('full_translation_result', {'error': f'Server error: {str(e)}'})
 
 if __name__ == '__main__':
     import os
@@ -0,0 +1,223 @@
+"""
+Audio ingestion - turn uploaded WAV clips into what Vosk expects
+
+Browsers and other clients send WAV files with extra chunks (LIST, fact...),
+stereo audio or 44.1/48 kHz sample rates. This module parses the RIFF chunks,
+downmixes to mono and resamples to 16 kHz 16-bit PCM with NumPy, and yields
+the result in fixed-size chunks for the recognizer.
+
+Clips that already are 16 kHz mono 16-bit are passed through as a memoryview
+of the original buffer, without copying. Input that does not start with a
+RIFF header is treated as raw 16 kHz mono PCM, as before.
+"""
+
+import struct
+
+TARGET_RATE = 16000
+
+# Bytes fed to AcceptWaveform at a time (0.25 s of 16 kHz 16-bit mono)
+CHUNK_BYTES = 8000
+
+WAVE_FORMAT_PCM = 0x0001
+WAVE_FORMAT_IEEE_FLOAT = 0x0003
+WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+
+class AudioFormatError(ValueError):
+    """The audio could not be parsed or converted"""
+
+
+class WavInfo:
+    """Format of a parsed WAV clip plus a view of its sample data"""
+
+    __slots__ = ('sample_rate', 'channels', 'bits_per_sample', 'format_tag', 'data')
+
+    def __init__(self, sample_rate, channels, bits_per_sample, format_tag, data):
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.bits_per_sample = bits_per_sample
+        self.format_tag = format_tag
+        self.data = data
+
+    @property
+    def duration(self):
+        frame_bytes = self.channels * self.bits_per_sample // 8
+        return len(self.data) / frame_bytes / self.sample_rate if frame_bytes else 0.0
+
+    @property
+    def is_vosk_ready(self):
+        return (self.sample_rate == TARGET_RATE and self.channels == 1
+                and self.bits_per_sample == 16 and self.format_tag == WAVE_FORMAT_PCM)
+
+    def __repr__(self):
+        return (f"WavInfo({self.sample_rate} Hz, {self.channels} ch, "
+                f"{self.bits_per_sample}-bit, {self.duration:.2f}s)")
+
+
+def parse_wav(buffer):
+    """Parse RIFF/WAVE chunks; returns a WavInfo whose data is a view into `buffer`"""
+    view = memoryview(buffer).cast('B')
+    if len(view) < 12 or bytes(view[0:4]) != b'RIFF' or bytes(view[8:12]) != b'WAVE':
+        raise AudioFormatError("Not a RIFF/WAVE file")
+
+    fmt = None
+    offset = 12
+    while offset + 8 <= len(view):
+        chunk_id = bytes(view[offset:offset + 4])
+        (chunk_size,) = struct.unpack_from('<I', view, offset + 4)
+        body = offset + 8
+
+        if chunk_id == b'fmt ':
+            if chunk_size < 16:
+                raise AudioFormatError("Truncated fmt chunk")
+            format_tag, channels, sample_rate, _, _, bits = struct.unpack_from('<HHIIHH', view, body)
+            if format_tag == WAVE_FORMAT_EXTENSIBLE and chunk_size >= 40:
+                # The real format is the first two bytes of the SubFormat GUID
+                (format_tag,) = struct.unpack_from('<H', view, body + 24)
+            fmt = (format_tag, channels, sample_rate, bits)
+
+        elif chunk_id == b'data':
+            if fmt is None:
+                raise AudioFormatError("data chunk before fmt chunk")
+            # Streaming writers leave the size at 0 or 0xFFFFFFFF: take the rest
+            end = body + chunk_size
+            if chunk_size in (0, 0xFFFFFFFF) or end > len(view):
+                end = len(view)
+            format_tag, channels, sample_rate, bits = fmt
+            if not channels or not sample_rate or bits not in (8, 16, 24, 32):
+                raise AudioFormatError(f"Unsupported WAV format: {channels} ch, {sample_rate} Hz, {bits}-bit")
+            frame_bytes = channels * bits // 8
+            end -= (end - body) % frame_bytes
+            return WavInfo(sample_rate, channels, bits, format_tag, view[body:end])
+
+        # Chunks are word-aligned
+        offset = body + chunk_size + (chunk_size & 1)
+
+    raise AudioFormatError("No data chunk found")
+
+
+def _to_float_frames(info):
+    """Decode sample data to a float32 array of shape (frames, channels)"""
+    import numpy as np
+
+    data = info.data
+    bits = info.bits_per_sample
+
+    if info.format_tag == WAVE_FORMAT_IEEE_FLOAT:
+        if bits != 32:
+            raise AudioFormatError(f"Unsupported float WAV: {bits}-bit")
+        samples = np.frombuffer(data, dtype='<f4')
+    elif info.format_tag != WAVE_FORMAT_PCM:
+        raise AudioFormatError(f"Unsupported WAV encoding 0x{info.format_tag:04x}")
+    elif bits == 8:
+        samples = (np.frombuffer(data, dtype=np.uint8).astype(np.float32) - 128.0) / 128.0
+    elif bits == 16:
+        samples = np.frombuffer(data, dtype='<i2').astype(np.float32) / 32768.0
+    elif bits == 24:
+        raw = np.frombuffer(data, dtype=np.uint8).reshape(-1, 3).astype(np.int32)
+        ints = raw[:, 0] | (raw[:, 1] << 8) | (raw[:, 2] << 16)
+        ints = np.where(ints & 0x800000, ints - 0x1000000, ints)
+        samples = ints.astype(np.float32) / 8388608.0
+    else:
+        samples = np.frombuffer(data, dtype='<i4').astype(np.float32) / 2147483648.0
+
+    return samples.reshape(-1, info.channels)
+
+
+def resample(samples, source_rate, target_rate=TARGET_RATE):
+    """Resample a mono float32 array
+
+    Integer downsampling ratios (48k, 32k → 16k) average each group of input
+    samples, which doubles as a simple low-pass filter. Other ratios use linear
+    interpolation, after a moving-average low-pass when downsampling.
+    """
+    import numpy as np
+
+    if source_rate == target_rate or len(samples) == 0:
+        return samples
+
+    if source_rate > target_rate and source_rate % target_rate == 0:
+        factor = source_rate // target_rate
+        usable = len(samples) - len(samples) % factor
+        return samples[:usable].reshape(-1, factor).mean(axis=1)
+
+    if source_rate > target_rate:
+        width = int(round(source_rate / target_rate))
+        if width > 1:
+            kernel = np.ones(width, dtype=np.float32) / width
+            samples = np.convolve(samples, kernel, mode='same')
+
+    duration = len(samples) / source_rate
+    target_len = int(duration * target_rate)
+    positions = np.arange(target_len, dtype=np.float64) * (source_rate / target_rate)
+    return np.interp(positions, np.arange(len(samples)), samples).astype(np.float32)
+
+
+def to_vosk_pcm(info):
+    """16 kHz mono 16-bit PCM for a parsed clip (a view of the input when possible)"""
+    if info.is_vosk_ready:
+        return info.data
+
+    try:
+        import numpy as np
+    except ImportError:
+        raise AudioFormatError(
+            f"numpy is required to convert {info!r} to 16 kHz mono - run: pip install numpy"
+        )
+
+    frames = _to_float_frames(info)
+    mono = frames.mean(axis=1) if info.channels > 1 else frames[:, 0]
+    mono = resample(mono, info.sample_rate)
+    pcm = (np.clip(mono, -1.0, 1.0) * 32767.0).astype('<i2')
+    return memoryview(pcm.tobytes())
+
+
+def load_pcm(buffer):
+    """Decode an uploaded clip to 16 kHz mono PCM; returns (pcm, WavInfo or None)
+
+    Input without a RIFF header is assumed to already be 16 kHz mono PCM.
+    """
+    view = memoryview(buffer).cast('B')
+    if bytes(view[0:4]) != b'RIFF':
+        return view, None
+    info = parse_wav(view)
+    return to_vosk_pcm(info), info
+
+
+def iter_chunks(pcm, chunk_bytes=CHUNK_BYTES):
+    """Yield fixed-size memoryview slices of `pcm` (the last one may be shorter)"""
+    view = memoryview(pcm).cast('B')
+    for start in range(0, len(view), chunk_bytes):
+        yield view[start:start + chunk_bytes]
+
+
+def as_waveform(data):
+    """Wrap a bytes-like object for KaldiRecognizer.AcceptWaveform without copying
+
+    Vosk's cffi binding only takes bytes for its char* argument; memoryviews
+    are wrapped with ffi.from_buffer instead of being copied to bytes. Falls
+    back to a copy if the binding does not expose its ffi object.
+    """
+    if isinstance(data, bytes):
+        return data
+    try:
+        from vosk import _ffi
+    except ImportError:
+        return bytes(data)
+    return _ffi.from_buffer(data)
+
+
+def feed_recognizer(rec, pcm, chunk_bytes=CHUNK_BYTES):
+    """Feed PCM to a KaldiRecognizer chunk by chunk; returns the recognized utterances
+
+    Vosk may finalize several utterances within one clip. Each one is
+    collected when AcceptWaveform reports it, and FinalResult flushes the rest.
+    """
+    import json
+
+    texts = []
+    for chunk in iter_chunks(pcm, chunk_bytes):
+        if rec.AcceptWaveform(as_waveform(chunk)):
+            texts.append(json.loads(rec.Result()).get('text', ''))
+    texts.append(json.loads(rec.FinalResult()).get('text', ''))
+    return [text for text in texts if text]
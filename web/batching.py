@@ -0,0 +1,161 @@
+"""
+Micro-batching scheduler for translation requests
+
+Concurrent translate_text requests for the same language pair are collected
+for a short window (or until the batch is full) and translated together in one
+batched CTranslate2 call. Each caller blocks only until its own batch is done,
+so results go straight back to the Socket.IO session that asked for them.
+
+One scheduler thread forms the batches; they run on a small thread pool, so
+batches for different pairs (and a new batch while the last one is still
+decoding) don't wait on each other.
+"""
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+class _PendingItem:
+    """One queued text and the slot its translation is delivered to"""
+
+    __slots__ = ('text', 'done', 'result', 'error')
+
+    def __init__(self, text):
+        self.text = text
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class _Batch:
+    __slots__ = ('items', 'opened_at')
+
+    def __init__(self):
+        self.items = []
+        self.opened_at = time.monotonic()
+
+
+class MicroBatcher:
+    """Groups translations per (source, target) pair into batches"""
+
+    def __init__(self, translate_batch, window_ms=None, max_batch=None, workers=None):
+        if window_ms is None:
+            window_ms = float(os.getenv('TRANSLATION_BATCH_WINDOW_MS', 10))
+        if max_batch is None:
+            max_batch = int(os.getenv('TRANSLATION_BATCH_MAX', 16))
+        if workers is None:
+            workers = int(os.getenv('TRANSLATION_BATCH_WORKERS', 4))
+        # translate_batch(texts, source_lang, target_lang) -> list of results
+        self.translate_batch = translate_batch
+        self.window = window_ms / 1000.0
+        self.max_batch = max(1, max_batch)
+        self.workers = max(1, workers)
+
+        self._batches = {}
+        self._cond = threading.Condition()
+        self._thread = None
+        self._executor = None
+        self._pid = None
+
+        self.batches_run = 0
+        self.items_run = 0
+        self.largest_batch = 0
+
+    @property
+    def enabled(self):
+        return self.window > 0 and self.max_batch > 1
+
+    def _ensure_thread(self):
+        # Threads don't survive fork(), so (re)start lazily in each process
+        if self._thread is None or self._pid != os.getpid() or not self._thread.is_alive():
+            self._pid = os.getpid()
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='translation-batch')
+            self._thread = threading.Thread(target=self._run, name='translation-batcher', daemon=True)
+            self._thread.start()
+
+    def translate(self, text, source_lang, target_lang, timeout=60.0):
+        """Queue a text and block until its batch has been translated"""
+        item = _PendingItem(text)
+        key = (source_lang, target_lang)
+
+        with self._cond:
+            self._ensure_thread()
+            batch = self._batches.get(key)
+            if batch is None:
+                batch = self._batches[key] = _Batch()
+            batch.items.append(item)
+            self._cond.notify()
+
+        if not item.done.wait(timeout):
+            raise TimeoutError(f"Translation batch for {source_lang}->{target_lang} timed out")
+        if item.error is not None:
+            raise item.error
+        return item.result
+
+    def pending(self):
+        """Texts queued and not yet handed to a batch"""
+        with self._cond:
+            return sum(len(batch.items) for batch in self._batches.values())
+
+    def _take_ready(self):
+        """Pop batches that are full or whose window has elapsed; return (ready, wait)"""
+        now = time.monotonic()
+        ready = []
+        wait = None
+        for key, batch in list(self._batches.items()):
+            remaining = batch.opened_at + self.window - now
+            if len(batch.items) >= self.max_batch or remaining <= 0:
+                del self._batches[key]
+                # Anything beyond max_batch goes back into a fresh batch
+                overflow = batch.items[self.max_batch:]
+                batch.items = batch.items[:self.max_batch]
+                if overflow:
+                    rest = self._batches[key] = _Batch()
+                    rest.items = overflow
+                    wait = 0
+                ready.append((key, batch))
+            elif wait is None or remaining < wait:
+                wait = remaining
+        return ready, wait
+
+    def _run(self):
+        while True:
+            with self._cond:
+                ready, wait = self._take_ready()
+                while not ready:
+                    self._cond.wait(wait)
+                    ready, wait = self._take_ready()
+
+            for (source_lang, target_lang), batch in ready:
+                self._executor.submit(self._execute, source_lang, target_lang, batch.items)
+
+    def _execute(self, source_lang, target_lang, items):
+        try:
+            results = self.translate_batch([item.text for item in items], source_lang, target_lang)
+            for item, result in zip(items, results):
+                item.result = result
+        except Exception as e:
+            for item in items:
+                item.error = e
+        finally:
+            with self._cond:
+                self.batches_run += 1
+                self.items_run += len(items)
+                self.largest_batch = max(self.largest_batch, len(items))
+            for item in items:
+                item.done.set()
+
+    def stats(self):
+        return {
+            'enabled': self.enabled,
+            'window_ms': self.window * 1000,
+            'max_batch': self.max_batch,
+            'workers': self.workers,
+            'pending': self.pending(),
+            'batches': self.batches_run,
+            'items': self.items_run,
+            'avg_batch_size': round(self.items_run / self.batches_run, 2) if self.batches_run else 0.0,
+            'largest_batch': self.largest_batch
+        }
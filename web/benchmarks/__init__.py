@@ -0,0 +1,13 @@
+"""
+Benchmarks for the offline translator
+
+Run from the web/ directory, e.g.:
+    python -m benchmarks.run --stub --output benchmarks/results/latest.json
+    python -m benchmarks.registry_overhead
+    python -m benchmarks.rss_vs_workers
+    python -m benchmarks.loadgen --clients 20 --rate 10
+
+run.py is the main suite (translation, recognition and end-to-end latency);
+corpus.py and fixtures.py hold its fixed inputs and stubs.py the model-free
+backends. loadgen.py drives a running server with many Socket.IO clients.
+"""
@@ -0,0 +1,68 @@
+"""
+Fixed benchmark corpus - short phrases and longer passages in English and Chinese
+
+Kept in code (not downloaded) so every run translates exactly the same text.
+"""
+
+SHORT = {
+    'en': [
+        "Hello, how are you?",
+        "Thank you very much.",
+        "Let's start the meeting.",
+        "Can you hear me?",
+        "Please share your screen.",
+        "I agree with that.",
+        "What time is it now?",
+        "See you tomorrow."
+    ],
+    'zh': [
+        "你好，你怎么样？",
+        "非常感谢。",
+        "我们开始开会吧。",
+        "你能听到我吗？",
+        "请共享你的屏幕。",
+        "我同意。",
+        "现在几点了？",
+        "明天见。"
+    ]
+}
+
+LONG = {
+    'en': [
+        "Good morning everyone, and thank you for joining today's quarterly review. "
+        "We will start with a short summary of last quarter's results, then go through "
+        "the open issues from the previous meeting. After that, each team lead will "
+        "present their plans for the next three months. Please keep your microphones "
+        "muted when you are not speaking, and use the chat for questions.",
+        "The new release fixes the synchronization problem that some users reported on "
+        "slow networks. It also reduces the startup time by loading the language models "
+        "only when they are first needed. We tested the change on three different "
+        "machines and saw no regressions. If you notice anything unusual, please open "
+        "a ticket and attach the log file.",
+        "Our customers in Shanghai asked whether the service can run without an internet "
+        "connection. The answer is yes: speech recognition and translation both run "
+        "locally, so no audio or text ever leaves the building. The only requirement is "
+        "that the models are installed once, before the first meeting."
+    ],
+    'zh': [
+        "大家早上好，感谢大家参加今天的季度总结会议。我们先简要回顾上个季度的结果，"
+        "然后讨论上次会议遗留的问题。之后，每个团队负责人将介绍未来三个月的计划。"
+        "不发言时请将麦克风静音，如有问题请在聊天中提出。",
+        "新版本修复了一些用户在网络较慢时遇到的同步问题。它还通过在首次需要时才加载"
+        "语言模型来缩短启动时间。我们在三台不同的机器上测试了这个改动，没有发现回归问题。"
+        "如果您发现任何异常，请提交工单并附上日志文件。",
+        "我们在上海的客户询问这项服务能否在没有互联网连接的情况下运行。答案是肯定的："
+        "语音识别和翻译都在本地运行，因此音频和文字都不会离开大楼。唯一的要求是在第一次"
+        "会议之前安装好模型。"
+    ]
+}
+
+
+def pairs():
+    """Benchmark language directions"""
+    return [('en', 'zh'), ('zh', 'en')]
+
+
+def sentences(source_lang, length):
+    """Corpus texts for a source language; length is 'short' or 'long'"""
+    return (SHORT if length == 'short' else LONG)[source_lang]
@@ -0,0 +1,77 @@
+"""
+Generated WAV fixtures for the recognition benchmarks
+
+Clips are synthesized instead of checked in: voiced "syllables" (a harmonic
+tone with a 4 Hz envelope) separated by short pauses, with leading and
+trailing silence so the VAD has something to trim. The real models will not
+recognize words in them, but decoding cost depends on the audio length, not
+on the content. Pass --wav-dir to benchmark real recordings instead.
+"""
+
+import io
+import os
+import wave
+
+SAMPLE_RATE = 16000
+
+# Clip lengths in seconds
+LENGTHS = (1, 5, 15, 30)
+
+
+def synthesize(seconds, sample_rate=SAMPLE_RATE, seed=0):
+    """Speech-like int16 samples: 0.5 s silence, bursts of 'syllables', 0.5 s silence"""
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    total = int(seconds * sample_rate)
+    t = np.arange(total) / sample_rate
+    pitch = 120.0 + 60.0 * np.sin(2 * np.pi * 0.3 * t)
+    phase = 2 * np.pi * np.cumsum(pitch) / sample_rate
+    voiced = sum(np.sin(phase * k) / k for k in range(1, 6))
+    envelope = np.clip(np.sin(2 * np.pi * 4.0 * t), 0.0, None)
+
+    # Half-second pause after every two seconds of "speech"
+    speaking = (t % 2.5) < 2.0
+    margin = min(0.5, seconds / 4)
+    speaking &= (t >= margin) & (t < seconds - margin)
+
+    signal = voiced * envelope * speaking * 0.3 + rng.normal(0.0, 0.002, total)
+    return (np.clip(signal, -1.0, 1.0) * 32767).astype('<i2')
+
+
+def wav_bytes(samples, sample_rate=SAMPLE_RATE, channels=1):
+    """Encode int16 samples as a WAV file"""
+    buffer = io.BytesIO()
+    with wave.open(buffer, 'wb') as wav:
+        wav.setnchannels(channels)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes(samples.tobytes())
+    return buffer.getvalue()
+
+
+def generate(lengths=LENGTHS):
+    """{name: wav bytes} - 16 kHz mono clips plus one 48 kHz stereo clip (resampling path)"""
+    import numpy as np
+
+    clips = {f'{seconds}s_16k_mono': wav_bytes(synthesize(seconds)) for seconds in lengths}
+
+    stereo = np.repeat(synthesize(5, sample_rate=48000, seed=1), 2)
+    clips['5s_48k_stereo'] = wav_bytes(stereo, sample_rate=48000, channels=2)
+    return clips
+
+
+def load_dir(path):
+    """{name: wav bytes} for every .wav file in a directory"""
+    clips = {}
+    for name in sorted(os.listdir(path)):
+        if name.lower().endswith('.wav'):
+            with open(os.path.join(path, name), 'rb') as f:
+                clips[os.path.splitext(name)[0]] = f.read()
+    return clips
+
+
+def duration(clip):
+    """Length of a WAV clip in seconds"""
+    with wave.open(io.BytesIO(clip)) as wav:
+        return wav.getnframes() / wav.getframerate()
@@ -0,0 +1,326 @@
+"""
+Socket.IO load generator - concurrent clients replaying text and audio requests
+
+Opens --clients Socket.IO connections to a running app.py or app_offline.py
+and sends translate_text / translate_audio requests from the benchmark corpus
+and WAV fixtures at a target rate (--rate requests/s across all clients, or
+--rate 0 for every client sending back-to-back). Each client has one request
+in flight at a time, like the browser UI.
+
+Latency is reported two ways:
+  response   from the moment the request was due to the final result; includes
+             time spent waiting for a free client, so an overloaded server
+             shows up as growing latency rather than a quietly lower rate
+  service    from emit to the final result
+
+Needs the Socket.IO client: pip install "python-socketio[client]"
+
+Usage (from web/):
+    STUB_MODELS=1 python app_offline.py                 # server with simulated models
+    python -m benchmarks.loadgen --clients 20 --rate 10 --duration 60
+    python -m benchmarks.loadgen --rate 0 --output benchmarks/results/load.json
+    python -m benchmarks.loadgen --url http://localhost:8080 --mix text=1   # app.py
+"""
+
+import argparse
+import base64
+import importlib.util
+import json
+import os
+import platform
+import queue
+import random
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+
+from benchmarks.run import git_commit, summarize
+
+# Result event answering each request event
+RESULT_EVENTS = {
+    'translate_text': 'translation_result',
+    'translate_audio': 'full_translation_result'
+}
+
+
+def parse_mix(value):
+    """'text=0.8,audio=0.2' -> {'translate_text': 0.8, 'translate_audio': 0.2}"""
+    mix = {}
+    for part in value.split(','):
+        kind, _, weight = part.partition('=')
+        event = f'translate_{kind.strip()}'
+        if event not in RESULT_EVENTS:
+            raise argparse.ArgumentTypeError(f"unknown request type '{kind}' (text or audio)")
+        mix[event] = float(weight or 1)
+    if not any(mix.values()):
+        raise argparse.ArgumentTypeError('mix needs at least one positive weight')
+    return mix
+
+
+def build_payloads(args):
+    """{request event: [payload, ...]} replayed round-robin"""
+    from benchmarks import corpus, fixtures
+
+    payloads = {}
+    if args.mix.get('translate_text'):
+        payloads['translate_text'] = [
+            {'text': text, 'source_lang': source_lang, 'target_lang': target_lang}
+            for source_lang, target_lang in corpus.pairs()
+            for length in ('short', 'long')
+            for text in corpus.sentences(source_lang, length)
+        ]
+    if args.mix.get('translate_audio'):
+        clips = fixtures.load_dir(args.wav_dir) if args.wav_dir else fixtures.generate(args.audio_lengths)
+        target_lang = 'zh' if args.speech_lang == 'en' else 'en'
+        payloads['translate_audio'] = [
+            {
+                # app.py only takes base64; app_offline.py also takes binary frames
+                'audio': clip if args.binary else base64.b64encode(clip).decode('ascii'),
+                'source_lang': args.speech_lang,
+                'target_lang': target_lang
+            }
+            for clip in clips.values()
+        ]
+    return payloads
+
+
+class Recorder:
+    """Thread-safe outcome log of every request"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.samples = []   # (event, outcome, response seconds, service seconds)
+        self.connect_errors = 0
+
+    def record(self, event, outcome, response_seconds, service_seconds):
+        with self.lock:
+            self.samples.append((event, outcome, response_seconds, service_seconds))
+
+    def report(self, wall_seconds):
+        results = {}
+        for event in RESULT_EVENTS:
+            samples = [sample for sample in self.samples if sample[0] == event]
+            if not samples:
+                continue
+            ok = [sample for sample in samples if sample[1] == 'ok']
+            outcomes = {}
+            for sample in samples:
+                outcomes[sample[1]] = outcomes.get(sample[1], 0) + 1
+            results[event] = {
+                'requests': len(samples),
+                'outcomes': outcomes,
+                'error_rate': round(1 - len(ok) / len(samples), 4),
+                'response': summarize([sample[2] for sample in ok], wall_seconds),
+                'service': summarize([sample[3] for sample in ok], wall_seconds)
+            }
+        return results
+
+
+class LoadClient(threading.Thread):
+    """One Socket.IO connection taking due requests off the shared schedule"""
+
+    def __init__(self, args, schedule, recorder, stop):
+        super().__init__(daemon=True)
+        self.args = args
+        self.schedule = schedule
+        self.recorder = recorder
+        self.stop = stop
+        self.results = queue.SimpleQueue()
+
+    def connect(self):
+        import socketio
+
+        client = socketio.Client(reconnection=False)
+        for event in RESULT_EVENTS.values():
+            client.on(event, lambda payload, event=event: self.results.put((event, payload)))
+        transports = ['websocket'] if self.args.websocket else None
+        client.connect(self.args.url, transports=transports, wait_timeout=self.args.timeout)
+        return client
+
+    def run(self):
+        try:
+            client = self.connect()
+        except Exception as e:
+            print(f"✗ Connection failed: {e}")
+            with self.recorder.lock:
+                self.recorder.connect_errors += 1
+            return
+
+        try:
+            while not self.stop.is_set():
+                try:
+                    due, event, payload = self.schedule.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+                self.send(client, due, event, payload)
+        finally:
+            client.disconnect()
+
+    def send(self, client, due, event, payload):
+        # Drop results of requests that already timed out
+        while not self.results.empty():
+            self.results.get()
+
+        sent = time.perf_counter()
+        if due is None:
+            due = sent  # closed loop: nothing is due before a client is free
+        try:
+            client.emit(event, payload)
+        except Exception:
+            self.recorder.record(event, 'disconnected', 0.0, 0.0)
+            return
+
+        expected = RESULT_EVENTS[event]
+        deadline = sent + self.args.timeout
+        while True:
+            try:
+                name, result = self.results.get(timeout=max(0.0, deadline - time.perf_counter()))
+            except queue.Empty:
+                self.recorder.record(event, 'timeout', 0.0, 0.0)
+                return
+            if name == expected:
+                break
+
+        finished = time.perf_counter()
+        if isinstance(result, dict) and result.get('busy'):
+            outcome = 'busy'
+        elif isinstance(result, dict) and 'error' in result:
+            outcome = 'error'
+        else:
+            outcome = 'ok'
+        self.recorder.record(event, outcome, finished - due, finished - sent)
+
+
+def produce(args, payloads, schedule, stop):
+    """Put (due time, event, payload) on the schedule at the target rate (due is None in closed loop)"""
+    events = list(payloads)
+    weights = [args.mix[event] for event in events]
+    cursors = dict.fromkeys(events, 0)
+    rng = random.Random(args.seed)
+
+    started = time.perf_counter()
+    due = started
+    sent = 0
+    while not stop.is_set():
+        now = time.perf_counter()
+        if now - started >= args.duration or (args.requests and sent >= args.requests):
+            break
+
+        event = rng.choices(events, weights)[0]
+        payload = payloads[event][cursors[event] % len(payloads[event])]
+        cursors[event] += 1
+
+        if args.rate > 0:
+            # Open loop: requests are due on a fixed (or Poisson) timetable
+            due += rng.expovariate(args.rate) if args.poisson else 1.0 / args.rate
+            if due > now:
+                time.sleep(due - now)
+            schedule.put((due, event, payload))
+        else:
+            # Closed loop: keep one request waiting for each client
+            while schedule.qsize() >= args.clients and not stop.is_set():
+                time.sleep(0.001)
+            schedule.put((None, event, payload))
+        sent += 1
+    return sent
+
+
+def print_report(results, recorder, wall_seconds):
+    print(f"\n{'request':<16} {'count':>6} {'errors':>7} {'rate/s':>8} "
+          f"{'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}   (response latency)")
+    for event, result in results.items():
+        response = result['response']
+        print(f"{event:<16} {result['requests']:>6} {result['error_rate']:>7.1%} "
+              f"{response['throughput_per_s']:>8.2f} {response['p50_ms']:>9.2f} "
+              f"{response['p95_ms']:>9.2f} {response['p99_ms']:>9.2f}")
+        failures = {outcome: count for outcome, count in result['outcomes'].items() if outcome != 'ok'}
+        if failures:
+            print(f"{'':<16} " + ', '.join(f"{outcome}: {count}" for outcome, count in sorted(failures.items())))
+    if recorder.connect_errors:
+        print(f"\n✗ {recorder.connect_errors} client(s) could not connect")
+    print(f"\nWall time {wall_seconds:.1f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--url', default='http://localhost:8081', help='server to load (app.py listens on 8080)')
+    parser.add_argument('--clients', type=int, default=10, help='concurrent Socket.IO connections')
+    parser.add_argument('--rate', type=float, default=5.0,
+                        help='requests per second across all clients (0 = as fast as the clients go)')
+    parser.add_argument('--poisson', action='store_true', help='exponential inter-arrival times instead of fixed')
+    parser.add_argument('--duration', type=float, default=30.0, help='seconds to generate load for')
+    parser.add_argument('--requests', type=int, default=0, help='stop after this many requests (0 = no limit)')
+    parser.add_argument('--mix', type=parse_mix, default=parse_mix('text=0.7,audio=0.3'),
+                        help="request weights, e.g. 'text=0.7,audio=0.3'")
+    parser.add_argument('--speech-lang', default='en', choices=['en', 'zh'])
+    parser.add_argument('--audio-lengths', type=float, nargs='+', default=[1, 5, 15],
+                        help='generated clip lengths in seconds')
+    parser.add_argument('--wav-dir', help='replay these .wav files instead of generated fixtures')
+    parser.add_argument('--binary', action='store_true', help='send audio as binary frames (app_offline.py only)')
+    parser.add_argument('--websocket', action='store_true', help='skip long-polling (needed under gunicorn)')
+    parser.add_argument('--timeout', type=float, default=60.0, help='seconds to wait for each result')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help='write the results as JSON to this file')
+    args = parser.parse_args()
+
+    if importlib.util.find_spec('socketio') is None:
+        print('✗ The Socket.IO client is required: pip install "python-socketio[client]"')
+        return 1
+
+    payloads = build_payloads(args)
+    schedule = queue.Queue()
+    recorder = Recorder()
+    stop = threading.Event()
+
+    clients = [LoadClient(args, schedule, recorder, stop) for _ in range(args.clients)]
+    for client in clients:
+        client.start()
+
+    print(f"\nLoad test: {args.url}, {args.clients} client(s), "
+          f"{f'{args.rate:g} req/s' if args.rate > 0 else 'closed loop'}, {args.duration:g}s\n")
+    started = time.perf_counter()
+    try:
+        sent = produce(args, payloads, schedule, stop)
+        # Let the requests already due finish (or time out)
+        while not schedule.empty() and time.perf_counter() - started < args.duration + args.timeout:
+            time.sleep(0.1)
+    except KeyboardInterrupt:
+        sent = None
+    stop.set()
+    for client in clients:
+        client.join(args.timeout + 1)
+    wall_seconds = time.perf_counter() - started
+
+    results = recorder.report(wall_seconds)
+    print_report(results, recorder, wall_seconds)
+
+    if args.output:
+        report = {
+            'meta': {
+                'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+                'commit': git_commit(),
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'url': args.url,
+                'clients': args.clients,
+                'rate': args.rate,
+                'poisson': args.poisson,
+                'duration': args.duration,
+                'mix': args.mix,
+                'scheduled': sent,
+                'wall_seconds': round(wall_seconds, 2),
+                'connect_errors': recorder.connect_errors
+            },
+            'results': results
+        }
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"\n✓ Results written to {args.output}")
+    print()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
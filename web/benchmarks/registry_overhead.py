@@ -0,0 +1,93 @@
+"""
+Per-call translator lookup overhead: linear scan vs TranslatorRegistry
+
+Before: every request calls get_installed_languages(), scans the list for the
+source/target language and calls get_translation().
+After: TranslatorRegistry.get() returns the prebuilt Translation from a dict.
+
+Usage (from web/):
+    python -m benchmarks.registry_overhead [--iterations 200] [--text "thank you"]
+"""
+
+import argparse
+import statistics
+import sys
+import time
+
+from translator_registry import TranslatorRegistry
+
+
+def lookup_by_scan(source_lang, target_lang):
+    """The per-call lookup the apps used before the registry"""
+    import argostranslate.translate
+
+    installed_languages = argostranslate.translate.get_installed_languages()
+    from_lang = None
+    to_lang = None
+    for lang in installed_languages:
+        if lang.code == source_lang:
+            from_lang = lang
+        if lang.code == target_lang:
+            to_lang = lang
+    if from_lang is None or to_lang is None:
+        return None
+    return from_lang.get_translation(to_lang)
+
+
+def time_calls(fn, iterations):
+    """Run fn() `iterations` times and return per-call times in milliseconds"""
+    times = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - started) * 1000)
+    return times
+
+
+def report(label, times):
+    times = sorted(times)
+    p95 = times[min(len(times) - 1, int(len(times) * 0.95))]
+    print(f"  {label:<28} mean {statistics.mean(times):9.3f} ms   "
+          f"p50 {statistics.median(times):9.3f} ms   p95 {p95:9.3f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--source', default='en')
+    parser.add_argument('--target', default='zh')
+    parser.add_argument('--iterations', type=int, default=200)
+    parser.add_argument('--text', default='thank you',
+                        help='short phrase used to time a full translation for comparison')
+    args = parser.parse_args()
+
+    try:
+        import argostranslate.translate  # noqa: F401
+    except ImportError:
+        print("✗ argostranslate not installed - run: pip install argostranslate")
+        return 1
+
+    pair = (args.source, args.target)
+    registry = TranslatorRegistry(pairs=[pair])
+    registry.build()
+    translation = registry.get(*pair)
+    if translation is None:
+        print(f"✗ No translation package installed for {args.source}→{args.target}")
+        return 1
+
+    print(f"\nLookup overhead for {args.source}→{args.target} ({args.iterations} calls)\n")
+    scan_times = time_calls(lambda: lookup_by_scan(*pair), args.iterations)
+    registry_times = time_calls(lambda: registry.get(*pair), args.iterations)
+    translate_times = time_calls(lambda: translation.translate(args.text), max(1, args.iterations // 10))
+
+    report("before: scan per call", scan_times)
+    report("after: registry.get", registry_times)
+    report(f"translate({args.text!r})", translate_times)
+
+    saved = statistics.mean(scan_times) - statistics.mean(registry_times)
+    print(f"\n  Saved per call: {saved:.3f} ms "
+          f"({saved / statistics.mean(translate_times) * 100:.0f}% of a short-phrase translation)\n")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,136 @@
+"""
+Memory vs gunicorn worker count, with Vosk models preloaded in the master
+
+Starts `gunicorn -c gunicorn.conf.py app_offline:app` with 1, 2, 4... workers,
+waits for /health, loads the models in every worker with a few requests and
+then reads RSS and PSS of the master and its workers from /proc (Linux only).
+
+RSS counts shared pages once per process, so it overstates the total; PSS
+splits each shared page between the processes sharing it and adds up to the
+real footprint. With copy-on-write sharing the PSS total should grow by far
+less than one model set per extra worker; Argos models are loaded per worker
+(after fork) and are not shared.
+
+Usage (from web/):
+    python -m benchmarks.rss_vs_workers [--workers 1 2 4] [--port 8090]
+"""
+
+import argparse
+import json
+import os
+import signal
+import subprocess
+import sys
+import time
+import urllib.request
+
+
+def read_memory_kb(pid):
+    """(rss_kb, pss_kb) of one process from /proc"""
+    rss = pss = 0
+    try:
+        with open(f'/proc/{pid}/smaps_rollup') as f:
+            for line in f:
+                if line.startswith('Rss:'):
+                    rss = int(line.split()[1])
+                elif line.startswith('Pss:'):
+                    pss = int(line.split()[1])
+    except FileNotFoundError:
+        with open(f'/proc/{pid}/status') as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    rss = pss = int(line.split()[1])
+    return rss, pss
+
+
+def child_pids(pid):
+    try:
+        with open(f'/proc/{pid}/task/{pid}/children') as f:
+            return [int(child) for child in f.read().split()]
+    except FileNotFoundError:
+        return []
+
+
+def wait_ready(url, timeout):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(url + '/health', timeout=2) as response:
+                return json.load(response)
+        except OSError:
+            time.sleep(0.5)
+    raise TimeoutError(f"server at {url} not ready after {timeout}s")
+
+
+def measure(workers, port, timeout, requests_per_worker):
+    """Start gunicorn with `workers` workers and return a result row"""
+    env = dict(os.environ, WEB_CONCURRENCY=str(workers), PORT=str(port))
+    started = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, '-m', 'gunicorn', '-c', 'gunicorn.conf.py', 'app_offline:app'],
+        env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        url = f'http://127.0.0.1:{port}'
+        wait_ready(url, timeout)
+        ready_seconds = time.perf_counter() - started
+
+        # Touch every worker so lazily-created state exists before measuring
+        for _ in range(workers * requests_per_worker):
+            urllib.request.urlopen(url + '/status', timeout=10).read()
+
+        pids = child_pids(server.pid)
+        master = read_memory_kb(server.pid)
+        per_worker = [read_memory_kb(pid) for pid in pids]
+        return {
+            'workers': workers,
+            'ready_seconds': round(ready_seconds, 1),
+            'master_rss_mb': round(master[0] / 1024, 1),
+            'worker_rss_mb': [round(rss / 1024, 1) for rss, _ in per_worker],
+            'total_rss_mb': round((master[0] + sum(rss for rss, _ in per_worker)) / 1024, 1),
+            'total_pss_mb': round((master[1] + sum(pss for _, pss in per_worker)) / 1024, 1)
+        }
+    finally:
+        server.send_signal(signal.SIGTERM)
+        try:
+            server.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            server.kill()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4])
+    parser.add_argument('--port', type=int, default=8090)
+    parser.add_argument('--timeout', type=float, default=300, help='seconds to wait for startup')
+    parser.add_argument('--requests-per-worker', type=int, default=4)
+    parser.add_argument('--json', action='store_true', help='print the rows as JSON')
+    args = parser.parse_args()
+
+    if not os.path.exists('/proc/self/status'):
+        print("✗ /proc not available - this benchmark needs Linux")
+        return 1
+
+    rows = []
+    for workers in args.workers:
+        print(f"Measuring {workers} worker(s)...", file=sys.stderr)
+        rows.append(measure(workers, args.port, args.timeout, args.requests_per_worker))
+
+    if args.json:
+        print(json.dumps(rows, indent=2))
+        return 0
+
+    print(f"\n  {'workers':>7} {'ready s':>8} {'master RSS':>11} {'total RSS':>10} "
+          f"{'total PSS':>10} {'PSS/extra worker':>17}")
+    base = rows[0]
+    for row in rows:
+        extra = row['workers'] - base['workers']
+        delta = (row['total_pss_mb'] - base['total_pss_mb']) / extra if extra else 0.0
+        print(f"  {row['workers']:>7} {row['ready_seconds']:>8} {row['master_rss_mb']:>9} MB "
+              f"{row['total_rss_mb']:>7} MB {row['total_pss_mb']:>7} MB {delta:>14.1f} MB")
+    print()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,253 @@
+"""
+Offline translator benchmark suite - translation, recognition and end-to-end
+
+Measures p50/p95/p99 latency and throughput of:
+  translate   OfflineTranslator.translate on the fixed corpus (short/long, en/zh)
+  recognize   OfflineSpeechRecognizer.recognize on generated WAV fixtures
+  e2e         the translate_audio Socket.IO handler (Flask-SocketIO test client)
+
+The translation cache is disabled unless --cache is given, so repeated corpus
+sentences measure the model rather than a dict lookup.
+
+Usage (from web/):
+    python -m benchmarks.run --stub                      # no models needed
+    python -m benchmarks.run --output results/today.json
+    python -m benchmarks.run --baseline results/last.json --suites translate
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+SUITES = ('translate', 'recognize', 'e2e')
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, int(round(pct / 100.0 * len(sorted_values) + 0.5)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def summarize(latencies, wall_seconds, units=None):
+    """Latency percentiles (ms) and throughput for one benchmark case"""
+    values = sorted(seconds * 1000 for seconds in latencies)
+    result = {
+        'count': len(values),
+        'mean_ms': round(sum(values) / len(values), 2) if values else 0.0,
+        'p50_ms': round(percentile(values, 50), 2),
+        'p95_ms': round(percentile(values, 95), 2),
+        'p99_ms': round(percentile(values, 99), 2),
+        'max_ms': round(values[-1], 2) if values else 0.0,
+        'throughput_per_s': round(len(values) / wall_seconds, 2) if wall_seconds else 0.0
+    }
+    if units is not None:
+        # e.g. seconds of audio processed per wall-clock second
+        result['units_per_s'] = round(units / wall_seconds, 2) if wall_seconds else 0.0
+    return result
+
+
+def run_timed(fn, items, iterations, concurrency):
+    """Call fn(item) for every item, `iterations` times; returns (latencies, wall seconds)"""
+    work = [item for _ in range(iterations) for item in items]
+
+    def timed(item):
+        started = time.perf_counter()
+        fn(item)
+        return time.perf_counter() - started
+
+    started = time.perf_counter()
+    if concurrency > 1:
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            latencies = list(executor.map(timed, work))
+    else:
+        latencies = [timed(item) for item in work]
+    return latencies, time.perf_counter() - started
+
+
+def bench_translate(translator, args):
+    from benchmarks import corpus
+
+    results = {}
+    for source_lang, target_lang in corpus.pairs():
+        for length in ('short', 'long'):
+            texts = corpus.sentences(source_lang, length)
+            # Untimed pass so model loading doesn't land in the first sample
+            translator.translate(texts[0], source_lang, target_lang)
+            latencies, wall = run_timed(
+                lambda text: translator.translate(text, source_lang, target_lang),
+                texts, args.iterations, args.concurrency
+            )
+            name = f'{source_lang}-{target_lang}/{length}'
+            results[name] = summarize(latencies, wall)
+            print_case('translate', name, results[name])
+    return results
+
+
+def bench_recognize(recognizer, clips, args):
+    from audio_ingest import load_pcm
+    from benchmarks.fixtures import duration
+
+    results = {}
+    language = args.speech_lang
+    for name, clip in clips.items():
+        pcm, _ = load_pcm(clip)
+        recognizer.recognize(pcm, language)
+        latencies, wall = run_timed(
+            lambda _: recognizer.recognize(pcm, language),
+            [None], args.iterations, args.concurrency
+        )
+        results[name] = summarize(latencies, wall, units=duration(clip) * len(latencies))
+        print_case('recognize', name, results[name])
+    return results
+
+
+def bench_e2e(app_module, clips, args):
+    from benchmarks.fixtures import duration
+
+    client = app_module.socketio.test_client(app_module.app)
+    client.get_received()
+    source_lang = args.speech_lang
+    target_lang = 'zh' if source_lang == 'en' else 'en'
+
+    def translate_audio(clip):
+        client.emit('translate_audio', {
+            'audio': clip, 'source_lang': source_lang, 'target_lang': target_lang
+        })
+        received = client.get_received()
+        if not any(message['name'] == 'full_translation_result' for message in received):
+            raise RuntimeError('no full_translation_result received')
+
+    results = {}
+    for name, clip in clips.items():
+        translate_audio(clip)
+        # One test client: the handler runs synchronously, so this suite is sequential
+        latencies, wall = run_timed(translate_audio, [clip], args.iterations, 1)
+        results[name] = summarize(latencies, wall, units=duration(clip) * len(latencies))
+        print_case('e2e', name, results[name])
+    client.disconnect()
+    return results
+
+
+def print_case(suite, name, result):
+    print(f"  {suite:<10} {name:<22} p50 {result['p50_ms']:9.2f} ms   p95 {result['p95_ms']:9.2f} ms   "
+          f"p99 {result['p99_ms']:9.2f} ms   {result['throughput_per_s']:8.2f}/s")
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(
+            ['git', 'rev-parse', '--short', 'HEAD'], stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, baseline_path):
+    """Print p50/p95 changes against a previous JSON run"""
+    with open(baseline_path, encoding='utf-8') as f:
+        baseline = json.load(f)['results']
+    print(f"\nChange vs {baseline_path} (negative is faster)\n")
+    for suite, cases in results.items():
+        for name, result in cases.items():
+            before = baseline.get(suite, {}).get(name)
+            if not before:
+                continue
+            deltas = []
+            for key in ('p50_ms', 'p95_ms'):
+                change = (result[key] - before[key]) / before[key] * 100 if before[key] else 0.0
+                deltas.append(f"{key[:3]} {change:+6.1f}%")
+            print(f"  {suite:<10} {name:<22} " + '   '.join(deltas))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--suites', nargs='+', choices=SUITES, default=list(SUITES))
+    parser.add_argument('--stub', action='store_true', help='use stub backends instead of the real models')
+    parser.add_argument('--iterations', type=int, default=5, help='passes over each corpus / clip')
+    parser.add_argument('--concurrency', type=int, default=1, help='parallel callers (translate/recognize)')
+    parser.add_argument('--speech-lang', default='en', choices=['en', 'zh'])
+    parser.add_argument('--wav-dir', help='benchmark these .wav files instead of generated fixtures')
+    parser.add_argument('--cache', action='store_true', help='keep the translation cache enabled')
+    parser.add_argument('--output', help='write the results as JSON to this file')
+    parser.add_argument('--baseline', help='previous JSON results to compare against')
+    args = parser.parse_args()
+
+    # Must be set before the app modules read their configuration
+    if not args.cache:
+        os.environ['TRANSLATION_CACHE_SIZE'] = '0'
+    if args.stub:
+        from benchmarks import stubs
+        stubs.install()
+
+    from benchmarks import fixtures
+    clips = fixtures.load_dir(args.wav_dir) if args.wav_dir else fixtures.generate()
+
+    app_module = None
+    if 'e2e' in args.suites:
+        try:
+            import app_offline as app_module
+        except ImportError as e:
+            print(f"✗ Skipping e2e suite: {e}")
+            args.suites = [suite for suite in args.suites if suite != 'e2e']
+
+    if app_module is not None:
+        translator, recognizer = app_module.translator, app_module.recognizer
+    else:
+        from offline_engine import OfflineSpeechRecognizer, OfflineTranslator
+        translator = OfflineTranslator() if 'translate' in args.suites else None
+        recognizer = OfflineSpeechRecognizer() if 'recognize' in args.suites else None
+
+    print(f"\nBenchmarks ({'stub backends' if args.stub else 'real models'}, "
+          f"{args.iterations} iteration(s), concurrency {args.concurrency})\n")
+
+    results = {}
+    if 'translate' in args.suites:
+        if translator.setup_complete:
+            results['translate'] = bench_translate(translator, args)
+        else:
+            print("✗ Skipping translate suite: translation models not available")
+    if 'recognize' in args.suites:
+        if recognizer.has_language(args.speech_lang):
+            results['recognize'] = bench_recognize(recognizer, clips, args)
+        else:
+            print(f"✗ Skipping recognize suite: no {args.speech_lang} speech model")
+    if 'e2e' in args.suites:
+        results['e2e'] = bench_e2e(app_module, clips, args)
+
+    report = {
+        'meta': {
+            'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'commit': git_commit(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'stub': args.stub,
+            'iterations': args.iterations,
+            'concurrency': args.concurrency,
+            'cache': args.cache,
+            'clips': sorted(clips)
+        },
+        'results': results
+    }
+
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"\n✓ Results written to {args.output}")
+    if args.baseline:
+        compare(results, args.baseline)
+    print()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,206 @@
+"""
+Stub Argos Translate and Vosk backends for benchmarking without the models
+
+install() puts minimal argostranslate and vosk modules into sys.modules before
+the app modules are imported. They model the cost of the real libraries with
+sleeps (which, like the native decoders, release the GIL), so the numbers
+measure the app's own overhead, batching and pipelining rather than the
+models. Stub results are not comparable with runs against the real models.
+
+The translation stub has the shape of Argos 1.10: get_translation() returns a
+CachedTranslation wrapping a PackageTranslation whose CTranslate2 translator
+is created on first use. Like the real translator, each call costs a fixed
+overhead plus the longest text, extra texts in a batch are cheap, and only
+ARGOS_INTER_THREADS calls (default 1) decode at the same time - so the
+benchmark shows whether batching pays off.
+"""
+
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import types
+from pathlib import Path
+
+# Translation: fixed cost per CTranslate2 call plus a cost per input character
+TRANSLATE_BASE_MS = 15.0
+TRANSLATE_PER_CHAR_MS = 0.4
+# Each text after the longest in a batch costs this fraction of running it alone
+BATCH_ITEM_FACTOR = 0.25
+
+# Recognition: decode time as a fraction of the audio duration
+RECOGNIZE_REALTIME_FACTOR = 0.1
+
+# The stub recognizer finalizes an utterance every two seconds of audio
+UTTERANCE_BYTES = 2 * 16000 * 2
+
+
+class StubTokenizer:
+    """Characters as tokens"""
+
+    def encode(self, text):
+        return list(text)
+
+    def decode(self, tokens):
+        return ''.join(tokens)
+
+
+class StubTranslationResult:
+    def __init__(self, tokens):
+        self.hypotheses = [tokens]
+
+
+class StubCTranslator:
+    """ctranslate2.Translator: batched calls, inter_threads of them at a time"""
+
+    def __init__(self, target_lang, inter_threads):
+        self.target_lang = target_lang
+        self._slots = threading.BoundedSemaphore(max(1, inter_threads))
+
+    def translate_batch(self, source, target_prefix=None, **options):
+        lengths = sorted((len(tokens) for tokens in source), reverse=True)
+        chars = lengths[0] + BATCH_ITEM_FACTOR * sum(lengths[1:]) if lengths else 0
+        with self._slots:
+            time.sleep((TRANSLATE_BASE_MS + TRANSLATE_PER_CHAR_MS * chars) / 1000)
+        prefix = list(f"[{self.target_lang}] ")
+        return [StubTranslationResult(prefix + list(tokens)) for tokens in source]
+
+
+class StubPackage:
+    def __init__(self, from_code, to_code, package_path=None):
+        self.from_code = from_code
+        self.to_code = to_code
+        self.package_path = package_path
+        self.tokenizer = StubTokenizer()
+        self.target_prefix = ''
+
+
+class StubPackageTranslation:
+    """argostranslate.translate.PackageTranslation: loads its translator lazily"""
+
+    def __init__(self, pkg, inter_threads):
+        self.pkg = pkg
+        self.translator = None
+        self.inter_threads = inter_threads
+
+    def translate(self, text):
+        if self.translator is None:
+            self.translator = StubCTranslator(self.pkg.to_code, self.inter_threads)
+        tokens = self.pkg.tokenizer.encode(text)
+        result = self.translator.translate_batch([tokens])[0]
+        return self.pkg.tokenizer.decode(result.hypotheses[0])
+
+
+class StubCachedTranslation:
+    """argostranslate.translate.CachedTranslation: wraps the real translation"""
+
+    def __init__(self, underlying):
+        self.underlying = underlying
+
+    def translate(self, text):
+        return self.underlying.translate(text)
+
+
+class StubLanguage:
+    def __init__(self, code, packages, inter_threads):
+        self.code = code
+        self.packages = packages
+        self.inter_threads = inter_threads
+
+    def get_translation(self, to_lang):
+        pkg = self.packages.get((self.code, to_lang.code))
+        if pkg is None:
+            return None
+        return StubCachedTranslation(StubPackageTranslation(pkg, self.inter_threads))
+
+
+class StubModel:
+    def __init__(self, path=None):
+        self.path = path
+
+
+class StubRecognizer:
+    def __init__(self, model, sample_rate):
+        self.sample_rate = sample_rate
+        self.pending = 0
+
+    def AcceptWaveform(self, data):
+        size = len(data)
+        time.sleep(size / (self.sample_rate * 2) * RECOGNIZE_REALTIME_FACTOR)
+        self.pending += size
+        return self.pending >= UTTERANCE_BYTES
+
+    def Result(self):
+        words = max(1, self.pending // 8000)
+        self.pending = 0
+        return json.dumps({'text': ' '.join(['word'] * words)})
+
+    def PartialResult(self):
+        return json.dumps({'partial': ' '.join(['word'] * (self.pending // 8000))})
+
+    def FinalResult(self):
+        if not self.pending:
+            return json.dumps({'text': ''})
+        return self.Result()
+
+    def Reset(self):
+        self.pending = 0
+
+    def SetWords(self, enabled):
+        pass
+
+
+def install(languages=('en', 'zh')):
+    """Register the stub modules and fake model directories; call before importing the app"""
+    root = tempfile.mkdtemp(prefix='translator-bench-')
+
+    argostranslate = types.ModuleType('argostranslate')
+    translate = types.ModuleType('argostranslate.translate')
+    package = types.ModuleType('argostranslate.package')
+    settings = types.ModuleType('argostranslate.settings')
+    settings.package_data_dir = os.path.join(root, 'argos')
+    settings.package_dirs = [settings.package_data_dir]
+    settings.inter_threads = int(os.getenv('ARGOS_INTER_THREADS', 1))
+
+    packages = {}
+    for source in languages:
+        for target in languages:
+            if source != target:
+                # A small model file, so package sizes are not zero
+                path = Path(settings.package_data_dir) / f'translate-{source}_{target}'
+                (path / 'model').mkdir(parents=True, exist_ok=True)
+                (path / 'model' / 'model.bin').write_bytes(b'\0' * 1024 * 1024)
+                packages[(source, target)] = StubPackage(source, target, path)
+    translate.get_installed_languages = lambda: [
+        StubLanguage(code, packages, settings.inter_threads) for code in languages
+    ]
+    package.get_installed_packages = lambda: list(packages.values())
+    argostranslate.translate = translate
+    argostranslate.package = package
+    argostranslate.settings = settings
+
+    vosk = types.ModuleType('vosk')
+    vosk.Model = StubModel
+    vosk.KaldiRecognizer = StubRecognizer
+
+    sys.modules.update({
+        'argostranslate': argostranslate,
+        'argostranslate.translate': translate,
+        'argostranslate.package': package,
+        'argostranslate.settings': settings,
+        'vosk': vosk
+    })
+
+    # The speech models are found by directory name from the manifest
+    # (VOSK_MODELS_DIR is read when model_manifest is first imported)
+    models_dir = os.path.join(root, 'vosk')
+    os.environ['VOSK_MODELS_DIR'] = models_dir
+    from model_manifest import load_manifest
+    for language, model in load_manifest()['speech'].items():
+        path = os.path.join(models_dir, model['name'])
+        os.makedirs(path, exist_ok=True)
+        # app.py takes the model paths one by one
+        os.environ[f'VOSK_MODEL_{language.upper()}'] = path
+    return root
@@ -0,0 +1,73 @@
+"""
+Gunicorn config for app_offline - models load once in the master, then fork
+
+    gunicorn -c gunicorn.conf.py app_offline:app
+
+With preload_app the master imports app_offline (and, via MODEL_PRELOAD,
+loads the Vosk models) before forking, so the workers share the read-only
+model pages copy-on-write and each extra worker costs only its own Python
+heap. Background threads (micro-batcher, segment executor) are not started by
+the import; they start lazily inside each worker.
+
+Argos models are not preloaded in the master: CTranslate2 starts native
+threads when it loads a model, and those do not survive fork(). Each worker
+warms its own Argos pairs once it has started instead, so they are not shared.
+
+Every worker is a separate Socket.IO server, so clients use the websocket
+transport only: long-polling would need sticky sessions across workers.
+"""
+
+import os
+
+# Must run before app_offline is imported in the master, or the locks and
+# threads it creates would be unpatched
+from gevent import monkey
+monkey.patch_all()
+
+# Read by app_offline at import time (preload happens after this file runs)
+os.environ.setdefault('SOCKETIO_ASYNC_MODE', 'gevent')
+os.environ.setdefault('SOCKETIO_WEBSOCKET_ONLY', '1')
+# CTranslate2 must not load before fork (see above): the master preloads only
+# Vosk, and each worker warms the Argos pairs itself in post_worker_init
+preload = os.environ.setdefault('MODEL_PRELOAD', '1').strip().lower()
+preload_all = preload in ('1', 'true', 'yes', 'all')
+warm_argos_in_workers = preload_all or 'argos' in preload
+os.environ['MODEL_PRELOAD'] = 'vosk' if preload_all or 'vosk' in preload else '0'
+# A model unloaded and reloaded in a worker is no longer shared with the others
+os.environ.setdefault('MODEL_IDLE_SECONDS', '0')
+
+# A process pool created in the master would be shared by every worker
+if os.getenv('INFERENCE_POOL', '').lower() in ('1', 'true', 'yes'):
+    print("✗ INFERENCE_POOL is not supported under gunicorn - using in-process inference")
+    os.environ['INFERENCE_POOL'] = '0'
+
+bind = f"0.0.0.0:{os.getenv('PORT', 8081)}"
+workers = int(os.getenv('WEB_CONCURRENCY', 2))
+worker_class = 'geventwebsocket.gunicorn.workers.GeventWebSocketWorker'
+worker_connections = int(os.getenv('WORKER_CONNECTIONS', 100))
+preload_app = True
+
+# Long recognitions must not get a busy worker killed
+timeout = int(os.getenv('GUNICORN_TIMEOUT', 120))
+graceful_timeout = 30
+keepalive = 5
+
+accesslog = '-'
+errorlog = '-'
+
+
+def when_ready(server):
+    server.log.info("Vosk models loaded in master (pid %s), forking %s worker(s)", os.getpid(), workers)
+
+
+def post_fork(server, worker):
+    server.log.info("Worker %s forked from preloaded master", worker.pid)
+
+
+def post_worker_init(worker):
+    # Runs in the worker after gevent has re-initialised its hub and threadpool,
+    # so CTranslate2's threads belong to this process
+    if warm_argos_in_workers:
+        from offline_engine import preload_models
+        preload_models(['argos'])
+        worker.log.info("Worker %s warmed its Argos models", worker.pid)
@@ -0,0 +1,256 @@
+"""
+Metrics - Prometheus text-format counters, gauges and histograms
+
+A small in-process registry so /metrics needs no extra dependency. Metrics are
+per process: under gunicorn every worker keeps its own values, and Prometheus
+sees whichever worker answers the scrape (add a pod/worker label on the
+scrape side, or run one worker per pod when exact numbers matter).
+"""
+
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+
+# Seconds; covers a cached phrase (sub-ms) up to a long clip (tens of seconds)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(names, values, extra=None):
+    pairs = list(zip(names, values))
+    if extra:
+        pairs.append(extra)
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in pairs) + '}'
+
+
+def _format_value(value):
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    kind = None
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children = {}
+        self._lock = threading.Lock()
+
+    def labels(self, *values):
+        """The child metric for one combination of label values"""
+        if len(values) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {values}")
+        key = tuple(str(value) for value in values)
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(key, self._new_child())
+        return child
+
+    def _default(self):
+        # Unlabelled metrics are used directly, without .labels()
+        return self.labels()
+
+    def render(self):
+        lines = [f'# HELP {self.name} {self.documentation}', f'# TYPE {self.name} {self.kind}']
+        for key, child in sorted(self._children.items()):
+            lines.extend(child.render(self.name, self.labelnames, key))
+        return lines
+
+
+class _CounterChild:
+    def __init__(self):
+        self.value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount=1.0):
+        with self._lock:
+            self.value += amount
+
+    def render(self, name, labelnames, key):
+        return [f'{name}{_format_labels(labelnames, key)} {_format_value(self.value)}']
+
+
+class Counter(_Metric):
+    kind = 'counter'
+
+    def _new_child(self):
+        return _CounterChild()
+
+    def inc(self, amount=1.0):
+        self._default().inc(amount)
+
+
+class _GaugeChild(_CounterChild):
+    def dec(self, amount=1.0):
+        self.inc(-amount)
+
+    def set(self, value):
+        with self._lock:
+            self.value = value
+
+
+class Gauge(_Metric):
+    """A value that goes up and down; `function` reads it at scrape time instead"""
+
+    kind = 'gauge'
+
+    def __init__(self, name, documentation, labelnames=(), function=None):
+        super().__init__(name, documentation, labelnames)
+        # function() -> value, or {label values tuple: value} for labelled gauges
+        self.function = function
+
+    def _new_child(self):
+        return _GaugeChild()
+
+    def inc(self, amount=1.0):
+        self._default().inc(amount)
+
+    def dec(self, amount=1.0):
+        self._default().dec(amount)
+
+    def set(self, value):
+        self._default().set(value)
+
+    def render(self):
+        if self.function is not None:
+            try:
+                values = self.function()
+            except Exception:
+                values = None
+            if isinstance(values, dict):
+                for key, value in values.items():
+                    self.labels(*(key if isinstance(key, tuple) else (key,))).set(value)
+            elif values is not None:
+                self.set(values)
+        return super().render()
+
+
+class _HistogramChild:
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            if index < len(self.counts):
+                self.counts[index] += 1
+            self.count += 1
+            self.sum += value
+
+    @contextmanager
+    def time(self):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started)
+
+    def render(self, name, labelnames, key):
+        with self._lock:
+            counts, count, total = list(self.counts), self.count, self.sum
+        lines = []
+        cumulative = 0
+        for bound, bucket_count in zip(self.buckets, counts):
+            cumulative += bucket_count
+            lines.append(f'{name}_bucket{_format_labels(labelnames, key, ("le", _format_value(bound)))} '
+                         f'{cumulative}')
+        lines.append(f'{name}_bucket{_format_labels(labelnames, key, ("le", "+Inf"))} {count}')
+        lines.append(f'{name}_sum{_format_labels(labelnames, key)} {_format_value(total)}')
+        lines.append(f'{name}_count{_format_labels(labelnames, key)} {count}')
+        return lines
+
+
+class Histogram(_Metric):
+    kind = 'histogram'
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new_child(self):
+        return _HistogramChild(self.buckets)
+
+    def observe(self, value):
+        self._default().observe(value)
+
+    def time(self):
+        return self._default().time()
+
+
+class Registry:
+    """Ordered collection of metrics rendered together for /metrics"""
+
+    CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+    def __init__(self):
+        self._metrics = []
+
+    def register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def render(self):
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+
+REGISTRY = Registry()
+
+# Stage latencies
+AUDIO_DECODE_SECONDS = REGISTRY.register(Histogram(
+    'translator_audio_decode_seconds',
+    'Time to decode an uploaded clip to 16 kHz mono PCM (including VAD)'
+))
+RECOGNITION_SECONDS = REGISTRY.register(Histogram(
+    'translator_recognition_seconds',
+    'Speech recognition time per clip or segment', ['language']
+))
+TRANSLATION_SECONDS = REGISTRY.register(Histogram(
+    'translator_translation_seconds',
+    'Model translation time per text (cache hits excluded)', ['pair']
+))
+EMIT_SECONDS = REGISTRY.register(Histogram(
+    'translator_emit_seconds',
+    'Time to hand a result to Socket.IO', ['event'],
+    buckets=(0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5)
+))
+
+# Traffic
+REQUESTS = REGISTRY.register(Counter(
+    'translator_requests_total',
+    'Requests by Socket.IO event type and language pair', ['event', 'pair']
+))
+ERRORS = REGISTRY.register(Counter(
+    'translator_errors_total',
+    'Requests answered with an error, by event type and language pair', ['event', 'pair']
+))
+ADMISSION_REJECTED = REGISTRY.register(Counter(
+    'translator_admission_rejected_total',
+    'Requests turned away with a busy result, by limit hit', ['reason']
+))
+CACHE_HITS = REGISTRY.register(Counter(
+    'translator_translation_cache_hits_total',
+    'Translations served from the cache', ['pair']
+))
+
+# Load
+CONNECTED_CLIENTS = REGISTRY.register(Gauge(
+    'translator_connected_clients',
+    'Connected Socket.IO clients'
+))
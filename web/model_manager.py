@@ -0,0 +1,200 @@
+"""
+Model Manager - lazy loading, idle eviction and a memory budget for models
+
+Every Vosk model and Argos language pair is registered with a loader and an
+estimated size instead of being loaded at import time. A model is loaded on
+first use; when loading it would exceed the memory budget, idle models are
+unloaded least-recently-used first. Models that haven't been used for a while
+are unloaded as well. Models in use are never evicted.
+"""
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+
+class ModelBudgetExceeded(MemoryError):
+    """A model does not fit into the budget even after evicting every idle model"""
+
+
+def directory_size(path):
+    """Total size of the files under `path` in bytes (used as a size estimate)"""
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.path.getsize(os.path.join(root, name))
+            except OSError:
+                continue
+    return total
+
+
+class _ModelEntry:
+    __slots__ = ('name', 'loader', 'unloader', 'size_bytes', 'model', 'loading',
+                 'in_use', 'last_used', 'loads', 'load_seconds', 'load_lock')
+
+    def __init__(self, name, loader, unloader, size_bytes):
+        self.name = name
+        self.loader = loader
+        self.unloader = unloader
+        self.size_bytes = size_bytes
+        self.model = None
+        self.loading = False
+        self.in_use = 0
+        self.last_used = 0.0
+        self.loads = 0
+        self.load_seconds = 0.0
+        self.load_lock = threading.Lock()
+
+    @property
+    def resident(self):
+        return self.model is not None or self.loading
+
+
+class ModelManager:
+    """Loads registered models on demand within a memory budget"""
+
+    def __init__(self, budget_mb=None, idle_seconds=None):
+        if budget_mb is None:
+            budget_mb = float(os.getenv('MODEL_MEMORY_BUDGET_MB', 3072))
+        if idle_seconds is None:
+            idle_seconds = float(os.getenv('MODEL_IDLE_SECONDS', 1800))
+        # 0 disables the budget / idle eviction respectively
+        self.budget_bytes = int(budget_mb * 1024 * 1024)
+        self.idle_seconds = idle_seconds
+
+        self._entries = {}
+        self._lock = threading.Lock()
+
+        self.evictions = 0
+
+    def register(self, name, loader, size_bytes, unloader=None):
+        """Make a model available; `loader()` returns it, `unloader(model)` releases it"""
+        with self._lock:
+            self._entries[name] = _ModelEntry(name, loader, unloader, size_bytes)
+
+    def is_registered(self, name):
+        return name in self._entries
+
+    def names(self):
+        return list(self._entries)
+
+    def acquire(self, name):
+        """Return the model, loading it first if needed; pair with release()"""
+        entry = self._entries[name]
+        with entry.load_lock:
+            with self._lock:
+                self._evict_idle()
+                if entry.model is not None:
+                    entry.in_use += 1
+                    entry.last_used = time.monotonic()
+                    return entry.model
+                self._make_room(entry)
+                # Counted as resident while loading, so concurrent loads respect the budget
+                entry.loading = True
+                entry.in_use += 1
+
+            started = time.perf_counter()
+            try:
+                model = entry.loader()
+            except Exception:
+                with self._lock:
+                    entry.loading = False
+                    entry.in_use -= 1
+                raise
+            elapsed = time.perf_counter() - started
+
+            with self._lock:
+                entry.model = model
+                entry.loading = False
+                entry.loads += 1
+                entry.load_seconds = elapsed
+                entry.last_used = time.monotonic()
+            print(f"✓ Loaded model {name} ({entry.size_bytes / 1048576:.0f} MB) in {elapsed:.2f}s")
+            return model
+
+    def release(self, name):
+        entry = self._entries[name]
+        with self._lock:
+            entry.in_use -= 1
+            entry.last_used = time.monotonic()
+
+    @contextmanager
+    def use(self, name):
+        """Borrow a model for the duration of a `with` block"""
+        model = self.acquire(name)
+        try:
+            yield model
+        finally:
+            self.release(name)
+
+    def preload(self, names=None):
+        """Load models up front (all registered ones by default), within the budget"""
+        for name in names if names is not None else self.names():
+            try:
+                self.acquire(name)
+                self.release(name)
+            except ModelBudgetExceeded as e:
+                print(f"✗ Not preloading {name}: {e}")
+
+    def _resident_bytes(self):
+        return sum(e.size_bytes for e in self._entries.values() if e.resident)
+
+    def _unload(self, entry, reason):
+        model = entry.model
+        entry.model = None
+        self.evictions += 1
+        if entry.unloader is not None:
+            try:
+                entry.unloader(model)
+            except Exception as e:
+                print(f"✗ Error unloading model {entry.name}: {e}")
+        print(f"Unloaded model {entry.name} ({reason})")
+
+    def _make_room(self, entry):
+        """Evict idle models LRU-first until `entry` fits. Called with the lock held."""
+        if not self.budget_bytes:
+            return
+        while self._resident_bytes() + entry.size_bytes > self.budget_bytes:
+            idle = [e for e in self._entries.values()
+                    if e.model is not None and e.in_use == 0 and e is not entry]
+            if not idle:
+                raise ModelBudgetExceeded(
+                    f"Loading {entry.name} ({entry.size_bytes / 1048576:.0f} MB) would exceed the "
+                    f"{self.budget_bytes / 1048576:.0f} MB model budget"
+                )
+            self._unload(min(idle, key=lambda e: e.last_used), 'memory budget')
+
+    def _evict_idle(self):
+        """Unload models unused for idle_seconds. Called with the lock held."""
+        if not self.idle_seconds:
+            return
+        now = time.monotonic()
+        for entry in self._entries.values():
+            if entry.model is not None and entry.in_use == 0 \
+                    and now - entry.last_used > self.idle_seconds:
+                self._unload(entry, 'idle')
+
+    def stats(self):
+        """Resident models and their estimated sizes for /status"""
+        with self._lock:
+            self._evict_idle()
+            now = time.monotonic()
+            return {
+                'budget_mb': round(self.budget_bytes / 1048576),
+                'resident_mb': round(self._resident_bytes() / 1048576, 1),
+                'idle_eviction_seconds': self.idle_seconds,
+                'evictions': self.evictions,
+                'models': {
+                    e.name: {
+                        'loaded': e.model is not None,
+                        'size_mb': round(e.size_bytes / 1048576, 1),
+                        'in_use': e.in_use,
+                        'loads': e.loads,
+                        'load_seconds': round(e.load_seconds, 2),
+                        'idle_seconds': round(now - e.last_used) if e.model is not None else None
+                    }
+                    for e in self._entries.values()
+                }
+            }
@@ -0,0 +1,93 @@
+"""
+Model Manifest - which models the offline app needs, checked without network
+
+models_manifest.json lists the Argos language pairs and Vosk models. At
+startup the app only compares it against what is installed on disk; the
+package index is fetched and models are downloaded only when the app is
+started with --install (or via install_missing() directly).
+"""
+
+import json
+import os
+import time
+
+MANIFEST_PATH = os.getenv(
+    'MODELS_MANIFEST',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'models_manifest.json')
+)
+
+VOSK_MODELS_DIR = os.path.expanduser(os.getenv('VOSK_MODELS_DIR', '~/.vosk/models'))
+
+
+def load_manifest(path=MANIFEST_PATH):
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def translation_pairs(manifest):
+    """(from, to) language pairs in manifest order"""
+    return [(pair['from'], pair['to']) for pair in manifest.get('translation', [])]
+
+
+def speech_models(manifest, models_dir=VOSK_MODELS_DIR):
+    """{language: {'path': ..., 'url': ...}} for the Vosk models"""
+    return {
+        lang: {'path': os.path.join(models_dir, model['name']), 'url': model['url']}
+        for lang, model in manifest.get('speech', {}).items()
+    }
+
+
+def missing_translation_pairs(manifest):
+    """Manifest pairs without an installed Argos package (reads local metadata only)"""
+    import argostranslate.package
+
+    installed = {(pkg.from_code, pkg.to_code)
+                 for pkg in argostranslate.package.get_installed_packages()}
+    return [pair for pair in translation_pairs(manifest) if pair not in installed]
+
+
+def missing_speech_models(manifest, models_dir=VOSK_MODELS_DIR):
+    return {lang: config for lang, config in speech_models(manifest, models_dir).items()
+            if not os.path.exists(config['path'])}
+
+
+def install_missing(manifest, models_dir=VOSK_MODELS_DIR):
+    """Download whatever the manifest lists but the disk lacks (needs network)"""
+    started = time.perf_counter()
+
+    missing_pairs = missing_translation_pairs(manifest)
+    if missing_pairs:
+        import argostranslate.package
+
+        print("Updating translation package index...")
+        argostranslate.package.update_package_index()
+        available = {(pkg.from_code, pkg.to_code): pkg
+                     for pkg in argostranslate.package.get_available_packages()}
+        for from_code, to_code in missing_pairs:
+            package = available.get((from_code, to_code))
+            if package is None:
+                print(f"✗ Warning: Could not find {from_code}→{to_code} package")
+                continue
+            print(f"Installing translation model {from_code}→{to_code}...")
+            argostranslate.package.install_from_path(package.download())
+            print(f"✓ Installed {from_code}→{to_code}")
+
+    missing_models = missing_speech_models(manifest, models_dir)
+    if missing_models:
+        import urllib.request
+        import zipfile
+
+        os.makedirs(models_dir, exist_ok=True)
+        for lang, config in missing_models.items():
+            zip_path = config['path'] + '.zip'
+            print(f"Downloading {lang} speech model from {config['url']}...")
+            urllib.request.urlretrieve(config['url'], zip_path)
+            with zipfile.ZipFile(zip_path) as archive:
+                archive.extractall(models_dir)
+            os.remove(zip_path)
+            print(f"✓ Installed {lang} speech model to {config['path']}")
+
+    if not missing_pairs and not missing_models:
+        print("✓ All models in the manifest are installed")
+    else:
+        print(f"✓ Model installation finished in {time.perf_counter() - started:.1f}s")
@@ -0,0 +1,336 @@
+"""
+Offline inference engine - Argos Translate + Vosk
+
+OfflineTranslator and OfflineSpeechRecognizer hold the models and do the
+actual work. They have no Flask/Socket.IO dependencies so they can be loaded
+both by the web app and by the inference worker processes.
+"""
+
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from audio_ingest import as_waveform, feed_recognizer
+import metrics
+from batching import MicroBatcher
+from model_manager import ModelManager, directory_size
+from model_manifest import load_manifest, speech_models, translation_pairs
+from offload import run_blocking
+from recognizer_pool import RecognizerPool
+from translation_cache import TranslationCache
+from translator_registry import TranslatorRegistry
+from worker_pool import PoolBusy
+
+# Models the app needs, from models_manifest.json
+MANIFEST = load_manifest()
+
+# One memory budget for every Vosk model and Argos pair in this process
+model_manager = ModelManager()
+
+def preload_kinds(value):
+    """Model kinds named by a MODEL_PRELOAD value: '1' = all, 'vosk', 'vosk,argos', ..."""
+    value = value.strip().lower()
+    if value in ('', '0', 'false', 'no'):
+        return []
+    if value in ('1', 'true', 'yes', 'all'):
+        return ['vosk', 'argos']
+    return [kind.strip() for kind in value.split(',') if kind.strip()]
+
+def preload_models(kinds=None):
+    """Load registered models of `kinds` now (default: from MODEL_PRELOAD; else on first use)"""
+    if kinds is None:
+        kinds = preload_kinds(os.getenv('MODEL_PRELOAD', ''))
+    names = [name for name in model_manager.names() if name.split(':', 1)[0] in kinds]
+    if names:
+        model_manager.preload(names)
+
+# Offline translator using Argos Translate
+class OfflineTranslator:
+    """Offline translator using Argos Translate"""
+    
+    REQUIRED_PAIRS = translation_pairs(MANIFEST)  # zh→en, en→zh
+    
+    def __init__(self, load_models=True, model_manager=model_manager):
+        # Pairs are resolved up front but their models load on first use
+        self.registry = TranslatorRegistry(pairs=self.REQUIRED_PAIRS, warm=False)
+        self.model_manager = model_manager
+        # Set by attach_pool(): inference then runs in worker processes
+        self.pool = None
+        # Shared by all socket clients - repeated phrases skip the NMT pass
+        self.cache = TranslationCache()
+        # Concurrent requests for the same pair share one batched decode
+        self.batcher = MicroBatcher(self._translate_batch)
+        # Sentences of long texts are translated concurrently (and batched)
+        self.segment_executor = ThreadPoolExecutor(
+            max_workers=int(os.getenv('SEGMENT_WORKERS', 8)),
+            thread_name_prefix='segment'
+        )
+        self.setup_complete = False
+        if load_models:
+            self._initialize_translators()
+    
+    def attach_pool(self, pool, ready):
+        """Route translations to an InferencePool instead of local models"""
+        self.pool = pool
+        self.setup_complete = ready
+    
+    def _translate_batch(self, texts, source_lang, target_lang):
+        if self.pool is not None:
+            return self.pool.run('translate_batch', texts, source_lang, target_lang)
+        
+        name = f"argos:{source_lang}-{target_lang}"
+        if not self.model_manager.is_registered(name):
+            return self._decode_batch(texts, source_lang, target_lang)
+        with self.model_manager.use(name):
+            return self._decode_batch(texts, source_lang, target_lang)
+    
+    def _decode_batch(self, texts, source_lang, target_lang):
+        # The registry lookup takes (green) locks, so it stays on the hub; only
+        # the decode itself runs on a native thread
+        translation = self.registry.get(source_lang, target_lang)
+        if translation is None:
+            raise LookupError(f"Language pair {source_lang}->{target_lang} not available")
+        return run_blocking(self.registry.decode_batch, translation, texts)
+    
+    def _register_models(self):
+        """Hand the configured pairs to the model manager for lazy loading"""
+        for source_lang, target_lang in self.registry.ready_pairs():
+            path = self.registry.package_path(source_lang, target_lang)
+            self.model_manager.register(
+                f"argos:{source_lang}-{target_lang}",
+                loader=lambda s=source_lang, t=target_lang: self.registry.load(s, t),
+                size_bytes=directory_size(path) if path else 0,
+                unloader=lambda _, s=source_lang, t=target_lang: self.registry.unload(s, t)
+            )
+    
+    def _initialize_translators(self):
+        """Resolve the installed Argos packages for the required pairs (no network)"""
+        try:
+            print("Initializing offline translation models...")
+            started = time.perf_counter()
+            
+            # Resolve the language pairs once, up front; models load on first use
+            self.registry.build()
+            for from_code, to_code in self.REQUIRED_PAIRS:
+                if self.registry.get(from_code, to_code) is None:
+                    print(f"✗ Warning: translation model {from_code}→{to_code} not installed")
+                    print("   Install with: python app_offline.py --install")
+            self._register_models()
+            
+            self.setup_complete = bool(self.registry.ready_pairs())
+            if self.setup_complete:
+                print(f"✓ Offline translation ready! ({time.perf_counter() - started:.2f}s)")
+            else:
+                print("✗ No translation models installed. Translation will not work.")
+            
+        except ImportError:
+            print("✗ Error: argostranslate not installed")
+            print("   Run: pip install argostranslate")
+            self.setup_complete = False
+        except Exception as e:
+            print(f"✗ Error initializing translator: {e}")
+            import traceback
+            traceback.print_exc()
+            self.setup_complete = False
+    
+    def translate(self, text, source_lang, target_lang):
+        """Translate text offline"""
+        if not text or not text.strip():
+            return ""
+        
+        if not self.setup_complete:
+            return "[Offline translation not available - models not installed]"
+        
+        try:
+            pair = f"{source_lang}-{target_lang}"
+            cached = self.cache.get(text, source_lang, target_lang)
+            if cached is not None:
+                metrics.CACHE_HITS.labels(pair).inc()
+                return cached
+            
+            if self.pool is None and self.registry.get(source_lang, target_lang) is None:
+                return f"[Language pair {source_lang}->{target_lang} not available]"
+            
+            with metrics.TRANSLATION_SECONDS.labels(pair).time():
+                if self.batcher.enabled:
+                    translated = self.batcher.translate(text, source_lang, target_lang)
+                else:
+                    translated = self._translate_batch([text], source_lang, target_lang)[0]
+            self.cache.put(text, source_lang, target_lang, translated)
+            return translated
+            
+        except PoolBusy:
+            raise
+        except Exception as e:
+            return f"[Translation error: {str(e)}]"
+
+    def translate_segments(self, segments, source_lang, target_lang):
+        """Translate (sentence, separator) segments concurrently, yielding results in order"""
+        futures = [
+            self.segment_executor.submit(self.translate, sentence, source_lang, target_lang)
+            for sentence, _ in segments
+        ]
+        for future in futures:
+            yield future.result()
+
+class RecognitionStream:
+    """Incremental recognition over one long-lived KaldiRecognizer"""
+    
+    def __init__(self, recognizer, release=None):
+        self.recognizer = recognizer
+        self.last_partial = ''
+        # Called with the recognizer once the stream is closed (returns it to the pool)
+        self._release = release
+    
+    def _decode(self, pcm_data):
+        """(final result JSON or None, partial result JSON) - pure Vosk work"""
+        if self.recognizer.AcceptWaveform(as_waveform(pcm_data)):
+            return self.recognizer.Result(), None
+        return None, self.recognizer.PartialResult()
+    
+    def accept(self, pcm_data):
+        """Feed 16-bit PCM; returns (final_text, partial_text), either may be None
+        
+        final_text is set when Vosk detects the end of an utterance; partial_text
+        only when the running hypothesis changed since the previous chunk.
+        """
+        result, partial_result = run_blocking(self._decode, pcm_data)
+        if result is not None:
+            self.last_partial = ''
+            return json.loads(result).get('text', ''), None
+        
+        partial = json.loads(partial_result).get('partial', '')
+        if partial == self.last_partial:
+            return None, None
+        self.last_partial = partial
+        return None, partial
+    
+    def finish(self):
+        """Flush the decoder and return the text of the last utterance"""
+        self.last_partial = ''
+        return json.loads(run_blocking(self.recognizer.FinalResult)).get('text', '')
+    
+    def close(self):
+        """Give the recognizer back; the stream must not be used afterwards"""
+        if self._release is not None and self.recognizer is not None:
+            self._release(self.recognizer)
+        self.recognizer = None
+
+# Offline speech recognizer using Vosk
+class OfflineSpeechRecognizer:
+    """Offline speech recognition using Vosk"""
+    
+    def __init__(self, load_models=True, model_manager=model_manager):
+        self.model_manager = model_manager
+        self.languages = set()
+        self.pool = None
+        # Reset-and-reuse KaldiRecognizers instead of allocating one per request
+        self.recognizer_pool = RecognizerPool()
+        self.setup_complete = False
+        if load_models:
+            self._initialize_models()
+    
+    def attach_pool(self, pool, languages):
+        """Route recognition to an InferencePool; `languages` are loaded in the workers"""
+        self.pool = pool
+        self.languages = set(languages)
+        self.setup_complete = bool(self.languages)
+    
+    def has_language(self, language):
+        return language in self.languages
+    
+    def can_stream(self):
+        """Live streams keep a recognizer in this process, so not in worker-pool mode"""
+        return self.setup_complete and self.pool is None
+    
+    def _initialize_models(self):
+        """Initialize Vosk models for Chinese and English"""
+        try:
+            from vosk import Model
+            
+            # Model paths (~/.vosk/models/<name> from the manifest)
+            model_configs = speech_models(MANIFEST)
+            
+            # Register models; each one is loaded on first use
+            print("Initializing offline speech recognition models...")
+            for lang, config in model_configs.items():
+                if os.path.exists(config['path']):
+                    self.model_manager.register(
+                        f"vosk:{lang}",
+                        loader=lambda path=config['path']: run_blocking(Model, path),
+                        size_bytes=directory_size(config['path']),
+                        # Pooled recognizers keep the model alive; drop them with it
+                        unloader=lambda _, lang=lang: self.recognizer_pool.clear(lang)
+                    )
+                    self.languages.add(lang)
+                    print(f"✓ Found {lang} speech model at {config['path']}")
+                else:
+                    print(f"✗ Warning: {lang} model not found at {config['path']}")
+                    print(f"   Download from: {config['url']}")
+                    print(f"   Extract to: {config['path']}")
+                    print("   Or run: python app_offline.py --install")
+            
+            if self.languages:
+                self.setup_complete = True
+                print("✓ Offline speech recognition ready!")
+            else:
+                print("✗ No speech models loaded. Voice recognition will not work.")
+                
+        except ImportError:
+            print("✗ Error: vosk not installed")
+            print("   Run: pip install vosk")
+            self.setup_complete = False
+        except Exception as e:
+            print(f"✗ Error initializing speech recognizer: {e}")
+            import traceback
+            traceback.print_exc()
+            self.setup_complete = False
+    
+    def open_stream(self, language='en', sample_rate=16000):
+        """Create a RecognitionStream for live audio in `language`"""
+        if self.pool is not None:
+            raise Exception("Streaming recognition is not available in worker-pool mode")
+        if not self.setup_complete or not self.has_language(language):
+            raise Exception(f"Speech model for {language} not available")
+        # The model stays loaded (not evictable) for the lifetime of the stream
+        name = f"vosk:{language}"
+        model = self.model_manager.acquire(name)
+        rec = self.recognizer_pool.acquire(language, model, sample_rate)
+        
+        def release(r):
+            self.recognizer_pool.release(language, model, r, sample_rate)
+            self.model_manager.release(name)
+        
+        return RecognitionStream(rec, release)
+    
+    def recognize_segments(self, pcm_data, segments, language='en'):
+        """Recognize (start_byte, end_byte) speech segments of a clip, yielding each text in turn"""
+        view = memoryview(pcm_data).cast('B')
+        for start, end in segments:
+            yield self.recognize(view[start:end], language)
+    
+    def recognize(self, audio_data, language='en'):
+        """Recognize speech from audio data"""
+        if not self.setup_complete or not self.has_language(language):
+            raise Exception(f"Speech model for {language} not available")
+        
+        with metrics.RECOGNITION_SECONDS.labels(language).time():
+            return self._recognize(audio_data, language)
+    
+    def _recognize(self, audio_data, language):
+        if self.pool is not None:
+            # memoryviews can't be pickled across to the worker process
+            return self.pool.run('recognize', bytes(audio_data), language)
+        
+        try:
+            # Borrow the (lazily loaded) model and a recognizer for this language
+            with self.model_manager.use(f"vosk:{language}") as model, \
+                    self.recognizer_pool.recognizer(language, model) as rec:
+                # Process audio in fixed-size chunks, keeping every utterance Vosk finalizes
+                texts = run_blocking(feed_recognizer, rec, audio_data)
+            
+            return ' '.join(texts)
+            
+        except Exception as e:
+            raise Exception(f"Recognition error: {str(e)}")
@@ -0,0 +1,92 @@
+"""
+Offload - run CPU-bound inference off the eventlet/gevent hub
+
+Under the eventlet and gevent async modes every Socket.IO session shares a
+single OS thread. A Vosk decode or a CTranslate2 translation called inline
+blocks that thread, so heartbeats and every other client stall until it
+finishes. run_blocking() hands such calls to a native thread pool (eventlet
+tpool / the gevent hub's threadpool) and suspends only the calling greenlet.
+Vosk and CTranslate2 release the GIL while decoding, so the hub keeps running.
+
+Only wrap pure compute: the offloaded function runs on a real OS thread and
+must not use monkey-patched locks, events or sockets. Call run_blocking() only
+from greenlets - Socket.IO handlers, or threads started after monkey
+patching - never from an unpatched OS thread. That needs the standard library
+to be patched before the app is imported (app_offline.py does this when run as
+a script, gunicorn.conf.py under gunicorn); configure() warns when it is not.
+
+In threading mode (the Flask dev server) calls run inline.
+"""
+
+import os
+import threading
+
+_mode = 'threading'
+_lock = threading.Lock()
+_calls = 0
+_in_flight = 0
+
+
+def configure(async_mode):
+    """Pick the thread pool for Flask-SocketIO's async mode"""
+    global _mode
+    threads = int(os.getenv('OFFLOAD_THREADS', 4))
+
+    if async_mode == 'eventlet':
+        from eventlet import patcher, tpool
+        tpool.set_num_threads(threads)
+        _mode = 'eventlet'
+        patched = patcher.is_monkey_patched('thread')
+    elif async_mode in ('gevent', 'gevent_uwsgi'):
+        import gevent
+        from gevent import monkey
+        gevent.get_hub().threadpool.maxsize = threads
+        _mode = 'gevent'
+        patched = monkey.is_module_patched('threading')
+    else:
+        _mode = 'threading'
+        patched = True
+    print(f"✓ Inference offload: {_mode}" + (f" ({threads} native threads)" if _mode != 'threading' else ''))
+    if not patched:
+        print(f"✗ Warning: threading is not monkey-patched for {_mode} - waits on locks will block the hub")
+
+
+def _count(delta):
+    global _calls, _in_flight
+    with _lock:
+        if delta > 0:
+            _calls += 1
+        _in_flight += delta
+
+
+def offloading():
+    """True when run_blocking() moves work to another thread"""
+    return _mode != 'threading'
+
+
+def run_blocking(fn, *args, **kwargs):
+    """Call fn(*args, **kwargs) on a native thread; the calling greenlet waits for it
+
+    Must be called from a greenlet, not from an unpatched OS thread.
+    """
+    if _mode == 'threading':
+        return fn(*args, **kwargs)
+
+    _count(1)
+    try:
+        if _mode == 'eventlet':
+            from eventlet import tpool
+            return tpool.execute(fn, *args, **kwargs)
+
+        import gevent
+        return gevent.get_hub().threadpool.apply(fn, args, kwargs)
+    finally:
+        _count(-1)
+
+
+def stats():
+    return {
+        'mode': _mode,
+        'calls': _calls,
+        'in_flight': _in_flight
+    }
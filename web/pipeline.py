@@ -0,0 +1,130 @@
+"""
+Utterance pipeline - translate utterance N while utterance N+1 is recognized
+
+A clip with several utterances (or a live recording) used to run recognize
+→ translate → emit strictly in sequence, so every utterance waited for the
+translation of the one before it. An UtterancePipeline takes each utterance
+as soon as it is recognized, translates it on a shared executor while the
+caller goes on recognizing, and delivers the results strictly in order.
+
+It also keeps the numbers to show the gain: the sum of the stage times
+(what the sequential version would take) against the measured wall time.
+"""
+
+import threading
+import time
+
+
+class UtteranceResult:
+    """One translated utterance, as handed to the deliver callback"""
+
+    __slots__ = ('index', 'original', 'translated', 'error', 'recognize_seconds',
+                 'queue_seconds', 'translate_seconds', 'latency_seconds')
+
+    def __init__(self, index, original, translated, error, recognize_seconds,
+                 queue_seconds, translate_seconds, latency_seconds):
+        self.index = index
+        self.original = original
+        self.translated = translated
+        self.error = error
+        self.recognize_seconds = recognize_seconds
+        self.queue_seconds = queue_seconds
+        self.translate_seconds = translate_seconds
+        # From "recognized" to "delivered", including waiting for earlier utterances
+        self.latency_seconds = latency_seconds
+
+    def timings(self):
+        return {
+            'recognize_ms': round(self.recognize_seconds * 1000, 1),
+            'translate_ms': round(self.translate_seconds * 1000, 1),
+            'latency_ms': round(self.latency_seconds * 1000, 1)
+        }
+
+
+class UtterancePipeline:
+    """Ordered, overlapped translation of recognized utterances for one session"""
+
+    def __init__(self, translate, deliver, executor):
+        # translate(text) -> translated text; deliver(UtteranceResult) in index order
+        self.translate = translate
+        self.deliver = deliver
+        self.executor = executor
+
+        self.results = []
+        self.started_at = time.perf_counter()
+        self.finished_at = None
+        self.recognize_seconds = 0.0
+        self.translate_seconds = 0.0
+
+        self._lock = threading.Lock()
+        self._next_index = 0
+        self._next_delivery = 0
+        self._done = {}
+        self._futures = []
+
+    def submit(self, text, recognize_seconds=0.0):
+        """Queue a recognized utterance for translation; returns its index"""
+        with self._lock:
+            index = self._next_index
+            self._next_index += 1
+            self.recognize_seconds += recognize_seconds
+        submitted = time.perf_counter()
+        self._futures.append(
+            self.executor.submit(self._run, index, text, recognize_seconds, submitted)
+        )
+        return index
+
+    def _run(self, index, text, recognize_seconds, submitted):
+        started = time.perf_counter()
+        translated = error = None
+        try:
+            translated = self.translate(text)
+        except Exception as e:
+            error = e
+        finished = time.perf_counter()
+
+        with self._lock:
+            self.translate_seconds += finished - started
+            self._done[index] = (text, translated, error, recognize_seconds,
+                                 started - submitted, finished - started, submitted)
+            # Delivering under the lock keeps the order across executor threads
+            while self._next_delivery in self._done:
+                text, translated, error, recognize_s, queue_s, translate_s, submitted_at = \
+                    self._done.pop(self._next_delivery)
+                result = UtteranceResult(
+                    self._next_delivery, text, translated, error, recognize_s,
+                    queue_s, translate_s, time.perf_counter() - submitted_at
+                )
+                self._next_delivery += 1
+                self.results.append(result)
+                try:
+                    self.deliver(result)
+                except Exception as e:
+                    print(f"✗ Failed to deliver utterance {result.index}: {e}")
+
+    def finish(self, timeout=None):
+        """Wait until every submitted utterance has been delivered; returns the results"""
+        for future in list(self._futures):
+            future.result(timeout=timeout)
+        self.finished_at = time.perf_counter()
+        return self.results
+
+    def stats(self):
+        """Sequential (sum of stages) vs pipelined (wall) time
+
+        The comparison is only meaningful for clips: for a live recording the
+        wall time includes the speaking time, and the gain is that recognition
+        no longer stops while an utterance is translated.
+        """
+        wall = (self.finished_at or time.perf_counter()) - self.started_at
+        sequential = self.recognize_seconds + self.translate_seconds
+        latencies = [result.latency_seconds for result in self.results]
+        return {
+            'utterances': len(self.results),
+            'mean_latency_ms': round(sum(latencies) / len(latencies) * 1000, 1) if latencies else 0.0,
+            'recognize_ms': round(self.recognize_seconds * 1000, 1),
+            'translate_ms': round(self.translate_seconds * 1000, 1),
+            'sequential_ms': round(sequential * 1000, 1),
+            'pipelined_ms': round(wall * 1000, 1),
+            'saved_ms': round(max(0.0, sequential - wall) * 1000, 1)
+        }
@@ -0,0 +1,97 @@
+"""
+Recognizer Pool - reuse Vosk KaldiRecognizer instances per language
+
+Creating a KaldiRecognizer allocates the decoder graph state, which shows up
+in profiles when it happens on every request. Idle recognizers are kept per
+(language, sample rate), reset and handed out again. When a pool is empty a
+new recognizer is created, so the pool never blocks.
+"""
+
+import os
+import threading
+from contextlib import contextmanager
+
+
+class RecognizerPool:
+    """Bounded per-language free lists of reset KaldiRecognizers"""
+
+    def __init__(self, size=None, configure=None):
+        if size is None:
+            size = int(os.getenv('RECOGNIZER_POOL_SIZE', 4))
+        # Max idle recognizers kept per (language, sample rate)
+        self.size = size
+        # Optional callback applied to every new recognizer (e.g. SetWords)
+        self.configure = configure
+
+        self._idle = {}
+        self._lock = threading.Lock()
+
+        self.allocations = 0
+        self.reuses = 0
+        self.discards = 0
+
+    def acquire(self, language, model, sample_rate=16000):
+        """Take an idle recognizer for `model`, or create a new one"""
+        key = (language, sample_rate)
+        with self._lock:
+            idle = self._idle.get(key, [])
+            while idle:
+                rec, rec_model = idle.pop()
+                # A reloaded model makes the old recognizers stale
+                if rec_model is model:
+                    self.reuses += 1
+                    return rec
+                self.discards += 1
+            self.allocations += 1
+
+        from vosk import KaldiRecognizer
+
+        rec = KaldiRecognizer(model, sample_rate)
+        if self.configure is not None:
+            self.configure(rec)
+        return rec
+
+    def release(self, language, model, rec, sample_rate=16000):
+        """Reset a recognizer and return it to the pool (dropped if the pool is full)"""
+        try:
+            rec.Reset()
+        except Exception:
+            with self._lock:
+                self.discards += 1
+            return
+
+        key = (language, sample_rate)
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.size:
+                idle.append((rec, model))
+            else:
+                self.discards += 1
+
+    @contextmanager
+    def recognizer(self, language, model, sample_rate=16000):
+        """Borrow a recognizer for one request
+
+        If the request fails the recognizer is not returned, since its decoder
+        state is unknown.
+        """
+        rec = self.acquire(language, model, sample_rate)
+        yield rec
+        self.release(language, model, rec, sample_rate)
+
+    def clear(self, language=None):
+        """Drop idle recognizers (all, or those of one language)"""
+        with self._lock:
+            for key in list(self._idle):
+                if language is None or key[0] == language:
+                    self.discards += len(self._idle.pop(key))
+
+    def stats(self):
+        with self._lock:
+            return {
+                'size': self.size,
+                'allocations': self.allocations,
+                'reuses': self.reuses,
+                'discards': self.discards,
+                'idle': {f"{lang}@{rate}": len(idle) for (lang, rate), idle in self._idle.items()}
+            }
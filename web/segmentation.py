@@ -0,0 +1,101 @@
+"""
+Sentence segmentation for long text translation
+
+Splits pasted text (emails, paragraphs) into sentences so they can be
+translated concurrently and streamed back one by one. Handles both Western
+(. ! ?) and CJK (。！？；) sentence punctuation and keeps paragraph breaks so
+the translated text can be reassembled with the same layout.
+"""
+
+import re
+
+# A sentence ends at CJK punctuation (no space needed after it) or at
+# Western punctuation followed by whitespace; closing quotes/brackets stay
+# attached to the sentence they close.
+_SENTENCE_END = re.compile(
+    r'([。！？；!?]+[”’"\')）]*|\.+[”’"\')）]*(?=\s))'
+)
+
+# Periods after these don't end a sentence ("Mr. Wang", "e.g. price")
+_ABBREVIATIONS = {
+    'mr', 'mrs', 'ms', 'dr', 'prof', 'sr', 'jr', 'st', 'vs', 'etc', 'no',
+    'co', 'inc', 'ltd', 'e.g', 'i.e', 'approx', 'dept', 'fig'
+}
+
+# Over-long "sentences" without punctuation are cut at the last space/comma
+MAX_SEGMENT_CHARS = 400
+
+
+def _is_abbreviation(preceding):
+    words = preceding.split()
+    if not words:
+        return False
+    word = words[-1].lower()
+    # Single letters are initials ("J. Smith")
+    return word in _ABBREVIATIONS or (len(word) == 1 and word.isalpha())
+
+
+def _split_long(sentence, max_chars):
+    pieces = []
+    while len(sentence) > max_chars:
+        cut = max(sentence.rfind(' ', 0, max_chars), sentence.rfind(',', 0, max_chars),
+                  sentence.rfind('，', 0, max_chars))
+        if cut <= 0:
+            cut = max_chars
+        else:
+            cut += 1
+        pieces.append(sentence[:cut].strip())
+        sentence = sentence[cut:].strip()
+    if sentence:
+        pieces.append(sentence)
+    return pieces
+
+
+def split_sentences(text, max_chars=MAX_SEGMENT_CHARS):
+    """Split text into a list of (sentence, separator) tuples
+
+    The separator is what followed the sentence in the original text: '\\n'
+    (or several) at paragraph breaks, otherwise ' ' or ''. Joining the
+    sentences with their separators reproduces the original layout.
+    """
+    segments = []
+    paragraphs = re.split(r'(\n+)', text.strip())
+
+    for i in range(0, len(paragraphs), 2):
+        paragraph = paragraphs[i]
+        paragraph_break = paragraphs[i + 1] if i + 1 < len(paragraphs) else ''
+
+        sentences = []
+        start = 0
+        for match in _SENTENCE_END.finditer(paragraph):
+            if match.group().startswith('.') and _is_abbreviation(paragraph[start:match.start()]):
+                continue
+            sentences.append(paragraph[start:match.end()])
+            start = match.end()
+        sentences.append(paragraph[start:])
+
+        pieces = []
+        for sentence in sentences:
+            sentence = sentence.strip()
+            if sentence:
+                pieces.extend(_split_long(sentence, max_chars))
+
+        for j, piece in enumerate(pieces):
+            last = j == len(pieces) - 1
+            segments.append((piece, paragraph_break if last else ' '))
+
+    return segments
+
+
+def join_segments(translated, separators, target_lang):
+    """Reassemble translated sentences, keeping paragraph breaks
+
+    Chinese text does not put spaces between sentences, so the in-paragraph
+    separator depends on the target language.
+    """
+    inline = '' if target_lang == 'zh' else ' '
+    parts = []
+    for sentence, separator in zip(translated, separators):
+        parts.append(sentence)
+        parts.append(separator if '\n' in separator else inline)
+    return ''.join(parts).strip()
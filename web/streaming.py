@@ -0,0 +1,76 @@
+"""
+Live audio streaming sessions
+
+The browser sends PCM chunks as they are recorded (audio_start →
+audio_chunk... → audio_end). Each Socket.IO session owns one
+RecognitionStream for the duration of a recording. Socket.IO may dispatch
+events of one client on different threads, so chunks carry a sequence number
+and are fed to the recognizer strictly in order, one at a time.
+"""
+
+import threading
+import time
+
+
+class StreamingSession:
+    """State of one live recording: recognizer stream, languages and chunk order"""
+
+    def __init__(self, stream, source_lang, target_lang, sample_rate=16000):
+        self.stream = stream
+        self.source_lang = source_lang
+        self.target_lang = target_lang
+        self.sample_rate = sample_rate
+        self.lock = threading.Lock()
+        self.started_at = time.monotonic()
+        self.bytes_received = 0
+        self.utterances = 0
+        # Decode time since the last finished utterance
+        self.decode_seconds = 0.0
+        # UtterancePipeline that translates and delivers the finished utterances
+        self.pipeline = None
+        # tracing.Trace covering the whole stream, logged at audio_end
+        self.trace = None
+        # Set once the recognizer is given back; chunks arriving later are dropped
+        self.closed = False
+
+        self._next_seq = 0
+        self._pending = {}
+
+    def reorder(self, seq, chunk):
+        """Accept chunk number `seq`; return the chunks that are now in order
+
+        Chunks without a sequence number are taken in arrival order.
+        Must be called with `lock` held.
+        """
+        if seq is None:
+            return [chunk]
+
+        self._pending[seq] = chunk
+        ready = []
+        while self._next_seq in self._pending:
+            ready.append(self._pending.pop(self._next_seq))
+            self._next_seq += 1
+        return ready
+
+    def close(self):
+        """Close the recognizer stream (once). Must be called with `lock` held."""
+        if not self.closed:
+            self.closed = True
+            self.stream.close()
+
+    def take_decode_seconds(self):
+        """Decode time spent on the utterance that just finished; resets the counter"""
+        seconds = self.decode_seconds
+        self.decode_seconds = 0.0
+        return seconds
+
+    @property
+    def audio_seconds(self):
+        # 16-bit mono PCM
+        return self.bytes_received / 2 / self.sample_rate
+
+    def drain(self):
+        """Chunks still waiting for a gap to be filled, in sequence order"""
+        chunks = [self._pending[seq] for seq in sorted(self._pending)]
+        self._pending.clear()
+        return chunks
@@ -0,0 +1,25 @@
+import pytest
+
+from admission import AdmissionController, Overloaded
+
+
+def test_admit_releases_the_slot_when_the_block_fails():
+    admission = AdmissionController(max_active=1, max_per_session=1, max_queue=0, queue_timeout=0)
+    with pytest.raises(ValueError):
+        with admission.admit('a'):
+            assert admission.stats()['active'] == 1
+            raise ValueError('handler failed')
+    stats = admission.stats()
+    assert stats['active'] == 0
+    assert stats['sessions'] == 0
+
+
+def test_session_limit_rejects_before_the_block_runs():
+    admission = AdmissionController(max_active=4, max_per_session=1, max_queue=4, queue_timeout=0)
+    with admission.admit('a'):
+        with pytest.raises(Overloaded) as rejected:
+            with admission.admit('a'):
+                pytest.fail('a second request of the session was admitted')
+    assert rejected.value.reason == 'session'
+    assert admission.stats()['rejected']['session'] == 1
+    assert admission.stats()['active'] == 0
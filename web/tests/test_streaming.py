@@ -0,0 +1,28 @@
+from streaming import StreamingSession
+
+
+class FakeStream:
+    def __init__(self):
+        self.closes = 0
+
+    def close(self):
+        self.closes += 1
+
+
+def test_close_releases_the_stream_once():
+    stream = FakeStream()
+    session = StreamingSession(stream, 'en', 'zh')
+    with session.lock:
+        session.close()
+        session.close()
+    assert session.closed
+    assert stream.closes == 1
+
+
+def test_chunks_are_reordered_by_sequence_number():
+    session = StreamingSession(FakeStream(), 'en', 'zh')
+    with session.lock:
+        assert session.reorder(1, b'b') == []
+        assert session.reorder(0, b'a') == [b'a', b'b']
+        assert session.reorder(3, b'd') == []
+        assert session.drain() == [b'd']
@@ -0,0 +1,18 @@
+from translation_cache import TranslationCache, normalize_text
+
+
+def test_normalize_collapses_whitespace_and_nfkc():
+    assert normalize_text('  Hello \t\n world ') == 'Hello world'
+    assert normalize_text('ＡＢＣ') == 'ABC'
+
+
+def test_case_is_part_of_the_key():
+    assert TranslationCache.make_key('US', 'en', 'zh') != TranslationCache.make_key('us', 'en', 'zh')
+    assert TranslationCache.make_key('May', 'en', 'zh') != TranslationCache.make_key('may', 'en', 'zh')
+
+
+def test_different_casing_is_cached_separately():
+    cache = TranslationCache(max_size=16, ttl=0)
+    cache.put('US', 'en', 'zh', '美国')
+    assert cache.get('us', 'en', 'zh') is None
+    assert cache.get(' US ', 'en', 'zh') == '美国'
@@ -0,0 +1,86 @@
+from types import SimpleNamespace
+
+from translator_registry import TranslatorRegistry, package_translation
+
+
+class FakeTokenizer:
+    def encode(self, text):
+        return text.split()
+
+    def decode(self, tokens):
+        return ' '.join(tokens)
+
+
+class FakeCTranslator:
+    def __init__(self):
+        self.batches = []
+
+    def translate_batch(self, tokenized, target_prefix=None, **kwargs):
+        self.batches.append(tokenized)
+        return [
+            SimpleNamespace(hypotheses=[[target_prefix[0][0]] + [token.upper() for token in tokens]])
+            for tokens in tokenized
+        ]
+
+
+class FakePackageTranslation:
+    def __init__(self, package_path):
+        self.pkg = SimpleNamespace(package_path=package_path, tokenizer=FakeTokenizer(), target_prefix='__zh__')
+        self.translator = FakeCTranslator()
+
+    def translate(self, text):
+        return f"single:{text}"
+
+
+class FakeCachedTranslation:
+    """Shaped like argostranslate 1.10's CachedTranslation"""
+
+    def __init__(self, underlying):
+        self.underlying = underlying
+        self.cache = {}
+
+    def translate(self, text):
+        return self.underlying.translate(text)
+
+
+def make_registry(tmp_path):
+    package = FakePackageTranslation(tmp_path / 'translate-en_zh')
+    registry = TranslatorRegistry(pairs=[('en', 'zh')], warm=False, check_interval=3600)
+    registry.translations = {('en', 'zh'): FakeCachedTranslation(package), ('zh', 'en'): None}
+    registry._signature = ()
+    return registry, package
+
+
+def test_package_translation_unwraps_cached_translation(tmp_path):
+    package = FakePackageTranslation(tmp_path)
+    assert package_translation(FakeCachedTranslation(package)) is package
+    assert package_translation(package) is package
+    assert package_translation(SimpleNamespace(translate=str)) is None
+    assert package_translation(None) is None
+
+
+def test_package_path_of_wrapped_translation(tmp_path):
+    registry, _ = make_registry(tmp_path)
+    assert registry.package_path('en', 'zh') == str(tmp_path / 'translate-en_zh')
+    assert registry.package_path('zh', 'en') is None
+
+
+def test_unload_drops_the_wrapped_translator(tmp_path):
+    registry, package = make_registry(tmp_path)
+    registry.warmup_times[('en', 'zh')] = 0.5
+    registry.unload('en', 'zh')
+    assert package.translator is None
+    assert ('en', 'zh') not in registry.warmup_times
+
+
+def test_translate_batch_uses_one_ctranslate2_call(tmp_path):
+    registry, package = make_registry(tmp_path)
+    translator = package.translator
+    assert registry.translate_batch(['hello world', 'good day'], 'en', 'zh') == ['HELLO WORLD', 'GOOD DAY']
+    assert translator.batches == [[['hello', 'world'], ['good', 'day']]]
+
+
+def test_decode_batch_needs_no_registry(tmp_path):
+    package = FakePackageTranslation(tmp_path)
+    assert TranslatorRegistry.decode_batch(FakeCachedTranslation(package), ['a b', 'c']) == ['A B', 'C']
+    assert TranslatorRegistry.decode_batch(FakeCachedTranslation(package), ['a b']) == ['single:a b']
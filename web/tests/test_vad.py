@@ -0,0 +1,42 @@
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from vad import SAMPLE_RATE, VoiceActivityDetector
+
+
+def harmonic_speech(seconds, envelope_floor=0.6):
+    """The benchmark fixtures' voiced signal with an envelope that never drops to silence"""
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    pitch = 120.0 + 60.0 * np.sin(2 * np.pi * 0.3 * t)
+    phase = 2 * np.pi * np.cumsum(pitch) / SAMPLE_RATE
+    voiced = sum(np.sin(phase * k) / k for k in range(1, 6))
+    envelope = envelope_floor + (1.0 - envelope_floor) * np.abs(np.sin(2 * np.pi * 4.0 * t))
+    return (voiced * envelope * 0.3 * 32767).astype('<i2').tobytes()
+
+
+def tone(seconds, frequency=200.0, amplitude=0.3):
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    return (np.sin(2 * np.pi * frequency * t) * amplitude * 32767).astype('<i2').tobytes()
+
+
+@pytest.mark.parametrize('pcm', [harmonic_speech(1.5), tone(2.0)], ids=['speech', 'tone'])
+def test_clip_without_silence_is_kept_whole(pcm):
+    result = VoiceActivityDetector(hangover_ms=300, split_ms=700).detect(pcm)
+    assert result.segments == [(0, len(pcm))]
+    assert result.trimmed_pct == 0.0
+
+
+def test_silence_around_speech_is_trimmed():
+    silence = bytes(SAMPLE_RATE)  # 0.5 s
+    pcm = silence + harmonic_speech(1.0) + silence
+    result = VoiceActivityDetector(hangover_ms=300, split_ms=700).detect(pcm)
+    assert len(result.segments) == 1
+    start, end = result.segments[0]
+    assert 0 < start < len(silence)
+    assert len(silence) + SAMPLE_RATE * 2 <= end < len(pcm)
+    assert result.trimmed_pct > 20.0
+
+
+def test_digital_silence_has_no_speech():
+    assert VoiceActivityDetector(hangover_ms=300, split_ms=700).detect(bytes(SAMPLE_RATE * 2)).segments == []
@@ -0,0 +1,158 @@
+"""
+Tracing - per-request trace IDs, timing spans and sampled structured logs
+
+Every Socket.IO request gets a Trace with a short random ID. Stages run in
+`with trace.span('recognize'):` blocks; when the request finishes the trace
+is logged as one structured record with all span timings. Only a sample of
+successful requests is logged (TRACE_SAMPLE_RATE); errors and requests slower
+than TRACE_SLOW_MS always are.
+
+Recognized and translated text is not logged unless LOG_TEXT=1 - records
+carry the text length instead.
+
+Log records go through a queue and are written to stdout by a background
+thread, so request handlers never wait on a slow log pipeline.
+"""
+
+import atexit
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import random
+import time
+import uuid
+from contextlib import contextmanager
+
+logger = logging.getLogger('translator')
+
+SAMPLE_RATE = float(os.getenv('TRACE_SAMPLE_RATE', 0.1))
+SLOW_MS = float(os.getenv('TRACE_SLOW_MS', 5000))
+LOG_TEXT = os.getenv('LOG_TEXT', '').lower() in ('1', 'true', 'yes')
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line; trace records are flattened into it"""
+
+    def format(self, record):
+        entry = {
+            'ts': round(record.created, 3),
+            'level': record.levelname.lower(),
+            'msg': record.getMessage()
+        }
+        entry.update(getattr(record, 'trace', {}))
+        if record.exc_info:
+            entry['exc'] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class TextFormatter(logging.Formatter):
+    """Human-readable lines: time, level, message, then key=value trace fields"""
+
+    def __init__(self):
+        super().__init__('%(asctime)s %(levelname)-7s %(message)s')
+
+    def format(self, record):
+        line = super().format(record)
+        trace = getattr(record, 'trace', None)
+        if trace:
+            line += ' ' + ' '.join(f'{key}={value}' for key, value in trace.items())
+        return line
+
+
+class _ForkSafeQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler whose writer thread is (re)started in each process
+
+    gunicorn forks after the app has been imported; the listener thread does
+    not survive the fork, so it is started lazily on the first record.
+    """
+
+    def __init__(self, target):
+        super().__init__(queue.SimpleQueue())
+        self.target = target
+        self._listener = None
+        self._pid = None
+
+    def prepare(self, record):
+        # Same process: hand the record over as is (the formatter needs exc_info and extras)
+        return record
+
+    def emit(self, record):
+        if self._pid != os.getpid():
+            self._pid = os.getpid()
+            self.queue = queue.SimpleQueue()
+            self._listener = logging.handlers.QueueListener(self.queue, self.target)
+            self._listener.start()
+            atexit.register(self._listener.stop)
+        super().emit(record)
+
+
+def configure():
+    """Set up the 'translator' logger from LOG_LEVEL / LOG_FORMAT (json or text)"""
+    stream = logging.StreamHandler()
+    stream.setFormatter(JsonFormatter() if os.getenv('LOG_FORMAT', 'text') == 'json' else TextFormatter())
+
+    logger.handlers[:] = [_ForkSafeQueueHandler(stream)]
+    logger.setLevel(os.getenv('LOG_LEVEL', 'INFO').upper())
+    logger.propagate = False
+
+
+def body(text):
+    """The text itself when LOG_TEXT is on, otherwise just its length"""
+    if LOG_TEXT:
+        return text
+    return f'<{len(text or "")} chars>'
+
+
+class Trace:
+    """Timing spans and fields of one request, logged once when it finishes"""
+
+    def __init__(self, event, **fields):
+        self.trace_id = uuid.uuid4().hex[:16]
+        self.event = event
+        self.fields = fields
+        self.spans = {}
+        self.started = time.perf_counter()
+        self.sampled = random.random() < SAMPLE_RATE
+        self.finished = False
+
+    @contextmanager
+    def span(self, name):
+        """Time a stage; repeated spans of the same name add up"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = (time.perf_counter() - started) * 1000
+            self.spans[name] = round(self.spans.get(name, 0.0) + elapsed, 2)
+
+    def add(self, **fields):
+        self.fields.update(fields)
+
+    def text(self, name, value):
+        """Record a text body, subject to LOG_TEXT"""
+        if LOG_TEXT:
+            self.fields[name] = value
+        else:
+            self.fields[f'{name}_chars'] = len(value or '')
+
+    def finish(self, error=None):
+        """Log the trace if it is sampled, slow or failed; returns the total time in ms"""
+        if self.finished:
+            return None
+        self.finished = True
+        total_ms = round((time.perf_counter() - self.started) * 1000, 2)
+        slow = SLOW_MS > 0 and total_ms >= SLOW_MS
+        if error is None and not self.sampled and not slow:
+            return total_ms
+
+        record = {'trace_id': self.trace_id, 'event': self.event, 'total_ms': total_ms}
+        record.update(self.fields)
+        record.update({f'{name}_ms': ms for name, ms in self.spans.items()})
+        if error is not None:
+            record['error'] = str(error)
+            logger.warning('request failed', extra={'trace': record})
+        else:
+            logger.info('slow request' if slow else 'request', extra={'trace': record})
+        return total_ms
@@ -0,0 +1,106 @@
+"""
+Translation Cache - bounded LRU cache of translation results with TTL
+
+Meetings repeat a lot of short phrases, so results are kept in process and
+shared by all Socket.IO clients. Keys are the normalized text plus the
+language pair. Entries are evicted least-recently-used when the cache is full
+and dropped once they are older than the TTL.
+"""
+
+import os
+import re
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+
+_WHITESPACE = re.compile(r'\s+')
+
+
+def normalize_text(text):
+    """Canonical form used as cache key: NFKC, trimmed, single spaces
+
+    Case is kept: "US" and "us" translate differently.
+    """
+    text = unicodedata.normalize('NFKC', text)
+    return _WHITESPACE.sub(' ', text).strip()
+
+
+class TranslationCache:
+    """Thread-safe LRU + TTL cache keyed on (source, target, normalized text)"""
+
+    def __init__(self, max_size=None, ttl=None):
+        if max_size is None:
+            max_size = int(os.getenv('TRANSLATION_CACHE_SIZE', 2048))
+        if ttl is None:
+            ttl = float(os.getenv('TRANSLATION_CACHE_TTL', 3600))
+        self.max_size = max_size
+        self.ttl = ttl
+
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @staticmethod
+    def make_key(text, source_lang, target_lang):
+        return (source_lang, target_lang, normalize_text(text))
+
+    def get(self, text, source_lang, target_lang):
+        """Return the cached translation, or None on a miss"""
+        if self.max_size <= 0:
+            return None
+
+        key = self.make_key(text, source_lang, target_lang)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            value, stored_at = entry
+            if self.ttl > 0 and now - stored_at > self.ttl:
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, text, source_lang, target_lang, value):
+        """Store a translation, evicting the least recently used entry if full"""
+        if self.max_size <= 0:
+            return
+
+        key = self.make_key(text, source_lang, target_lang)
+        with self._lock:
+            self._entries[key] = (value, time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        """Counters for health/status endpoints"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._entries),
+                'max_size': self.max_size,
+                'ttl_seconds': self.ttl,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0
+            }
@@ -0,0 +1,227 @@
+"""
+Translator Registry - resolves Argos Translate language pairs once
+
+argostranslate.translate.translate() and get_installed_languages() re-read the
+installed package metadata from disk and scan it on every call. For short
+phrases that lookup costs more than the translation itself, so the registry
+resolves each (source, target) pair to a Translation object once, warms it up
+and hands it out from a dict. When the installed packages change on disk the
+registry is rebuilt on the next lookup.
+"""
+
+import os
+import threading
+import time
+
+from offload import run_blocking
+
+
+def package_translation(translation):
+    """The PackageTranslation behind a Translation, or None (e.g. pivot translations)
+
+    Argos 1.10 hands out CachedTranslation objects that wrap the
+    PackageTranslation (holding `pkg` and the CTranslate2 `translator`) in
+    `.underlying`; older versions return it directly.
+    """
+    seen = 0
+    while translation is not None and not hasattr(translation, 'pkg') and seen < 8:
+        translation = getattr(translation, 'underlying', None)
+        seen += 1
+    return translation if hasattr(translation, 'pkg') else None
+
+
+class TranslatorRegistry:
+    """Dict of ready-to-use Argos Translation objects keyed by language pair"""
+
+    def __init__(self, pairs=None, warmup_text="Hello", check_interval=30.0, warm=True):
+        # Pairs that are built (and warmed, if `warm`) eagerly; any other
+        # installed pair is resolved lazily on first use and then kept in the
+        # dict as well. With warm=False the models load on first translation,
+        # or via load() - e.g. under a ModelManager.
+        self.pairs = list(pairs or [])
+        self.warmup_text = warmup_text
+        self.warm = warm
+        self.check_interval = check_interval
+
+        self.languages = {}
+        self.translations = {}
+        self.warmup_times = {}
+        self.rebuilds = 0
+
+        self._signature = None
+        self._last_check = 0.0
+        self._lock = threading.RLock()
+
+    def _package_dirs(self):
+        """Directories Argos installs packages into"""
+        import argostranslate.settings
+
+        dirs = getattr(argostranslate.settings, 'package_dirs', None)
+        if not dirs:
+            dirs = [argostranslate.settings.package_data_dir]
+        return [str(d) for d in dirs]
+
+    def _packages_signature(self):
+        """Cheap fingerprint of the installed packages (names + mtimes)"""
+        signature = []
+        for package_dir in self._package_dirs():
+            try:
+                with os.scandir(package_dir) as entries:
+                    for entry in entries:
+                        if entry.is_dir():
+                            signature.append((entry.path, entry.stat().st_mtime))
+            except FileNotFoundError:
+                continue
+        return tuple(sorted(signature))
+
+    def build(self):
+        """(Re)load installed languages and resolve + warm the configured pairs"""
+        import argostranslate.translate
+
+        with self._lock:
+            started = time.perf_counter()
+            self._signature = self._packages_signature()
+            self._last_check = time.monotonic()
+
+            languages = argostranslate.translate.get_installed_languages()
+            self.languages = {lang.code: lang for lang in languages}
+            self.translations = {}
+            self.warmup_times = {}
+
+            for source_lang, target_lang in self.pairs:
+                translation = self._resolve(source_lang, target_lang)
+                if translation is None:
+                    print(f"✗ Warning: no translation path {source_lang}→{target_lang}")
+                    continue
+                if self.warm:
+                    self._warm(source_lang, target_lang, translation)
+
+            self.rebuilds += 1
+            elapsed = time.perf_counter() - started
+            print(f"✓ Translator registry built: {len(self.ready_pairs())} pair(s) in {elapsed:.2f}s")
+
+    def _resolve(self, source_lang, target_lang):
+        """Look up a pair in the cached language list (no disk access)"""
+        from_lang = self.languages.get(source_lang)
+        to_lang = self.languages.get(target_lang)
+
+        translation = None
+        if from_lang is not None and to_lang is not None:
+            translation = from_lang.get_translation(to_lang)
+
+        # Misses are cached too, so unknown pairs don't trigger a scan per call
+        self.translations[(source_lang, target_lang)] = translation
+        return translation
+
+    def _warm(self, source_lang, target_lang, translation):
+        """Run one throwaway translation so the CTranslate2 model is loaded"""
+        started = time.perf_counter()
+        try:
+            translation.translate(self.warmup_text)
+        except Exception as e:
+            print(f"✗ Warm-up failed for {source_lang}→{target_lang}: {e}")
+            return
+        self.warmup_times[(source_lang, target_lang)] = time.perf_counter() - started
+
+    def load(self, source_lang, target_lang):
+        """Resolve a pair and load its model now; returns the Translation"""
+        translation = self.get(source_lang, target_lang)
+        if translation is None:
+            raise LookupError(f"Language pair {source_lang}->{target_lang} not available")
+        # Loading the CTranslate2 model is slow: keep it off the async hub
+        run_blocking(self._warm, source_lang, target_lang, translation)
+        return translation
+
+    def unload(self, source_lang, target_lang):
+        """Drop a pair's CTranslate2 model; Argos reloads it lazily on next use"""
+        package = package_translation(self.translations.get((source_lang, target_lang)))
+        if package is not None and getattr(package, 'translator', None) is not None:
+            package.translator = None
+        self.warmup_times.pop((source_lang, target_lang), None)
+
+    def package_path(self, source_lang, target_lang):
+        """Directory of the package behind a direct pair (None for pivot translations)"""
+        pkg = getattr(package_translation(self.get(source_lang, target_lang)), 'pkg', None)
+        return str(pkg.package_path) if pkg is not None else None
+
+    def refresh(self, force=False):
+        """Rebuild the registry if the installed packages changed on disk"""
+        with self._lock:
+            self._last_check = time.monotonic()
+            if force or self._packages_signature() != self._signature:
+                print("Installed translation packages changed - rebuilding registry")
+                self.build()
+
+    def get(self, source_lang, target_lang):
+        """Return the Translation for a pair, or None if it is not installed"""
+        if self._signature is None:
+            self.build()
+        elif time.monotonic() - self._last_check >= self.check_interval:
+            self.refresh()
+
+        key = (source_lang, target_lang)
+        try:
+            return self.translations[key]
+        except KeyError:
+            with self._lock:
+                if key in self.translations:
+                    return self.translations[key]
+                return self._resolve(source_lang, target_lang)
+
+    def translate_batch(self, texts, source_lang, target_lang):
+        """Translate several texts for one pair in a single CTranslate2 call"""
+        translation = self.get(source_lang, target_lang)
+        if translation is None:
+            raise LookupError(f"Language pair {source_lang}->{target_lang} not available")
+        return self.decode_batch(translation, texts)
+
+    @staticmethod
+    def decode_batch(translation, texts):
+        """Translate texts with an already resolved Translation
+
+        Pure model work - no registry lookups or locks - so it is safe to run
+        off the async hub. Each text is treated as one sentence. If there is
+        no packaged CTranslate2 translator and tokenizer behind the Translation
+        (pivot translations, model not loaded yet) the texts are translated one
+        by one.
+        """
+        package = package_translation(translation)
+        pkg = getattr(package, 'pkg', None)
+        translator = getattr(package, 'translator', None)
+        tokenizer = getattr(pkg, 'tokenizer', None)
+        if translator is None or tokenizer is None or len(texts) == 1:
+            return [translation.translate(text) for text in texts]
+
+        target_prefix = getattr(pkg, 'target_prefix', '') or ''
+        tokenized = [tokenizer.encode(text) for text in texts]
+        results = translator.translate_batch(
+            tokenized,
+            target_prefix=[[target_prefix]] * len(tokenized) if target_prefix else None,
+            replace_unknowns=True,
+            max_batch_size=len(tokenized),
+            beam_size=4,
+            num_hypotheses=1,
+            length_penalty=0.2
+        )
+
+        translated = []
+        for result in results:
+            tokens = result.hypotheses[0]
+            if target_prefix and tokens and tokens[0] == target_prefix:
+                tokens = tokens[1:]
+            translated.append(tokenizer.decode(tokens).strip())
+        return translated
+
+    def ready_pairs(self):
+        """Language pairs that currently resolve to a Translation"""
+        return [pair for pair, translation in self.translations.items() if translation is not None]
+
+    def stats(self):
+        """Summary for health/status endpoints"""
+        return {
+            'pairs': [f"{s}-{t}" for s, t in self.ready_pairs()],
+            'rebuilds': self.rebuilds,
+            'warmup_seconds': {
+                f"{s}-{t}": round(seconds, 3) for (s, t), seconds in self.warmup_times.items()
+            }
+        }
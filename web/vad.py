@@ -0,0 +1,150 @@
+"""
+Voice activity detection - trim silence before Vosk
+
+Browser clips often start and end with seconds of silence that Kaldi would
+otherwise decode. Frames are classified with short-time energy plus
+zero-crossing rate (to keep quiet unvoiced consonants such as "s"/"f"), and a
+hangover keeps a few frames after speech so word endings aren't clipped.
+Long pauses split a clip into separate utterances.
+
+Works on 16 kHz mono 16-bit PCM, as produced by audio_ingest.
+"""
+
+import os
+
+SAMPLE_RATE = 16000
+
+
+class VadResult:
+    """Speech segments of a clip, as (start_byte, end_byte) ranges into the PCM"""
+
+    __slots__ = ('segments', 'total_seconds', 'speech_seconds')
+
+    def __init__(self, segments, total_seconds, speech_seconds):
+        self.segments = segments
+        self.total_seconds = total_seconds
+        self.speech_seconds = speech_seconds
+
+    @property
+    def trimmed_seconds(self):
+        return self.total_seconds - self.speech_seconds
+
+    @property
+    def trimmed_pct(self):
+        if not self.total_seconds:
+            return 0.0
+        return 100.0 * self.trimmed_seconds / self.total_seconds
+
+    def stats(self, decode_seconds):
+        """Per-request report; CPU saved is extrapolated from the decode cost per speech second"""
+        per_second = decode_seconds / self.speech_seconds if self.speech_seconds else 0.0
+        return {
+            'segments': len(self.segments),
+            'audio_seconds': round(self.total_seconds, 2),
+            'speech_seconds': round(self.speech_seconds, 2),
+            'trimmed_pct': round(self.trimmed_pct, 1),
+            'cpu_ms': round(decode_seconds * 1000, 1),
+            'cpu_saved_ms': round(self.trimmed_seconds * per_second * 1000, 1)
+        }
+
+
+class VoiceActivityDetector:
+    """Energy + zero-crossing-rate VAD with hangover"""
+
+    def __init__(self, frame_ms=30, hangover_ms=None, split_ms=None, min_speech_ms=120,
+                 pre_roll_ms=90, energy_margin_db=10.0, min_energy_db=-50.0, speech_energy_db=-35.0):
+        if hangover_ms is None:
+            hangover_ms = int(os.getenv('VAD_HANGOVER_MS', 300))
+        if split_ms is None:
+            split_ms = int(os.getenv('VAD_SPLIT_MS', 700))
+        self.frame_samples = SAMPLE_RATE * frame_ms // 1000
+        self.hangover_frames = max(0, hangover_ms // frame_ms)
+        self.split_frames = max(1, split_ms // frame_ms)
+        self.min_speech_frames = max(1, min_speech_ms // frame_ms)
+        self.pre_roll_frames = max(0, pre_roll_ms // frame_ms)
+        # A frame is speech when it is this many dB above the clip's noise floor
+        self.energy_margin_db = energy_margin_db
+        # ...and never when it is below this absolute level (digital silence)
+        self.min_energy_db = min_energy_db
+        # ...but always at this level: a clip with no pauses has no noise floor
+        # to measure, and its "floor" would put the threshold above the speech
+        self.speech_energy_db = speech_energy_db
+
+    @staticmethod
+    def enabled():
+        """VAD runs unless VAD_ENABLED=0 or numpy is missing"""
+        if os.getenv('VAD_ENABLED', '1').lower() in ('0', 'false', 'no'):
+            return False
+        try:
+            import numpy  # noqa: F401
+        except ImportError:
+            print("✗ numpy not installed - voice activity detection disabled")
+            return False
+        return True
+
+    def _frame_features(self, pcm):
+        """Per-frame energy (dBFS) and zero-crossing rate"""
+        import numpy as np
+
+        samples = np.frombuffer(pcm, dtype='<i2')
+        frame_count = len(samples) // self.frame_samples
+        frames = samples[:frame_count * self.frame_samples].reshape(frame_count, self.frame_samples)
+        frames = frames.astype(np.float32) / 32768.0
+
+        rms = np.sqrt(np.mean(frames * frames, axis=1) + 1e-12)
+        energy_db = 20.0 * np.log10(rms)
+        signs = np.signbit(frames)
+        zcr = np.count_nonzero(signs[:, 1:] != signs[:, :-1], axis=1) / self.frame_samples
+        return energy_db, zcr
+
+    def _speech_frames(self, energy_db, zcr):
+        """Boolean mask of frames that contain speech (before hangover)"""
+        import numpy as np
+
+        noise_floor = np.percentile(energy_db, 10)
+        threshold = min(noise_floor + self.energy_margin_db, self.speech_energy_db)
+        threshold = max(threshold, self.min_energy_db)
+        voiced = energy_db > threshold
+        # Fricatives are quiet but noisy: accept them slightly below the threshold
+        unvoiced = (energy_db > threshold - 6.0) & (zcr > 0.25) & (energy_db > self.min_energy_db)
+        return voiced | unvoiced
+
+    def detect(self, pcm):
+        """Find the speech segments in a clip"""
+        frame_bytes = self.frame_samples * 2
+        total_seconds = len(pcm) / 2 / SAMPLE_RATE
+        if len(pcm) < frame_bytes:
+            return VadResult([(0, len(pcm))] if len(pcm) else [], total_seconds, total_seconds)
+
+        energy_db, zcr = self._frame_features(pcm)
+        speech = self._speech_frames(energy_db, zcr)
+
+        segments = []
+        start = None
+        silence = 0
+        for index, is_speech in enumerate(speech):
+            if is_speech:
+                if start is None:
+                    start = index
+                silence = 0
+            elif start is not None:
+                silence += 1
+                if silence >= max(self.hangover_frames, self.split_frames):
+                    segments.append((start, index - silence + 1 + self.hangover_frames))
+                    start = None
+                    silence = 0
+        if start is not None:
+            segments.append((start, min(len(speech), len(speech) - silence + self.hangover_frames)))
+
+        frame_count = len(speech)
+        byte_ranges = []
+        for first, last in segments:
+            if last - first - self.hangover_frames < self.min_speech_frames:
+                continue  # a click or a cough, not an utterance
+            first = max(0, first - self.pre_roll_frames)
+            last = min(frame_count, last)
+            end_byte = last * frame_bytes if last < frame_count else len(pcm)
+            byte_ranges.append((first * frame_bytes, end_byte))
+
+        speech_seconds = sum(end - start for start, end in byte_ranges) / 2 / SAMPLE_RATE
+        return VadResult(byte_ranges, total_seconds, speech_seconds)
@@ -0,0 +1,176 @@
+"""
+Inference worker pool - runs Vosk recognition and Argos translation in
+separate processes
+
+Each worker process loads the models once (in the pool initializer) and then
+takes recognition/translation jobs. The Socket.IO process only does I/O, so
+one long utterance no longer stalls every other client behind the GIL.
+
+Jobs are admitted through a bounded queue: when it is full, submit() raises
+PoolBusy immediately instead of letting work pile up.
+"""
+
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+
+class PoolBusy(Exception):
+    """Raised when the inference queue is full"""
+
+    def __init__(self, message="Inference queue is full", retry_after=1.0):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+# --- Worker process side -----------------------------------------------------
+
+_translator = None
+_recognizer = None
+
+
+def _init_worker():
+    """Load the models once per worker process"""
+    global _translator, _recognizer
+    from offline_engine import OfflineSpeechRecognizer, OfflineTranslator, preload_models
+
+    print(f"[worker {os.getpid()}] Loading models...")
+    _translator = OfflineTranslator()
+    _recognizer = OfflineSpeechRecognizer()
+    preload_models()
+
+
+def _job_status(hold=0.0):
+    # Holding the worker briefly makes concurrent status jobs land on different workers
+    time.sleep(hold)
+    return {
+        'pid': os.getpid(),
+        'translation': _translator.setup_complete,
+        'speech_languages': sorted(_recognizer.languages)
+    }
+
+
+def _job_translate_batch(texts, source_lang, target_lang):
+    # Goes through the worker's model manager (lazy load + memory budget)
+    return _translator._translate_batch(texts, source_lang, target_lang)
+
+
+def _job_recognize(audio_data, language):
+    return _recognizer.recognize(audio_data, language)
+
+
+_JOBS = {
+    'status': _job_status,
+    'translate_batch': _job_translate_batch,
+    'recognize': _job_recognize
+}
+
+
+# --- Server process side -----------------------------------------------------
+
+class InferencePool:
+    """Bounded pool of model-holding worker processes"""
+
+    def __init__(self, num_workers=None, max_queue=None, timeout=None):
+        if num_workers is None:
+            num_workers = int(os.getenv('INFERENCE_WORKERS', 0)) or os.cpu_count() or 1
+        if max_queue is None:
+            max_queue = int(os.getenv('INFERENCE_QUEUE_SIZE', 0)) or num_workers * 4
+        if timeout is None:
+            timeout = float(os.getenv('INFERENCE_TIMEOUT', 60))
+        self.num_workers = num_workers
+        self.max_queue = max_queue
+        self.timeout = timeout
+
+        self._slots = threading.BoundedSemaphore(max_queue)
+        self._lock = threading.Lock()
+        self._executor = None
+
+        self.pending = 0
+        self.submitted = 0
+        self.completed = 0
+        self.rejected = 0
+        self.restarts = 0
+
+    @staticmethod
+    def supported():
+        # Workers are forked before the server starts any threads; spawn would
+        # re-import app_offline (and its module-level model loading) as __main__
+        return 'fork' in multiprocessing.get_all_start_methods()
+
+    def _create_executor(self):
+        return ProcessPoolExecutor(
+            max_workers=self.num_workers,
+            mp_context=multiprocessing.get_context('fork'),
+            initializer=_init_worker
+        )
+
+    def start(self):
+        """Start the workers, wait for them to load their models and return their status"""
+        started = time.perf_counter()
+        self._executor = self._create_executor()
+        futures = [self._executor.submit(_job_status, 0.2) for _ in range(self.num_workers)]
+        statuses = [future.result() for future in futures]
+        elapsed = time.perf_counter() - started
+        print(f"✓ Inference pool ready: {self.num_workers} worker(s), "
+              f"queue size {self.max_queue}, {elapsed:.1f}s")
+        return statuses
+
+    def submit(self, job, *args):
+        """Queue a job; raises PoolBusy if the queue is full"""
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self.rejected += 1
+            raise PoolBusy(retry_after=max(0.5, self.timeout / 60))
+
+        with self._lock:
+            self.pending += 1
+            self.submitted += 1
+        try:
+            try:
+                future = self._executor.submit(_JOBS[job], *args)
+            except BrokenProcessPool:
+                # A worker died (e.g. crashed inside a native library): replace the pool
+                self._restart()
+                future = self._executor.submit(_JOBS[job], *args)
+        except Exception:
+            self._release()
+            raise
+        future.add_done_callback(lambda _: self._release())
+        return future
+
+    def run(self, job, *args):
+        """Submit a job and wait for its result"""
+        return self.submit(job, *args).result(self.timeout)
+
+    def _release(self):
+        with self._lock:
+            self.pending -= 1
+            self.completed += 1
+        self._slots.release()
+
+    def _restart(self):
+        with self._lock:
+            print("✗ Inference worker died - restarting pool")
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = self._create_executor()
+            self.restarts += 1
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self):
+        with self._lock:
+            return {
+                'workers': self.num_workers,
+                'max_queue': self.max_queue,
+                'pending': self.pending,
+                'submitted': self.submitted,
+                'completed': self.completed,
+                'rejected': self.rejected,
+                'restarts': self.restarts
+            }